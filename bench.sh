@@ -0,0 +1 @@
+python3 src/bench_suite.py "$@"
\ No newline at end of file
@@ -0,0 +1,110 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# default number of threads doing file I/O
+DEFAULT_IO_THREADS = 8
+
+# default number of files read or written by a single thread pool call, so the cost of handing work to a thread is shared
+DEFAULT_BATCH_SIZE = 16
+
+# default maximum number of batches being read, converted or written at a time, which bounds the memory held by the pipeline
+DEFAULT_CONCURRENCY = 8
+
+# function to read a batch of text files, returning the text of each file or the OSError or ValueError raised while reading it
+def read_batch(paths):
+    texts = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as file:
+                texts.append(file.read())
+        except (OSError, ValueError) as error:
+            texts.append(error)
+    return texts
+
+# function to write a text file, returning the conversion info unchanged
+def write_text(path, text, info):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+    return info
+
+# function to write a batch of (path, output, conversion info) triples with a write function, returning for each file
+# the info returned by the write function or the OSError raised while writing it
+def write_batch(files, write):
+    results = []
+    for path, output, info in files:
+        try:
+            results.append(write(path, output, info))
+        except OSError as error:
+            results.append(error)
+    return results
+
+# function to create a batch of directories, each once, ignoring failures so they are reported by the writes into them
+def make_directories(directories):
+    for directory in directories:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            pass
+
+# function to format an exception as an error message
+def error_message(error):
+    return f"{type(error).__name__}: {error}"
+
+# function to run the conversion jobs on an event loop, reading and writing batches in a thread pool while the loop converts
+async def _convert_files(jobs, convert, write, batch_size, concurrency, threads):
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # create every output directory once, in the background while the first sources are read
+        directories = sorted({os.path.dirname(destination) for key, source, destination in jobs})
+        directories_made = loop.run_in_executor(executor, make_directories, directories)
+
+        # function to read, convert and write a batch of files, returning a (key, error message or None, conversion info)
+        # tuple for each file
+        async def run_batch(batch):
+            async with semaphore:
+                texts = await loop.run_in_executor(executor, read_batch, [source for key, source, destination in batch])
+
+                # convert the files that were read, keeping the outcome of each file in batch order
+                results = []
+                outputs = []
+                for (key, source, destination), text in zip(batch, texts):
+                    if isinstance(text, Exception):
+                        results.append((key, error_message(text), None))
+                        continue
+                    try:
+                        output, info = convert(key, text)
+                    except ValueError as error:
+                        results.append((key, error_message(error), None))
+                        continue
+                    results.append((key, None, info))
+                    outputs.append((len(results) - 1, destination, output, info))
+
+                # write the converted files, keeping the info returned by the write function or the error of each file
+                await directories_made
+                written = await loop.run_in_executor(
+                    executor, write_batch, [(destination, output, info) for index, destination, output, info in outputs], write
+                )
+                for (index, destination, output, info), outcome in zip(outputs, written):
+                    if isinstance(outcome, OSError):
+                        results[index] = (results[index][0], error_message(outcome), None)
+                    else:
+                        results[index] = (results[index][0], None, outcome)
+                return results
+
+        batches = [jobs[start:start + batch_size] for start in range(0, len(jobs), batch_size)]
+        return [result for results in await asyncio.gather(*(run_batch(batch) for batch in batches)) for result in results]
+
+# function to convert text files in bulk, given (key, source path, destination path) jobs, a convert(key, text) function
+# returning (output, info) and a write(destination path, output, info) function returning the final info, returning a list
+# of (key, error message or None, final info) in job order
+# (batches of files are read and written in a thread pool, which releases the GIL during the system calls, so the I/O of some
+# batches overlaps with the conversion of others on the event loop; this starts its own event loop, so it cannot be called
+# from a coroutine)
+def convert_files(jobs, convert, write=write_text, batch_size=DEFAULT_BATCH_SIZE, concurrency=DEFAULT_CONCURRENCY,
+                  threads=DEFAULT_IO_THREADS):
+    if not jobs:
+        return []
+    return asyncio.run(_convert_files(jobs, convert, write, batch_size, concurrency, threads))
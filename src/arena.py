@@ -0,0 +1,370 @@
+from array import array
+from textnode import TextNode, TextType, text_node_to_html_node
+from htmlnode import LeafNode, ParentNode, walk, escape_text, escape_attribute
+from inline import inline_spans
+from blocks import BlockType, HEADING_TAGS, parse_blocks
+
+# text types by their one-byte code in the arena, and the code of each text type
+TEXT_TYPES = list(TextType)
+TEXT_TYPE_CODES = {text_type: code for code, text_type in enumerate(TEXT_TYPES)}
+
+# kind code of element nodes, which have a tag and a range of children instead of text
+ELEMENT = 255
+
+# opening and closing tags of the text types that render as a simple wrapper around their text
+TEXT_WRAPPERS = {
+    TEXT_TYPE_CODES[TextType.PLAIN_TEXT]: ("", ""),
+    TEXT_TYPE_CODES[TextType.BOLD_TEXT]: ("<b>", "</b>"),
+    TEXT_TYPE_CODES[TextType.ITALIC_TEXT]: ("<i>", "</i>"),
+    TEXT_TYPE_CODES[TextType.CODE_TEXT]: ("<code>", "</code>"),
+}
+LINK_CODE = TEXT_TYPE_CODES[TextType.LINK]
+IMAGE_CODE = TEXT_TYPE_CODES[TextType.IMAGE]
+
+# tags of the leaf nodes that text_node_to_html_node creates for each text type
+LEAF_TAG_TYPES = {
+    None: TextType.PLAIN_TEXT,
+    "b": TextType.BOLD_TEXT,
+    "i": TextType.ITALIC_TEXT,
+    "code": TextType.CODE_TEXT,
+}
+
+# class representing a document as parallel arrays indexed by node, with all text stored as slices of one source string
+class DocumentArena:
+    __slots__ = (
+        "source", "kinds", "starts", "ends", "url_starts", "url_ends",
+        "tags", "child_starts", "child_ends", "children", "tag_names", "tag_codes", "root"
+    )
+
+    # constructor to initialize an empty DocumentArena object over a source string
+    def __init__(self, source=""):
+        self.source = source
+
+        # per node: kind code, text slice, url slice (-1 when there is no url), tag code and range in the children array
+        self.kinds = array("B")
+        self.starts = array("i")
+        self.ends = array("i")
+        self.url_starts = array("i")
+        self.url_ends = array("i")
+        self.tags = array("H")
+        self.child_starts = array("i")
+        self.child_ends = array("i")
+
+        # node indexes of the children of every element, stored contiguously per element
+        self.children = array("i")
+
+        # table of tag names by tag code, and the code of each tag name
+        self.tag_names = []
+        self.tag_codes = {}
+
+        # index of the root node, if any
+        self.root = None
+
+    # method to return the number of nodes in the DocumentArena object
+    def __len__(self):
+        return len(self.kinds)
+
+    # method to add a text node covering a slice of the source, returning its index
+    def add_text(self, text_type, start, end, url_start=-1, url_end=-1):
+        self.kinds.append(TEXT_TYPE_CODES[text_type])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.url_starts.append(url_start)
+        self.url_ends.append(url_end)
+        self.tags.append(0)
+        self.child_starts.append(0)
+        self.child_ends.append(0)
+        return len(self.kinds) - 1
+
+    # method to add an element node with a tag and a list of child node indexes, returning its index
+    def add_element(self, tag, child_indexes):
+        # look up the code of the tag, adding it to the tag table if it is new
+        tag_code = self.tag_codes.get(tag)
+        if tag_code is None:
+            tag_code = len(self.tag_names)
+            self.tag_names.append(tag)
+            self.tag_codes[tag] = tag_code
+
+        # store the children contiguously and record their range
+        child_start = len(self.children)
+        self.children.extend(child_indexes)
+
+        self.kinds.append(ELEMENT)
+        self.starts.append(0)
+        self.ends.append(0)
+        self.url_starts.append(-1)
+        self.url_ends.append(-1)
+        self.tags.append(tag_code)
+        self.child_starts.append(child_start)
+        self.child_ends.append(len(self.children))
+        return len(self.kinds) - 1
+
+    # method to return the text type of a text node, or None for an element node
+    def text_type(self, index):
+        kind = self.kinds[index]
+        if kind == ELEMENT:
+            return None
+        return TEXT_TYPES[kind]
+
+    # method to return the text of a text node, sliced from the source
+    def text(self, index):
+        return self.source[self.starts[index]:self.ends[index]]
+
+    # method to return the url of a text node, or None if it has no url
+    def url(self, index):
+        if self.url_starts[index] < 0:
+            return None
+        return self.source[self.url_starts[index]:self.url_ends[index]]
+
+    # method to return the tag of an element node
+    def tag(self, index):
+        return self.tag_names[self.tags[index]]
+
+    # method to return the child node indexes of an element node
+    def child_indexes(self, index):
+        return self.children[self.child_starts[index]:self.child_ends[index]]
+
+    # method to convert a text node into a TextNode object
+    def to_text_node(self, index):
+        if self.kinds[index] == ELEMENT:
+            raise ValueError(f"node {index} is an element, not text")
+        return TextNode(self.text(index), self.text_type(index), self.url(index))
+
+    # method to convert the text children of an element node (the root by default) into a list of TextNode objects
+    def to_text_nodes(self, index=None):
+        if index is None:
+            index = self.root
+        return [self.to_text_node(child) for child in self.child_indexes(index) if self.kinds[child] != ELEMENT]
+
+    # method to convert a node (the root by default) and its descendants into HTMLNode objects, without recursion
+    def to_html_node(self, index=None):
+        if index is None:
+            index = self.root
+
+        # a text node converts directly into a LeafNode
+        if self.kinds[index] != ELEMENT:
+            return text_node_to_html_node(self.to_text_node(index))
+
+        # initialize a stack of (element index, position of its next child, converted children) entries
+        stack = [(index, self.child_starts[index], [])]
+
+        # while there are elements on the stack
+        while True:
+            element, position, converted = stack[-1]
+
+            # if the element has no children left, pop it and attach it to its parent, or return it if it is the root
+            if position == self.child_ends[element]:
+                stack.pop()
+                node = ParentNode(self.tag(element), converted)
+                if not stack:
+                    return node
+                stack[-1][2].append(node)
+                continue
+
+            # advance past the next child
+            stack[-1] = (element, position + 1, converted)
+            child = self.children[position]
+
+            # convert text children directly, and push element children onto the stack
+            if self.kinds[child] == ELEMENT:
+                stack.append((child, self.child_starts[child], []))
+            else:
+                converted.append(text_node_to_html_node(self.to_text_node(child)))
+
+    # method to render a text node into html, escaping its text and url
+    def text_html(self, index):
+        kind = self.kinds[index]
+        if kind == LINK_CODE:
+            return f'<a href="{escape_attribute(self.url(index))}">{escape_text(self.text(index))}</a>'
+        if kind == IMAGE_CODE:
+            return f'<img src="{escape_attribute(self.url(index))}" alt="{escape_attribute(self.text(index))}"></img>'
+        opening, closing = TEXT_WRAPPERS[kind]
+        return opening + escape_text(self.text(index)) + closing
+
+    # method to generate the html of a node (the root by default) as a sequence of string chunks, working directly on the arrays
+    def iter_html(self, index=None):
+        if index is None:
+            index = self.root
+
+        # a text node renders as a single chunk
+        if self.kinds[index] != ELEMENT:
+            yield self.text_html(index)
+            return
+
+        # bind the arrays to local names for the inner loop
+        source = self.source
+        kinds = self.kinds
+        starts = self.starts
+        ends = self.ends
+        url_starts = self.url_starts
+        url_ends = self.url_ends
+        tags = self.tags
+        children = self.children
+        child_starts = self.child_starts
+        child_ends = self.child_ends
+
+        # precompute the opening and closing tag of every tag code
+        open_tags = [f"<{tag}>" for tag in self.tag_names]
+        close_tags = [f"</{tag}>" for tag in self.tag_names]
+
+        # yield the opening tag of the element and start with its range of children
+        yield open_tags[tags[index]]
+        element, position, end = index, child_starts[index], child_ends[index]
+
+        # initialize a stack of (element index, position of its next child, end of its children) entries for the open ancestors
+        stack = []
+
+        while True:
+            # for each remaining child of the current element
+            while position < end:
+                child = children[position]
+                position += 1
+                kind = kinds[child]
+
+                # for elements, yield the opening tag and continue with their children first
+                if kind == ELEMENT:
+                    yield open_tags[tags[child]]
+                    stack.append((element, position, end))
+                    element, position, end = child, child_starts[child], child_ends[child]
+                # for links and images, yield the tag with its escaped url and text
+                elif kind == LINK_CODE:
+                    yield f'<a href="{escape_attribute(source[url_starts[child]:url_ends[child]])}">{escape_text(source[starts[child]:ends[child]])}</a>'
+                elif kind == IMAGE_CODE:
+                    yield (f'<img src="{escape_attribute(source[url_starts[child]:url_ends[child]])}" '
+                           f'alt="{escape_attribute(source[starts[child]:ends[child]])}"></img>')
+                # for other text, yield the escaped text inside its wrapper tags
+                else:
+                    opening, closing = TEXT_WRAPPERS[kind]
+                    yield opening + escape_text(source[starts[child]:ends[child]]) + closing
+
+            # yield the closing tag of the finished element
+            yield close_tags[tags[element]]
+
+            # if there are no open ancestors left, the node is fully rendered
+            if not stack:
+                return
+            element, position, end = stack.pop()
+
+    # method to convert a node (the root by default) into html
+    def to_html(self, index=None):
+        return "".join(self.iter_html(index))
+
+    # method to write the html of a node (the root by default) chunk by chunk to a file-like sink
+    def write_html(self, sink, index=None):
+        for chunk in self.iter_html(index):
+            sink.write(chunk)
+
+# function to add a text node to an arena for each inline span of a source range, returning their indexes
+def add_inline(arena, start, end):
+    return [arena.add_text(*span) for span in inline_spans(arena.source[start:end], start)]
+
+# function to parse a markdown document directly into a DocumentArena, with a div root and an element for each block
+# (renders the same html as page.markdown_to_html_node, but stores all text as slices of the markdown string)
+def arena_from_markdown(markdown):
+    arena = DocumentArena(markdown)
+    elements = []
+
+    # for each block, add the elements and text nodes it converts into, using offsets into the markdown
+    for block in parse_blocks(markdown):
+        block_type = block.block_type
+        if block_type is BlockType.PARAGRAPH:
+            elements.append(arena.add_element("p", add_inline(arena, block.start, block.end)))
+        elif block_type is BlockType.HEADING:
+            elements.append(arena.add_element(HEADING_TAGS[block.level], add_inline(arena, *block.parts[0])))
+        elif block_type is BlockType.CODE:
+            code = arena.add_element("code", [arena.add_text(TextType.PLAIN_TEXT, *block.parts[0])])
+            elements.append(arena.add_element("pre", [code]))
+        elif block_type is BlockType.QUOTE:
+            # separate the lines with the newline that ends each of them in the markdown
+            children = []
+            for index, (start, end) in enumerate(block.parts):
+                if index:
+                    newline = markdown.rindex("\n", 0, start)
+                    children.append(arena.add_text(TextType.PLAIN_TEXT, newline, newline + 1))
+                children.extend(add_inline(arena, start, end))
+            elements.append(arena.add_element("blockquote", children))
+        else:
+            items = [arena.add_element("li", add_inline(arena, start, end)) for start, end in block.parts]
+            elements.append(arena.add_element("ul" if block_type is BlockType.UNORDERED_LIST else "ol", items))
+
+    # add the root div element
+    arena.root = arena.add_element("div", elements)
+    return arena
+
+# function to store a list of TextNode objects in a DocumentArena, under a root element with the given tag
+def arena_from_text_nodes(text_nodes, tag="p"):
+    arena = DocumentArena()
+    pieces = []
+    length = 0
+    indexes = []
+
+    # append the text and url of each node to the source, recording their offsets
+    for node in text_nodes:
+        start = length
+        pieces.append(node.text)
+        length += len(node.text)
+
+        if node.url is None:
+            indexes.append(arena.add_text(node.text_type, start, length))
+            continue
+
+        pieces.append(node.url)
+        indexes.append(arena.add_text(node.text_type, start, length, length, length + len(node.url)))
+        length += len(node.url)
+
+    # store the joined source and add the root element
+    arena.source = "".join(pieces)
+    arena.root = arena.add_element(tag, indexes)
+    return arena
+
+# function to store a tree of ParentNode and LeafNode objects, as created by text_node_to_html_node, in a DocumentArena
+def arena_from_html_node(root):
+    arena = DocumentArena()
+    pieces = []
+    length = 0
+
+    # stack of child index lists for the elements currently being walked, with a virtual list for the root
+    stack = [[]]
+
+    # walk the tree in document order without recursion
+    for node, entering in walk(root):
+        if isinstance(node, ParentNode):
+            # elements in the arena have no properties
+            if node.props:
+                raise ValueError(f"cannot store properties of element in arena: {node}")
+
+            # collect the children of the element, then add it once all of them are added
+            if entering:
+                stack.append([])
+            else:
+                child_indexes = stack.pop()
+                stack[-1].append(arena.add_element(node.tag, child_indexes))
+            continue
+
+        # find the text, text type and url of the leaf node
+        if not isinstance(node, LeafNode):
+            raise ValueError(f"cannot store node in arena: {node}")
+        if node.tag in LEAF_TAG_TYPES and not node.props:
+            text_type, text, url = LEAF_TAG_TYPES[node.tag], node.value, None
+        elif node.tag == "a" and node.props and list(node.props) == ["href"]:
+            text_type, text, url = TextType.LINK, node.value, node.props["href"]
+        elif node.tag == "img" and node.props and list(node.props) == ["src", "alt"] and node.value == "":
+            text_type, text, url = TextType.IMAGE, node.props["alt"], node.props["src"]
+        else:
+            raise ValueError(f"cannot store node in arena: {node}")
+
+        # append the text and url to the source and add the text node
+        start = length
+        pieces.append(text)
+        length += len(text)
+        if url is None:
+            stack[-1].append(arena.add_text(text_type, start, length))
+        else:
+            pieces.append(url)
+            stack[-1].append(arena.add_text(text_type, start, length, length, length + len(url)))
+            length += len(url)
+
+    # store the joined source and the root node
+    arena.source = "".join(pieces)
+    arena.root = stack[0][0]
+    return arena
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from aio import make_directories, error_message, DEFAULT_IO_THREADS
+
+# ways of putting an asset into the output directory: copy its bytes, let the kernel copy them with copy_file_range,
+# or hardlink it (each falls back to a plain copy where it is not supported)
+ASSET_MODES = ("copy", "range", "hardlink")
+
+# number of bytes hashed or copied at a time
+ASSET_CHUNK_SIZE = 1 << 20
+
+# outcomes of syncing a single asset
+COPIED = "copied"
+LINKED = "linked"
+UNCHANGED = "unchanged"
+
+# class representing the outcome of an asset sync
+class AssetReport:
+    # constructor to initialize an AssetReport object with the number of assets copied, hardlinked and unchanged,
+    # the (asset, error message) pairs and the sync time
+    def __init__(self, copied, linked, unchanged, errors, seconds):
+        self.copied = copied
+        self.linked = linked
+        self.unchanged = unchanged
+        self.errors = errors
+        self.seconds = seconds
+
+    # method to return whether every asset was synced successfully
+    def ok(self):
+        return not self.errors
+
+    # method to format the AssetReport object as a text summary with one line per error
+    def format(self):
+        total = self.copied + self.linked + self.unchanged + len(self.errors)
+        lines = [f"synced {total} assets in {self.seconds:.2f}s: {self.copied} copied, {self.linked} linked, {self.unchanged} unchanged"]
+        for path, message in self.errors:
+            lines.append(f"error: {path}: {message}")
+        return "\n".join(lines)
+
+    # method to return a string representation of the AssetReport object
+    def __repr__(self):
+        return (f"AssetReport(copied: {self.copied}, linked: {self.linked}, unchanged: {self.unchanged}, "
+                f"errors: {self.errors}, {self.seconds})")
+
+# function to find every file under a static directory, returning their relative paths in sorted order
+def find_assets(static_dir):
+    assets = []
+    for directory, subdirectories, files in os.walk(static_dir):
+        for name in files:
+            assets.append(os.path.relpath(os.path.join(directory, name), static_dir))
+    return sorted(assets)
+
+# function to hash the contents of a file in chunks
+def hash_asset(path):
+    digest = hashlib.blake2b()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(ASSET_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+# function to copy the bytes of a file into another with copy_file_range, so the kernel copies them (or shares the extents,
+# on file systems that support it) without passing them through user space
+def copy_range(source, destination):
+    with open(source, "rb") as reader, open(destination, "wb") as writer:
+        remaining = os.fstat(reader.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(reader.fileno(), writer.fileno(), min(remaining, 1 << 30))
+            if copied == 0:
+                break
+            remaining -= copied
+
+# function to return whether a destination already holds the same asset as the source: the same file, or the same size and
+# modification time, or (when only the modification time differs) the same contents, in which case its modification time
+# is brought in line so the next sync can skip it without hashing
+def is_unchanged(source, destination, source_stat):
+    try:
+        destination_stat = os.stat(destination)
+    except OSError:
+        return False
+
+    if os.path.samestat(source_stat, destination_stat):
+        return True
+    if destination_stat.st_size != source_stat.st_size:
+        return False
+    if destination_stat.st_mtime_ns == source_stat.st_mtime_ns:
+        return True
+
+    # fall back to comparing the contents
+    if hash_asset(source) != hash_asset(destination):
+        return False
+    os.utime(destination, ns=(destination_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return True
+
+# function to put a source asset at a destination path with the given mode, returning COPIED or LINKED
+# (the asset is first written to a unique temporary file next to it and then moved into place, so readers never see a partial
+# file and no other asset is overwritten by the temporary file)
+def place_asset(source, destination, mode):
+    descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(destination))
+    os.close(descriptor)
+    try:
+        if mode == "hardlink":
+            try:
+                # a hardlink needs a free name, so replace the reserved temporary file with the link
+                os.remove(temporary)
+                os.link(source, temporary)
+                os.replace(temporary, destination)
+                return LINKED
+            except OSError:
+                # hardlinks do not work across file systems or on some platforms, so copy instead
+                pass
+
+        if mode == "range" and hasattr(os, "copy_file_range"):
+            try:
+                copy_range(source, temporary)
+            except OSError:
+                shutil.copyfile(source, temporary)
+        else:
+            shutil.copyfile(source, temporary)
+
+        # give the copy the source's modification time, so the next sync can skip it by size and modification time
+        shutil.copystat(source, temporary)
+        os.replace(temporary, destination)
+        return COPIED
+    except BaseException:
+        if os.path.lexists(temporary):
+            os.remove(temporary)
+        raise
+
+# function to sync a single asset from the static directory into the output directory, returning its outcome
+def sync_asset(static_dir, output_dir, asset_path, mode):
+    source = os.path.join(static_dir, asset_path)
+    destination = os.path.join(output_dir, asset_path)
+    if is_unchanged(source, destination, os.stat(source)):
+        return UNCHANGED
+    return place_asset(source, destination, mode)
+
+# function to sync every file under a static directory into an output directory with a pool of threads,
+# copying or hardlinking only the assets that changed, and returning an AssetReport
+# (files in the output directory that are not assets are left alone, so the assets can share it with the pages)
+def sync_assets(static_dir, output_dir, mode="copy", threads=DEFAULT_IO_THREADS):
+    if mode not in ASSET_MODES:
+        raise ValueError(f"invalid asset mode: {mode}")
+    start = time.perf_counter()
+    assets = find_assets(static_dir)
+
+    # create every output directory once
+    make_directories(sorted({os.path.dirname(os.path.join(output_dir, asset_path)) for asset_path in assets}))
+
+    # function to sync an asset, returning its outcome or an error message
+    def sync(asset_path):
+        try:
+            return sync_asset(static_dir, output_dir, asset_path, mode), None
+        except OSError as error:
+            return None, error_message(error)
+
+    # sync the assets in a pool of threads, since copying, linking and hashing spend most of their time in system calls
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+        outcomes = list(executor.map(sync, assets))
+
+    counts = {COPIED: 0, LINKED: 0, UNCHANGED: 0}
+    errors = []
+    for asset_path, (outcome, message) in zip(assets, outcomes):
+        if message is not None:
+            errors.append((asset_path, message))
+        else:
+            counts[outcome] += 1
+    return AssetReport(counts[COPIED], counts[LINKED], counts[UNCHANGED], errors, time.perf_counter() - start)
@@ -0,0 +1,41 @@
+import time
+import tracemalloc
+from page import markdown_to_html_node
+from arena import arena_from_markdown
+
+# function to generate a large synthetic markdown document
+def generate_markdown(paragraphs):
+    paragraph = "This is **bold** and _italic_ text with `code`, an ![image](https://i.imgur.com/zjjcJKZ.png) and a [link](https://www.boot.dev)."
+    return "\n\n".join(paragraph for _ in range(paragraphs))
+
+# function to measure the time and memory to build a document representation, returning (seconds, bytes, result)
+# (timed in a separate run, since tracemalloc slows down allocation heavily)
+def measure_build(build_function, markdown):
+    start = time.perf_counter()
+    build_function(markdown)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = build_function(markdown)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, allocated, result
+
+# function to time rendering a document representation to html
+def measure_render(document):
+    start = time.perf_counter()
+    document.to_html()
+    return time.perf_counter() - start
+
+# function to compare the node tree and the arena on a large document
+def main():
+    markdown = generate_markdown(50000)
+    print(f"document: {len(markdown) / 1e6:.1f} MB")
+
+    for name, build_function in [("node tree", markdown_to_html_node), ("arena", arena_from_markdown)]:
+        elapsed, allocated, document = measure_build(build_function, markdown)
+        render = measure_render(document)
+        print(f"{name:>9}: build {elapsed * 1000:7.1f} ms, {allocated / 1e6:6.1f} MB retained, render {render * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import time
+from assets import sync_assets
+
+# function to write a synthetic static directory of binary assets spread over a few subdirectories
+def write_assets(static_dir, count, size):
+    for number in range(count):
+        directory = os.path.join(static_dir, f"images{number % 10}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"image{number}.bin"), "wb") as file:
+            file.write(os.urandom(size))
+
+# function to time a function call, returning (its result, the elapsed time)
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+# function to compare deleting and recopying a static directory with syncing only the changed assets
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        static_dir = os.path.join(directory, "static")
+        write_assets(static_dir, 1000, 256 * 1024)
+        print("1000 assets of 256 KB (250 MB)")
+
+        # naive: delete the output and copy the whole directory again
+        naive = os.path.join(directory, "naive")
+        shutil.copytree(static_dir, naive)
+        _, seconds = timed(lambda: (shutil.rmtree(naive), shutil.copytree(static_dir, naive)))
+        print(f"  delete and recopy:        {seconds:6.2f}s")
+
+        # sync: a first copy, a no-op sync, and a sync after touching one asset and editing another
+        for mode in ("copy", "range", "hardlink"):
+            output = os.path.join(directory, mode)
+            report, seconds = timed(sync_assets, static_dir, output, mode)
+            print(f"  {mode:8} first sync:      {seconds:6.2f}s ({report.copied} copied, {report.linked} linked)")
+            report, seconds = timed(sync_assets, static_dir, output, mode)
+            print(f"  {mode:8} no-op sync:      {seconds:6.2f}s ({report.unchanged} unchanged)")
+
+        os.utime(os.path.join(static_dir, "images0", "image0.bin"))
+        with open(os.path.join(static_dir, "images1", "image1.bin"), "r+b") as file:
+            file.write(b"edited")
+        report, seconds = timed(sync_assets, static_dir, os.path.join(directory, "copy"))
+        print(f"  copy     after 2 changes: {seconds:6.2f}s ({report.copied} copied, {report.unchanged} unchanged)")
+
+if __name__ == "__main__":
+    main()
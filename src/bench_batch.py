@@ -0,0 +1,48 @@
+import random
+from bench_suite import run_best
+from textnode import text_to_textnodes, text_node_to_html_node
+from inline import parse_inline, render_many, texts_to_html_many
+
+# pieces of inline markdown that the synthetic snippets are made of
+PIECES = ["some plain words ", "**bold text** ", "_italic text_ ", "`code` ", "[a link](/pages/about) ", "![an image](/static/logo.png) "]
+
+# function to build small markdown snippets, like the fields a content export converts one by one
+def build_snippets(count, seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(PIECES) for _ in range(rng.randint(1, 6))) for _ in range(count)]
+
+# function to convert snippets in a plain loop with the reference functions, as a baseline
+def loop_reference(snippets):
+    return ["".join(text_node_to_html_node(node).to_html() for node in text_to_textnodes(text)) for text in snippets]
+
+# function to convert snippets in a plain loop with the fused inline parser, as a baseline
+def loop_fused(snippets):
+    return ["".join(text_node_to_html_node(node).to_html() for node in parse_inline(text)) for text in snippets]
+
+# function to render nodes in a plain loop, as a baseline
+def loop_nodes(nodes):
+    return [text_node_to_html_node(node).to_html() for node in nodes]
+
+# function to time a conversion function over its input, returning the best of several runs
+def time_batch(convert, items, repeats=3):
+    return run_best(lambda: convert(items), repeats)[0]
+
+# function to compare converting many snippets and nodes in a plain loop and with the batch functions
+def main():
+    snippets = build_snippets(50000)
+    nodes = [node for text in snippets[:20000] for node in parse_inline(text)]
+    assert texts_to_html_many(snippets) == loop_reference(snippets)
+    assert render_many(nodes) == loop_nodes(nodes)
+
+    for name, convert, items in (
+        ("text_to_textnodes loop", loop_reference, snippets),
+        ("parse_inline loop", loop_fused, snippets),
+        ("texts_to_html_many", texts_to_html_many, snippets),
+        ("node loop", loop_nodes, nodes),
+        ("render_many", render_many, nodes),
+    ):
+        elapsed = time_batch(convert, items)
+        print(f"{name:24} {elapsed * 1000:8.1f} ms for {len(items)} items ({elapsed / len(items) * 1e6:.2f} us each)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+from bench_suite import generate_corpus, run_best
+from textnode import markdown_to_blocks
+from page import markdown_to_html, BlockCache
+
+# function to time converting a document, returning the best of several runs
+def time_convert(markdown, block_cache, repeats=3):
+    return run_best(lambda: markdown_to_html(markdown, block_cache), repeats)[0]
+
+# function to compare re-rendering a large page after editing one block, with and without the block cache
+def main():
+    markdown = generate_corpus(5000 * 400, 0.2, paragraph_words=60)
+    blocks = markdown_to_blocks(markdown)
+    print(f"page of {len(blocks)} blocks, {len(markdown) / 1e6:.1f} MB")
+
+    # warm the cache with the original page, then edit one block in the middle
+    cache = BlockCache()
+    markdown_to_html(markdown, cache)
+    blocks[len(blocks) // 2] += " with an edit"
+    edited = "\n\n".join(blocks)
+
+    uncached = time_convert(edited, None)
+    cache.hits = cache.misses = 0
+    cached = time_convert(edited, cache)
+    print(f"  without block cache: {uncached * 1000:8.1f} ms")
+    print(f"  with block cache:    {cached * 1000:8.1f} ms (hit rate {cache.hit_rate() * 100:.2f}%)")
+
+if __name__ == "__main__":
+    main()
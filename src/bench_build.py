@@ -0,0 +1,29 @@
+import os
+import tempfile
+from bench_suite import generate_corpus
+from build import build_site
+
+# function to write a synthetic content tree of markdown pages into a directory
+def write_content(content_dir, pages, page_size):
+    for number in range(pages):
+        directory = os.path.join(content_dir, f"section{number % 20}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"page{number}.md"), "w", encoding="utf-8") as file:
+            file.write(generate_corpus(page_size, 0.2, seed=number))
+
+# function to report the build time and speedup of a synthetic site at several worker counts
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        content_dir = os.path.join(directory, "content")
+        write_content(content_dir, 2000, 20000)
+        print(f"2000 pages of about 20 KB, {os.cpu_count()} CPU cores")
+
+        baseline = None
+        for workers in [1, 2, 4, 8]:
+            report = build_site(content_dir, os.path.join(directory, f"public{workers}"), workers)
+            if baseline is None:
+                baseline = report.seconds
+            print(f"  {workers} workers: {report.seconds:6.2f}s, speedup {baseline / report.seconds:4.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import random
+from bench_suite import run_best
+from textnode import TextNode, TextType, text_node_to_html_node
+from htmlnode import LeafNode
+
+# function to convert a TextNode object with the if/elif chain of text type comparisons, as a baseline
+def chain_text_node_to_html_node(text_node):
+    if text_node.text_type == TextType.PLAIN_TEXT:
+        return LeafNode(None, text_node.text)
+    elif text_node.text_type == TextType.BOLD_TEXT:
+        return LeafNode("b", text_node.text)
+    elif text_node.text_type == TextType.ITALIC_TEXT:
+        return LeafNode("i", text_node.text)
+    elif text_node.text_type == TextType.CODE_TEXT:
+        return LeafNode("code", text_node.text)
+    elif text_node.text_type == TextType.LINK:
+        return LeafNode("a", text_node.text, {"href": text_node.url})
+    elif text_node.text_type == TextType.IMAGE:
+        return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
+    else:
+        raise ValueError(f"invalid text type: {text_node.text_type}")
+
+# function to render a LeafNode object by formatting its tags for every node, as a baseline
+def format_leaf_html(node):
+    if node.value is None:
+        raise ValueError("invalid HTML: no value")
+    if node.tag is None:
+        return node.value
+    return f"<{node.tag}{node.props_to_html()}>{node.value}</{node.tag}>"
+
+# function to build text nodes of every text type, weighted towards the formatted types whose tags are rendered
+def build_nodes(count, seed=0):
+    rng = random.Random(seed)
+    types = list(TextType)
+    nodes = []
+    for number in range(count):
+        text_type = rng.choice(types)
+        url = f"/pages/{number % 100}" if text_type in (TextType.LINK, TextType.IMAGE) else None
+        nodes.append(TextNode(f"text {number % 1000}", text_type, url))
+    return nodes
+
+# function to time a function over every item, returning the best of several runs
+def time_each(function, items, repeats=3):
+    # function to call the function on every item once
+    def run():
+        for item in items:
+            function(item)
+    return run_best(run, repeats)[0]
+
+# function to compare converting and rendering a million text nodes with the dispatch table and precomputed tags
+# against the if/elif chain and per-node tag formatting
+def main():
+    nodes = build_nodes(1000000)
+    leaves = [text_node_to_html_node(node) for node in nodes]
+    assert [format_leaf_html(leaf) for leaf in leaves[:10000]] == [leaf.to_html() for leaf in leaves[:10000]]
+
+    for name, function, items in (
+        ("if/elif chain", chain_text_node_to_html_node, nodes),
+        ("dispatch table", text_node_to_html_node, nodes),
+        ("formatted tags", format_leaf_html, leaves),
+        ("precomputed tags", LeafNode.to_html, leaves),
+        ("chain + formatted", lambda node: format_leaf_html(chain_text_node_to_html_node(node)), nodes),
+        ("table + precomputed", lambda node: text_node_to_html_node(node).to_html(), nodes),
+    ):
+        elapsed = time_each(function, items)
+        print(f"{name:20} {elapsed * 1000:8.1f} ms for {len(items)} nodes ({elapsed / len(items) * 1e9:.0f} ns each)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import html
+import random
+import htmlnode
+from htmlnode import clear_props_cache
+from page import markdown_to_html_node
+from bench_suite import generate_corpus, run_best
+
+# function to return a string unchanged, to render without escaping as a baseline
+def unescaped(text):
+    return text
+
+# function to add characters that need escaping to a fraction of the words of a corpus
+def add_specials(corpus, fraction, seed=0):
+    rng = random.Random(seed)
+    return " ".join(word + rng.choice([" & co", " <tag>", ' "quoted"']) if rng.random() < fraction else word for word in corpus.split(" "))
+
+# function to time rendering a page with the given text and attribute escaping functions, returning the best of several runs
+def time_render(page, escape_text, escape_attribute, repeats=5):
+    original = htmlnode.escape_text, htmlnode.escape_attribute
+    htmlnode.escape_text, htmlnode.escape_attribute = escape_text, escape_attribute
+    try:
+        # serialize the properties again on every run, so attribute escaping is measured too
+        return run_best(page.to_html, repeats, clear_props_cache)[0]
+    finally:
+        htmlnode.escape_text, htmlnode.escape_attribute = original
+        clear_props_cache()
+
+# function to compare rendering pages without escaping, with the fused escaping and with html.escape on every string
+def main():
+    corpus = generate_corpus(2000000, 0.3)
+    for name, markdown in (("no special characters", corpus), ("5% special characters", add_specials(corpus, 0.05))):
+        page = markdown_to_html_node(markdown)
+        times = [
+            (label, time_render(page, escape_text, escape_attribute)) for label, escape_text, escape_attribute in (
+                ("unescaped", unescaped, unescaped),
+                ("fused escaping", htmlnode.escape_text, htmlnode.escape_attribute),
+                ("html.escape", lambda text: html.escape(text, quote=False), html.escape),
+            )
+        ]
+        print(f"{name}:")
+        for label, elapsed in times:
+            print(f"  {label:16} {elapsed * 1000:8.1f} ms ({(elapsed / times[0][1] - 1) * 100:+.1f}%)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import tracemalloc
+from bench_props import build_site
+from bench_suite import generate_corpus, run_best
+from page import markdown_to_html_node
+from flyweight import NodeInterner
+
+# function to build the pages of a site with a build function, optionally interning each page, returning (pages, bytes allocated)
+def build_pages(build, interner=None):
+    tracemalloc.start()
+    site = build()
+    if interner is not None:
+        site = [interner.intern(page) for page in site]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return site, current
+
+# function to time a render function over every page of the site, returning the best of several runs
+def time_render(site, render, repeats=5):
+    # function to render every page once
+    def render_all():
+        for page in site:
+            render(page)
+    return run_best(render_all, repeats)[0]
+
+# function to report the deduplication, memory and render time of interning the pages built by a build function
+def report(name, build):
+    site, plain_memory = build_pages(build)
+    plain_time = time_render(site, lambda page: page.to_html())
+    del site
+
+    interner = NodeInterner()
+    interned, interned_memory = build_pages(build, interner)
+    interned_time = time_render(interned, interner.to_html)
+
+    print(f"{name}: {interner.lookups} nodes interned into {len(interner)} shared nodes")
+    print(f"  dedup ratio:     {interner.dedup_ratio():.2f}x ({interner.duplicates} duplicates)")
+    print(f"  estimated saved: {interner.bytes_saved / 1e6:.1f} MB")
+    print(f"  tree memory:     {plain_memory / 1e6:.1f} MB -> {interned_memory / 1e6:.1f} MB (includes the interning tables)")
+    print(f"  render:          {plain_time * 1000:.1f} ms -> {interned_time * 1000:.1f} ms")
+
+# function to compare a site whose pages repeat the navigation, link targets and icons with pages of mostly unique prose
+def main():
+    report("2000 pages with shared navigation", lambda: build_site(2000))
+    corpus = [generate_corpus(20000, 0.3, seed) for seed in range(200)]
+    report("200 pages of generated prose", lambda: [markdown_to_html_node(markdown) for markdown in corpus])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import os
+import tempfile
+from bench_build import write_content
+from build import build_site
+
+# function to report the time of a full build, a no-op rebuild and a rebuild after editing one page of a large site
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        content_dir = os.path.join(directory, "content")
+        output_dir = os.path.join(directory, "public")
+        cache_path = os.path.join(directory, "public.cache.json")
+        write_content(content_dir, 10000, 2000)
+        print("10000 pages of about 2 KB")
+
+        report = build_site(content_dir, output_dir, 1, cache_path=cache_path)
+        print(f"  full build:      {report.seconds:6.3f}s, {report.skipped} unchanged")
+
+        report = build_site(content_dir, output_dir, 1, cache_path=cache_path)
+        print(f"  no-op rebuild:   {report.seconds:6.3f}s, {report.skipped} unchanged")
+
+        # append to one page, moving its modification time forward so the change is seen even on coarse clocks
+        path = os.path.join(content_dir, "section0", "page0.md")
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("\n\nAn edited paragraph")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        report = build_site(content_dir, output_dir, 1, cache_path=cache_path)
+        print(f"  one page edited: {report.seconds:6.3f}s, {report.skipped} unchanged")
+
+if __name__ == "__main__":
+    main()
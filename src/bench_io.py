@@ -0,0 +1,40 @@
+import os
+import tempfile
+from bench_build import write_content
+from bench_suite import run_best
+from build import build_site
+
+# function to drop the files under a directory from the page cache, so the next reads have to go to the disk
+# (dirty pages are written back first, since only clean pages can be dropped)
+def evict(directory):
+    os.sync()
+    for parent, subdirectories, files in os.walk(directory):
+        for name in files:
+            fd = os.open(os.path.join(parent, name), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
+# function to compare sequential file I/O with the asynchronous I/O pipeline on a cold and a warm page cache
+def main():
+    if not hasattr(os, "posix_fadvise"):
+        print("posix_fadvise is not available, so the page cache cannot be dropped on this platform")
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        content_dir = os.path.join(directory, "content")
+        output_dir = os.path.join(directory, "public")
+        write_content(content_dir, 5000, 500)
+        build_site(content_dir, output_dir, workers=1)
+        print(f"5000 pages of about 500 bytes, {os.cpu_count()} CPU cores, one worker process, best of 3 builds")
+
+        for cache in ("cold", "warm"):
+            for name, io_threads in (("sequential", 0), ("async, 4 threads", 4), ("async, 8 threads", 8), ("async, 32 threads", 32)):
+                # drop the page cache before each cold build, outside the timing
+                setup = (lambda: evict(directory)) if cache == "cold" else None
+                best = run_best(lambda: build_site(content_dir, output_dir, workers=1, io_threads=io_threads), 3, setup)[0]
+                print(f"  {cache} cache, {name:18} {best:6.2f}s")
+
+if __name__ == "__main__":
+    main()
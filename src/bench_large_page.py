@@ -0,0 +1,31 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from bench_suite import generate_corpus, run_best
+from page import markdown_to_html, markdown_to_html_parallel
+
+# size in bytes of the single large generated page
+PAGE_SIZE = 8_000_000
+
+# function to compare converting one large page in a single process with rendering chunks of its blocks in pools of worker
+# processes of increasing size, up to the number of CPU cores (and at least two)
+def main():
+    markdown = generate_corpus(PAGE_SIZE, 0.3)
+    cores = os.cpu_count() or 1
+    print(f"page of {len(markdown) / 1e6:.1f} MB, {cores} CPU cores")
+
+    serial = run_best(lambda: markdown_to_html(markdown), 3)[0]
+    print(f"{'single process':16} {serial:7.2f} s")
+
+    workers = 1
+    while True:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # start the worker processes before timing
+            list(executor.map(abs, range(workers)))
+            elapsed = run_best(lambda: markdown_to_html_parallel(markdown, executor), 3)[0]
+        print(f"{f'{workers} workers':16} {elapsed:7.2f} s ({serial / elapsed:.2f}x)")
+        if workers >= max(cores, 2):
+            break
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
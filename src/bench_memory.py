@@ -0,0 +1,74 @@
+import tracemalloc
+from textnode import TextNode, text_to_textnodes, text_node_to_html_node
+from htmlnode import LeafNode, ParentNode
+
+# dictionary-based copies of the node classes as they were before __slots__, kept here as the baseline to compare against
+class DictTextNode:
+    def __init__(self, text, text_type, url=None):
+        self.text = text
+        self.text_type = text_type
+        self.url = url
+
+class DictHTMLNode:
+    def __init__(self, tag=None, value=None, children=None, props=None):
+        self.tag = tag
+        self.value = value
+        self.children = children
+        self.props = props
+
+class DictLeafNode(DictHTMLNode):
+    def __init__(self, tag, value, props=None):
+        super().__init__(tag, value, None, props)
+
+class DictParentNode(DictHTMLNode):
+    def __init__(self, tag, children, props=None):
+        super().__init__(tag, None, children, props)
+
+# function to parse a large synthetic document once into lists of TextNode objects, one list per paragraph
+def parse_document(paragraphs):
+    text = "This is **bold** and _italic_ text with `code`, an ![image](https://i.imgur.com/zjjcJKZ.png) and a [link](https://www.boot.dev)."
+    return [text_to_textnodes(text) for _ in range(paragraphs)]
+
+# function to rebuild the parsed document with the given node classes, returning (nodes created, text nodes, tree)
+def build_document(parsed, text_node_class, leaf_class, parent_class):
+    count = 0
+    text_copies = []
+    paragraphs = []
+
+    # for each paragraph, copy its text nodes and build the matching leaf nodes under a paragraph node
+    for text_nodes in parsed:
+        leaves = []
+        for node in text_nodes:
+            text_copies.append(text_node_class(node.text, node.text_type, node.url))
+            html_node = text_node_to_html_node(node)
+            leaves.append(leaf_class(html_node.tag, html_node.value, html_node.props))
+            count += 2
+        paragraphs.append(parent_class("p", leaves))
+        count += 1
+
+    # wrap the paragraphs in a single div node
+    return count + 1, text_copies, parent_class("div", paragraphs)
+
+# function to measure the memory allocated while building the document, returning bytes per node
+def measure(parsed, text_node_class, leaf_class, parent_class):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    count, text_copies, tree = build_document(parsed, text_node_class, leaf_class, parent_class)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return count, (after - before) / count
+
+# function to report bytes per node with and without __slots__
+def main():
+    parsed = parse_document(20000)
+
+    count, with_dict = measure(parsed, DictTextNode, DictLeafNode, DictParentNode)
+    print(f"{count} nodes with __dict__: {with_dict:.1f} bytes/node")
+
+    count, with_slots = measure(parsed, TextNode, LeafNode, ParentNode)
+    print(f"{count} nodes with __slots__: {with_slots:.1f} bytes/node")
+
+    print(f"saved: {(1 - with_slots / with_dict) * 100:.1f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import htmlnode
+from bench_suite import run_best
+from textnode import TextNode, TextType, text_node_to_html_node
+from htmlnode import ParentNode, props_cache_info, clear_props_cache
+from page import markdown_to_html_node
+
+# navigation links and logo that every page of the synthetic site repeats
+NAV = [
+    TextNode("Home", TextType.LINK, "/"),
+    TextNode("Blog", TextType.LINK, "/blog"),
+    TextNode("About", TextType.LINK, "/about"),
+    TextNode("logo", TextType.IMAGE, "/static/logo.png"),
+]
+
+# function to build a synthetic site of pages that share the navigation and link to each other
+def build_site(pages):
+    site = []
+    for number in range(pages):
+        markdown = "\n\n".join(
+            f"Paragraph {paragraph} with a [link](/pages/{(number + paragraph) % 50}) and an ![icon](/static/icon.png)"
+            for paragraph in range(20)
+        )
+        nav = ParentNode("nav", [text_node_to_html_node(node) for node in NAV])
+        site.append(ParentNode("html", [nav, markdown_to_html_node(markdown)]))
+    return site
+
+# function to time rendering every page of the site, returning the best of several runs
+def time_render(site, repeats=5):
+    # function to render every page once
+    def render():
+        for page in site:
+            page.to_html()
+    return run_best(render, repeats)[0]
+
+# function to compare full-site render time with and without the property serialization cache
+def main():
+    site = build_site(2000)
+
+    # render with serialization on every call by swapping in the uncached function
+    cached = htmlnode.cached_serialize_props
+    htmlnode.cached_serialize_props = htmlnode.serialize_props
+    uncached_time = time_render(site)
+    htmlnode.cached_serialize_props = cached
+
+    # render with the cache
+    clear_props_cache()
+    cached_time = time_render(site)
+    info = props_cache_info()
+
+    print(f"uncached: {uncached_time * 1000:.1f} ms")
+    print(f"cached:   {cached_time * 1000:.1f} ms ({(1 - cached_time / uncached_time) * 100:.1f}% faster)")
+    print(f"cache: {info.hits} hits, {info.misses} misses, {info.currsize}/{info.maxsize} entries")
+
+if __name__ == "__main__":
+    main()
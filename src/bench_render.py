@@ -0,0 +1,64 @@
+from bench_suite import run_best
+from htmlnode import LeafNode, ParentNode
+
+# function to render a node tree with the recursive algorithm, kept here as the baseline to compare against
+def recursive_to_html(node):
+    # if the node is a leaf, render it directly
+    if not isinstance(node, ParentNode):
+        return node.to_html()
+
+    # initialize an empty string to hold the rendered html of the child nodes
+    child_html = ""
+
+    # for each child node in the children list, recursively render it and append the result
+    for child in node.children:
+        child_html += recursive_to_html(child)
+
+    # return the rendered html string
+    return f"<{node.tag}{node.props_to_html()}>{child_html}</{node.tag}>"
+
+# function to build a typical page: a div of paragraphs, each with a few formatted leaves
+def build_page(paragraphs):
+    return ParentNode("div", [
+        ParentNode("p", [
+            LeafNode(None, "Some normal text "),
+            LeafNode("b", "bold text"),
+            LeafNode(None, " and "),
+            LeafNode("i", "italic text"),
+            LeafNode(None, " with a "),
+            LeafNode("a", "link", {"href": "https://www.boot.dev"}),
+        ])
+        for _ in range(paragraphs)
+    ])
+
+# function to build a tree of nested blockquotes with the given depth
+def build_deep(depth):
+    node = LeafNode(None, "deep text")
+    for _ in range(depth):
+        node = ParentNode("blockquote", [node])
+    return node
+
+# function to time a render function on a node tree, returning the best of several runs
+def time_render(render_function, node, repeats=5):
+    return run_best(lambda: render_function(node), repeats)[0]
+
+# function to compare the recursive and the stack-based renderer
+def main():
+    # compare both renderers on a typical page
+    page = build_page(20000)
+    recursive = time_render(recursive_to_html, page)
+    iterative = time_render(ParentNode.to_html, page)
+    print(f"page of 20000 paragraphs: recursive {recursive * 1000:.2f} ms, stack-based {iterative * 1000:.2f} ms")
+
+    # compare both renderers on a tree nested deeper than the default recursion limit
+    deep = build_deep(100000)
+    try:
+        recursive_to_html(deep)
+        print("tree 100000 levels deep: recursive ok")
+    except RecursionError:
+        print("tree 100000 levels deep: recursive raised RecursionError")
+    iterative = time_render(ParentNode.to_html, deep, repeats=1)
+    print(f"tree 100000 levels deep: stack-based {iterative * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import pickle
+from bench_suite import generate_corpus, run_best
+from inline import parse_inline
+from page import markdown_to_html_node
+from serialize import dumps, loads
+
+# function to time a function on an argument, returning (its result, the best time of several runs)
+def best_time(function, argument, repeats=5):
+    best, result = run_best(lambda: function(argument), repeats)
+    return result, best
+
+# function to compare the size and speed of the compact encoding with pickle, on an html tree and on a list of TextNodes
+def main():
+    markdown = generate_corpus(2_000_000, 0.3, seed=1, paragraph_words=40)
+    cases = [
+        ("html tree", markdown_to_html_node(markdown)),
+        ("text nodes", parse_inline(markdown.replace("\n\n", " "))),
+    ]
+    codecs = [
+        ("pickle", lambda value: pickle.dumps(value, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("compact", dumps, loads),
+    ]
+
+    for name, value in cases:
+        print(name)
+        for codec, encode, decode in codecs:
+            data, encode_time = best_time(encode, value)
+            decoded, decode_time = best_time(decode, data)
+            print(f"  {codec:8} {len(data) / 1e6:6.2f} MB  dumps {encode_time * 1000:7.1f} ms  loads {decode_time * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
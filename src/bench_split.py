@@ -0,0 +1,27 @@
+from bench_suite import run_best
+from textnode import TextNode, TextType, split_nodes_image, split_nodes_link
+
+# function to time a split function on a paragraph with the given number of markdown items, returning the best of several runs
+def time_split(split_function, item, count, repeats=5):
+    # build a single paragraph containing the item repeated count times
+    node = TextNode((item + " some text ") * count, TextType.PLAIN_TEXT)
+
+    # return the best time in seconds of several runs
+    return run_best(lambda: split_function([node]), repeats)[0]
+
+# function to print how split time grows with the number of links and images in a paragraph
+def main():
+    cases = [
+        ("split_nodes_link", split_nodes_link, "[link](https://www.boot.dev)"),
+        ("split_nodes_image", split_nodes_image, "![image](https://i.imgur.com/zjjcJKZ.png)"),
+    ]
+
+    for name, split_function, item in cases:
+        print(name)
+        for count in [1000, 2000, 4000, 8000, 16000]:
+            elapsed = time_split(split_function, item, count)
+            # a constant time per item means the split scales linearly
+            print(f"  {count:>6} items: {elapsed * 1000:8.2f} ms, {elapsed / count * 1e6:6.3f} us/item")
+
+if __name__ == "__main__":
+    main()
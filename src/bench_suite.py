@@ -0,0 +1,192 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from textnode import (
+    TextNode,
+    TextType,
+    text_node_to_html_node,
+    split_nodes_delimiter,
+    split_nodes_image,
+    split_nodes_link,
+    text_to_textnodes,
+    markdown_to_blocks
+)
+from inline import parse_inline, render_many, texts_to_html_many
+from page import markdown_to_html_node
+from blocks import parse_blocks
+from htmlnode import count_nodes
+
+# words used to fill the synthetic corpus
+WORDS = ["static", "site", "generator", "markdown", "node", "render", "block", "inline", "page", "tree", "html", "text"]
+
+# function to generate a random markdown element for the synthetic corpus
+def random_markup(rng, word):
+    kind = rng.randrange(5)
+    if kind == 0:
+        return f"**{word}**"
+    if kind == 1:
+        return f"_{word}_"
+    if kind == 2:
+        return f"`{word}`"
+    if kind == 3:
+        return f"[{word}](https://www.boot.dev/{word})"
+    return f"![{word}](https://i.imgur.com/{word}.png)"
+
+# function to generate a synthetic markdown corpus of about the given size in bytes,
+# where density is the fraction of words that are wrapped in bold, italic, code, link or image markup
+def generate_corpus(size, density, seed=0, paragraph_words=60):
+    rng = random.Random(seed)
+    blocks = []
+    length = 0
+
+    # add paragraphs until the corpus reaches the requested size
+    while length < size:
+        words = []
+        for _ in range(paragraph_words):
+            word = rng.choice(WORDS)
+            words.append(random_markup(rng, word) if rng.random() < density else word)
+        block = " ".join(words)
+        blocks.append(block)
+        length += len(block) + 2
+
+    # join the paragraphs with blank lines
+    return "\n\n".join(blocks)
+
+# function to run a benchmark several times and return the best time and the number of nodes it produced or processed
+# (with a setup function, it is called before each run, outside the timing)
+def run_best(function, repeats, setup=None):
+    best = None
+    nodes = 0
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        nodes = function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, nodes
+
+# function to build the benchmarks over a corpus, returning a dictionary of name -> (input size in bytes, function returning a node count)
+def build_benchmarks(corpus):
+    blocks = markdown_to_blocks(corpus)
+    plain_nodes = [TextNode(block, TextType.PLAIN_TEXT) for block in blocks]
+    text_nodes = [node for block in blocks for node in text_to_textnodes(block)]
+    page = markdown_to_html_node(corpus)
+    page_nodes = count_nodes(page)
+    size = len(corpus.encode("utf-8"))
+
+    # function to render the whole page, returning the number of nodes rendered
+    def render_page():
+        page.to_html()
+        return page_nodes
+
+    return {
+        "markdown_to_blocks": (size, lambda: len(markdown_to_blocks(corpus))),
+        "parse_blocks": (size, lambda: len(parse_blocks(corpus))),
+        "split_nodes_delimiter": (size, lambda: len(split_nodes_delimiter(plain_nodes, "**", TextType.BOLD_TEXT))),
+        "split_nodes_image": (size, lambda: len(split_nodes_image(plain_nodes))),
+        "split_nodes_link": (size, lambda: len(split_nodes_link(plain_nodes))),
+        "text_to_textnodes": (size, lambda: sum(len(text_to_textnodes(block)) for block in blocks)),
+        "parse_inline": (size, lambda: sum(len(parse_inline(block)) for block in blocks)),
+        "text_node_to_html_node": (size, lambda: len([text_node_to_html_node(node) for node in text_nodes])),
+        "render_many": (size, lambda: len(render_many(text_nodes))),
+        "texts_to_html_many": (size, lambda: len(texts_to_html_many(blocks))),
+        "ParentNode.to_html": (size, render_page),
+    }
+
+# function to run every benchmark and return the results as a dictionary
+def run_suite(size, density, repeats, seed=0, only=None):
+    corpus = generate_corpus(size, density, seed)
+    benchmarks = build_benchmarks(corpus)
+    results = {}
+
+    # for each benchmark, record its best time and its throughput
+    for name, (input_size, function) in benchmarks.items():
+        if only and name not in only:
+            continue
+        seconds, nodes = run_best(function, repeats)
+        results[name] = {
+            "seconds": seconds,
+            "mb_per_s": input_size / seconds / 1e6,
+            "nodes_per_s": nodes / seconds,
+            "nodes": nodes,
+        }
+
+    return {
+        "config": {"size": size, "density": density, "repeats": repeats, "seed": seed},
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+# function to compare results against a baseline, returning a list of (name, baseline MB/s, current MB/s, change) regressions
+# (a benchmark regresses when its throughput drops by more than the threshold fraction)
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, current in results["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        change = current["mb_per_s"] / previous["mb_per_s"] - 1
+        if change < -threshold:
+            regressions.append((name, previous["mb_per_s"], current["mb_per_s"], change))
+    return regressions
+
+# function to print a table of results, with the change against the baseline if there is one
+def print_results(results, baseline=None):
+    config = results["config"]
+    print(f"corpus: {config['size'] / 1e6:.2f} MB, markup density {config['density']}, best of {config['repeats']}")
+    print(f"{'benchmark':<24}{'MB/s':>10}{'nodes/s':>14}{'vs baseline':>14}")
+    for name, result in results["results"].items():
+        change = ""
+        if baseline and name in baseline["results"]:
+            change = f"{(result['mb_per_s'] / baseline['results'][name]['mb_per_s'] - 1) * 100:+.1f}%"
+        print(f"{name:<24}{result['mb_per_s']:>10.2f}{result['nodes_per_s']:>14,.0f}{change:>14}")
+
+# function to parse the command line arguments
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="benchmark the inline, block and render hot paths")
+    parser.add_argument("--size", type=int, default=1_000_000, help="approximate corpus size in bytes")
+    parser.add_argument("--density", type=float, default=0.2, help="fraction of words wrapped in markup")
+    parser.add_argument("--repeats", type=int, default=5, help="number of runs per benchmark, keeping the best")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the corpus")
+    parser.add_argument("--only", nargs="*", help="names of the benchmarks to run")
+    parser.add_argument("--output", help="path of a JSON file to save the results to")
+    parser.add_argument("--baseline", help="path of a JSON file with results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed throughput drop against the baseline, as a fraction")
+    return parser.parse_args(argv)
+
+# function to run the benchmark suite from the command line, returning the exit status
+def main(argv=None):
+    args = parse_args(argv)
+
+    # load the baseline, if any
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    # run the suite and print the results
+    results = run_suite(args.size, args.density, args.repeats, args.seed, args.only)
+    print_results(results, baseline)
+
+    # save the results, if requested
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    # fail if any benchmark regressed past the threshold
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        for name, previous, current, change in regressions:
+            print(f"REGRESSION {name}: {previous:.2f} -> {current:.2f} MB/s ({change * 100:+.1f}%)")
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import io
+from bench_suite import run_best
+from template import Template, SLOT_PATTERN
+
+# site layout with the three page slots, padded with static markup like a real layout
+LAYOUT = (
+    "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{{ title }}</title>"
+    "<link rel=\"stylesheet\" href=\"/style.css\"></head><body><header>{{ nav }}</header>"
+    "<main>{{ content }}</main><footer>" + "<p>footer text</p>" * 20 + "</footer></body></html>"
+)
+
+# function to render a page by scanning the layout with str.replace for each slot, as a baseline
+def render_replace(values):
+    return LAYOUT.replace("{{ title }}", values["title"]).replace("{{ nav }}", values["nav"]).replace("{{ content }}", values["content"])
+
+# function to render a page by substituting the placeholders with the slot pattern, as a baseline
+def render_regex(values):
+    return SLOT_PATTERN.sub(lambda match: values[match.group(1)], LAYOUT)
+
+# function to time rendering every page with a render function, returning the best of several runs
+def time_pages(pages, render, repeats=3):
+    # function to render every page once
+    def render_all():
+        for values in pages:
+            render(values)
+    return run_best(render_all, repeats)[0]
+
+# function to compare rendering tens of thousands of pages into the layout with the compiled template and the baselines
+def main():
+    template = Template(LAYOUT)
+    pages = [
+        {"title": f"Page {number}", "nav": '<nav><a href="/">Home</a></nav>', "content": f"<div><p>Page {number} text</p></div>" * 20}
+        for number in range(20000)
+    ]
+    for name, render in (
+        ("str.replace", render_replace),
+        ("re.sub", render_regex),
+        ("compiled render", template.render),
+        ("compiled write", lambda values: template.write(io.StringIO(), values)),
+    ):
+        print(f"{name:16} {time_pages(pages, render) * 1000:8.1f} ms for {len(pages)} pages")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+from enum import Enum
+import re
+from htmlnode import LeafNode, ParentNode
+from textnode import text_node_to_html_node
+from inline import parse_inline
+
+# enum representing the different types of markdown blocks
+class BlockType(Enum):
+    PARAGRAPH = "paragraph"
+    HEADING = "heading"
+    CODE = "code"
+    QUOTE = "quote"
+    UNORDERED_LIST = "unordered_list"
+    ORDERED_LIST = "ordered_list"
+
+# block types looked up once at import time for the line scanner
+PARAGRAPH = BlockType.PARAGRAPH
+HEADING = BlockType.HEADING
+CODE = BlockType.CODE
+QUOTE = BlockType.QUOTE
+UNORDERED_LIST = BlockType.UNORDERED_LIST
+ORDERED_LIST = BlockType.ORDERED_LIST
+
+# marker of a fenced code block: an opening line is the fence followed by an optional info string without backticks,
+# and a closing line is the fence alone
+FENCE = "```"
+
+# deepest heading level, and the tag of each heading level
+MAX_HEADING_LEVEL = 6
+HEADING_TAGS = {level: f"h{level}" for level in range(1, MAX_HEADING_LEVEL + 1)}
+
+# regex pattern to match the marker of an ordered list item: a number followed by a dot and a space
+ORDERED_ITEM_PATTERN = re.compile(r"\d+\. ")
+
+# class representing a markdown block found by the line scanner
+class Block:
+    # fixed attribute slots, as a document can hold many blocks
+    __slots__ = ("block_type", "start", "end", "parts", "level")
+
+    # constructor to initialize a Block object with a block type, its source range, the (start, end) source ranges of its
+    # content and a heading level (0 for other blocks)
+    # (the content is the text of a paragraph or heading, each line of a quote, each item of a list, or the code of a code block)
+    def __init__(self, block_type, start, end, parts, level=0):
+        self.block_type = block_type
+        self.start = start
+        self.end = end
+        self.parts = parts
+        self.level = level
+
+    # method to check equality between two Block objects
+    def __eq__(self, other):
+        if not isinstance(other, Block):
+            return False
+
+        return (self.block_type == other.block_type and self.start == other.start and self.end == other.end
+                and self.parts == other.parts and self.level == other.level)
+
+    # method to return a string representation of the Block object
+    def __repr__(self):
+        return f"Block({self.block_type.value}, {self.start}, {self.end}, {self.parts}, {self.level})"
+
+# function to scan a markdown document line by line, returning a list of Block objects in document order
+# (headings, fences, quote lines and list items start a new block even without a blank line before them, and blank lines
+# end paragraphs, quotes and lists, but not fenced code, which runs to its closing fence or the end of the document)
+def parse_blocks(markdown):
+    # initialize an empty list to hold the blocks, the paragraph, quote or list being extended, and the open code block
+    blocks = []
+    current = None
+    code = None
+    offset = 0
+
+    # for each line, tracking its offset in the markdown
+    for line in markdown.split("\n"):
+        start = offset
+        offset += len(line) + 1
+
+        # inside a code block, every line is code until the closing fence
+        if code is not None:
+            if line.strip() == FENCE:
+                code_start = code.parts[0][0]
+                code.parts[0] = (code_start, max(code_start, start - 1))
+                code.end = start + len(line.rstrip())
+                code = None
+            continue
+
+        # a blank line ends the block being extended
+        stripped = line.strip()
+        if not stripped:
+            current = None
+            continue
+
+        # get the source range of the line without its surrounding whitespace
+        content_start = start + len(line) - len(line.lstrip())
+        content_end = start + len(line.rstrip())
+        first = stripped[0]
+
+        # a fence opens a code block, whose code starts on the next line (a line such as "```x``` text" is inline code instead)
+        if stripped.startswith(FENCE) and "`" not in stripped[len(FENCE):]:
+            code = Block(CODE, content_start, content_end, [(offset, offset)])
+            blocks.append(code)
+            current = None
+            continue
+
+        # one to six hashes followed by a space (or nothing) make a heading line
+        if first == "#":
+            level = len(stripped) - len(stripped.lstrip("#"))
+            if level <= MAX_HEADING_LEVEL and (level == len(stripped) or stripped[level] == " "):
+                text_start = content_end - len(stripped[level:].lstrip())
+                blocks.append(Block(HEADING, content_start, content_end, [(text_start, content_end)], level))
+                current = None
+                continue
+
+        # get the block type and content range of quote lines and list items
+        block_type = None
+        if first == ">":
+            block_type = QUOTE
+            text_start = content_start + (2 if stripped.startswith("> ") else 1)
+        elif (first == "-" or first == "*") and stripped[1:2] == " ":
+            block_type = UNORDERED_LIST
+            text_start = content_end - len(stripped[2:].lstrip())
+        elif first.isdigit():
+            match = ORDERED_ITEM_PATTERN.match(stripped)
+            if match is not None:
+                block_type = ORDERED_LIST
+                text_start = content_end - len(stripped[match.end():].lstrip())
+
+        # a quote line or list item extends the block before it if it has the same type, and starts a new block otherwise
+        if block_type is not None:
+            if current is not None and current.block_type is block_type:
+                current.parts.append((text_start, content_end))
+                current.end = content_end
+            else:
+                current = Block(block_type, content_start, content_end, [(text_start, content_end)])
+                blocks.append(current)
+            continue
+
+        # any other line extends the paragraph before it, or starts a new paragraph
+        if current is not None and current.block_type is PARAGRAPH:
+            current.end = content_end
+            current.parts[0] = (current.start, content_end)
+        else:
+            current = Block(PARAGRAPH, content_start, content_end, [(content_start, content_end)])
+            blocks.append(current)
+
+    # an unclosed code block runs to the end of the document
+    if code is not None:
+        code_end = len(markdown.rstrip("\n"))
+        code.parts[0] = (min(code.parts[0][0], code_end), code_end)
+        code.end = code_end
+
+    # return the final list of blocks
+    return blocks
+
+# function to convert a string of markdown-formatted text into a list of LeafNode objects
+def inline_html_nodes(text):
+    return [text_node_to_html_node(text_node) for text_node in parse_inline(text)]
+
+# function to convert a paragraph block into a paragraph ParentNode
+def paragraph_to_html_node(source, block):
+    return ParentNode("p", inline_html_nodes(source[block.start:block.end]))
+
+# function to convert a heading block into a heading ParentNode of its level
+def heading_to_html_node(source, block):
+    start, end = block.parts[0]
+    return ParentNode(HEADING_TAGS[block.level], inline_html_nodes(source[start:end]))
+
+# function to convert a code block into a pre ParentNode around a code LeafNode holding the code as is
+def code_to_html_node(source, block):
+    start, end = block.parts[0]
+    return ParentNode("pre", [LeafNode("code", source[start:end])])
+
+# function to convert a quote block into a blockquote ParentNode, with the inline nodes of each line separated by newlines
+def quote_to_html_node(source, block):
+    children = []
+    for index, (start, end) in enumerate(block.parts):
+        if index:
+            children.append(LeafNode(None, "\n"))
+        children.extend(inline_html_nodes(source[start:end]))
+    return ParentNode("blockquote", children)
+
+# function to convert an unordered list block into a ul ParentNode with an li ParentNode for each item
+def unordered_list_to_html_node(source, block):
+    return ParentNode("ul", [ParentNode("li", inline_html_nodes(source[start:end])) for start, end in block.parts])
+
+# function to convert an ordered list block into an ol ParentNode with an li ParentNode for each item
+def ordered_list_to_html_node(source, block):
+    return ParentNode("ol", [ParentNode("li", inline_html_nodes(source[start:end])) for start, end in block.parts])
+
+# functions converting each block type into an html node, looked up by block type
+BLOCK_CONVERTERS = {
+    PARAGRAPH: paragraph_to_html_node,
+    HEADING: heading_to_html_node,
+    CODE: code_to_html_node,
+    QUOTE: quote_to_html_node,
+    UNORDERED_LIST: unordered_list_to_html_node,
+    ORDERED_LIST: ordered_list_to_html_node,
+}
+
+# function to convert a Block object found in a markdown source into an html node, using the source ranges of its content
+def block_to_html_node(source, block):
+    return BLOCK_CONVERTERS[block.block_type](source, block)
@@ -0,0 +1,357 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from page import markdown_to_html, submit_markdown, join_fragments, BlockCache
+from blocks import BlockType, parse_blocks
+from inline import parse_inline
+from cache import BuildCache, OutputManifest, hash_source, hash_output, site_version
+from htmlnode import LeafNode, ParentNode, escape_text
+from template import load_template
+from aio import convert_files
+
+# number of pages sent to a worker process at a time
+DEFAULT_CHUNK_SIZE = 64
+
+# cache of rendered blocks shared by every page built in this process, so blocks repeated across pages are rendered once
+BLOCK_CACHE = BlockCache()
+
+# class representing the outcome of a site build
+class BuildReport:
+    # constructor to initialize a BuildReport object with the number of pages, the (page, error message) pairs, the build time,
+    # the number of unchanged pages that were skipped, and the number of output files written, left alone because their bytes
+    # were identical, and deleted because no page produces them any more
+    def __init__(self, pages, errors, seconds, skipped=0, written=0, identical=0, deleted=0):
+        self.pages = pages
+        self.errors = errors
+        self.seconds = seconds
+        self.skipped = skipped
+        self.written = written
+        self.identical = identical
+        self.deleted = deleted
+
+    # method to return whether every page was built successfully
+    def ok(self):
+        return not self.errors
+
+    # method to format the BuildReport object as a text summary with one line per error
+    def format(self):
+        built = self.pages - self.skipped - len(self.errors)
+        lines = [
+            f"built {built} of {self.pages} pages ({self.skipped} unchanged) in {self.seconds:.2f}s, "
+            f"wrote {self.written} files ({self.identical} identical, {self.deleted} stale deleted)"
+        ]
+        for path, message in self.errors:
+            lines.append(f"error: {path}: {message}")
+        return "\n".join(lines)
+
+    # method to return a string representation of the BuildReport object
+    def __repr__(self):
+        return (f"BuildReport({self.pages}, errors: {self.errors}, {self.seconds}, skipped: {self.skipped}, written: {self.written}, "
+                f"identical: {self.identical}, deleted: {self.deleted})")
+
+# function to find every markdown page under a content directory, returning their relative paths in sorted order
+def find_pages(content_dir):
+    pages = []
+    for directory, subdirectories, files in os.walk(content_dir):
+        for name in files:
+            if name.endswith(".md"):
+                pages.append(os.path.relpath(os.path.join(directory, name), content_dir))
+
+    # sort the pages, so the build order and the error report do not depend on the file system
+    return sorted(pages)
+
+# function to return the relative path of the html file built from a markdown page
+def output_path(page_path):
+    return os.path.splitext(page_path)[0] + ".html"
+
+# function to return the title of a page: the plain text of its first heading without inline markup, or its file name
+def page_title(page_path, markdown):
+    for block in parse_blocks(markdown):
+        if block.block_type is BlockType.HEADING:
+            start, end = block.parts[0]
+            text = markdown[start:end]
+            # a heading with invalid inline markup keeps its raw text, as its page fails to build anyway
+            try:
+                title = "".join(text_node.text for text_node in parse_inline(text)).strip()
+            except ValueError:
+                title = text
+            if title:
+                return title
+    return os.path.splitext(os.path.basename(page_path))[0]
+
+# function to build the navigation of a page: a ParentNode of links to the home page and each directory above the page
+def page_nav(page_path):
+    links = [LeafNode("a", "Home", {"href": "/"})]
+    url = "/"
+    for directory in os.path.dirname(page_path).split(os.sep):
+        if directory:
+            url += directory + "/"
+            links.append(LeafNode(None, " / "))
+            links.append(LeafNode("a", directory, {"href": url}))
+    return ParentNode("nav", links)
+
+# names of the template slots filled in for each page
+PAGE_SLOTS = ("title", "content", "nav")
+
+# function to return the template slot values of a page: its escaped title, its html content and its navigation
+def page_values(page_path, markdown, html):
+    return {"title": escape_text(page_title(page_path, markdown)), "content": html, "nav": page_nav(page_path)}
+
+# function to put the html of a page into the page template if a template path is given
+def apply_template(page_path, markdown, html, template_path=None):
+    if template_path is None:
+        return html
+    # the compiled template is cached, so only the first page of each process compiles it
+    return load_template(template_path).render(page_values(page_path, markdown, html))
+
+# function to convert the markdown source of a page into its html, inside the page template if a template path is given
+def render_page(page_path, markdown, template_path=None):
+    return apply_template(page_path, markdown, markdown_to_html(markdown, BLOCK_CACHE), template_path)
+
+# function to write the bytes of an output file unless they are identical to the manifest entry of the previous build,
+# returning (hash, size, modification time, whether the file was written)
+# (the file is only left alone if its size and modification time still match the entry, so files changed by anything
+# else since they were recorded are rewritten)
+def write_output(destination, data, previous=None):
+    digest = hash_output(data)
+    if previous is not None and previous["hash"] == digest and previous["size"] == len(data):
+        try:
+            stat = os.stat(destination)
+        except OSError:
+            stat = None
+        if stat is not None and stat.st_size == len(data) and stat.st_mtime_ns == previous["mtime_ns"]:
+            return digest, len(data), stat.st_mtime_ns, False
+
+    with open(destination, "wb") as file:
+        file.write(data)
+        # flush before reading the modification time, since the buffered bytes only reach the file on flush
+        file.flush()
+        mtime_ns = os.fstat(file.fileno()).st_mtime_ns
+    return digest, len(data), mtime_ns, True
+
+# function to convert the markdown source of a page into the bytes of its output file, returning
+# (output bytes, (source hash, manifest entry of the previous output or None))
+def convert_page(template_path, outputs, page_path, markdown):
+    data = render_page(page_path, markdown, template_path).encode("utf-8")
+    return data, (hash_source(markdown), outputs.get(output_path(page_path)))
+
+# function to write the output file of a converted page, returning (source hash, output hash, size, modification time, written)
+def write_page(destination, data, info):
+    source_digest, previous = info
+    return (source_digest, *write_output(destination, data, previous))
+
+# function to convert a single markdown page into an html file, skipping the write if the output is identical to the given
+# manifest outputs, returning (error message or None, (source hash, output hash, size, modification time, written) or None)
+def build_page(content_dir, output_dir, page_path, template_path=None, outputs=None):
+    try:
+        # read the markdown source of the page
+        with open(os.path.join(content_dir, page_path), encoding="utf-8") as file:
+            markdown = file.read()
+
+        # convert it and write the html next to the other pages in the output directory
+        data, info = convert_page(template_path, outputs or {}, page_path, markdown)
+        destination = os.path.join(output_dir, output_path(page_path))
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        return None, write_page(destination, data, info)
+    except (OSError, ValueError) as error:
+        return f"{type(error).__name__}: {error}", None
+
+# function to read a large page and submit chunks of its blocks to an executor, returning
+# (markdown source, futures of the html fragments, error message or None)
+def submit_large_page(content_dir, page_path, executor):
+    try:
+        with open(os.path.join(content_dir, page_path), encoding="utf-8") as file:
+            markdown = file.read()
+        return markdown, submit_markdown(markdown, executor), None
+    except (OSError, ValueError) as error:
+        return None, None, f"{type(error).__name__}: {error}"
+
+# function to finish a large page submitted with submit_large_page: join its html fragments, put them into the template and
+# write the output file, returning (page, error message or None, (source hash, output hash, size, modification time, written) or None)
+def finish_large_page(output_dir, page_path, submitted, template_path=None, outputs=None):
+    markdown, futures, message = submitted
+    if message is not None:
+        return page_path, message, None
+    try:
+        data = apply_template(page_path, markdown, join_fragments(futures), template_path).encode("utf-8")
+        destination = os.path.join(output_dir, output_path(page_path))
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        info = (hash_source(markdown), (outputs or {}).get(output_path(page_path)))
+        return page_path, None, write_page(destination, data, info)
+    except (OSError, ValueError) as error:
+        return page_path, f"{type(error).__name__}: {error}", None
+
+# function to build a chunk of pages in a worker process, given the manifest entries of their previous outputs, returning a list
+# of (page, error message or None, (source hash, output hash, size, modification time, written) or None) tuples
+# (with I/O threads, the sources are read and the pages written by the asynchronous I/O pipeline, overlapping with conversion)
+def build_chunk(content_dir, output_dir, page_paths, template_path=None, io_threads=0, outputs=None):
+    outputs = outputs or {}
+    if io_threads:
+        jobs = [(page_path, os.path.join(content_dir, page_path), os.path.join(output_dir, output_path(page_path)))
+                for page_path in page_paths]
+        return convert_files(jobs, partial(convert_page, template_path, outputs), write_page, threads=io_threads)
+    return [(page_path, *build_page(content_dir, output_dir, page_path, template_path, outputs)) for page_path in page_paths]
+
+# function to split a list into consecutive chunks of at most the given size
+def chunked(items, size):
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+# function to split pages into those smaller than a size in bytes and those at least that large, keeping their order
+# (pages that cannot be read are left with the small pages, where their error is reported)
+def split_large_pages(content_dir, pages, split_size):
+    small = []
+    large = []
+    for page_path in pages:
+        try:
+            size = os.path.getsize(os.path.join(content_dir, page_path))
+        except OSError:
+            size = 0
+        (large if size >= split_size else small).append(page_path)
+    return small, large
+
+# function to find the pages that need to be built, skipping pages whose source is unchanged since the cached build
+# and whose output still exists, returning (pages to build, source stats by page)
+def pages_to_build(content_dir, output_dir, pages, cache):
+    to_build = []
+    stats = {}
+
+    for page_path in pages:
+        source_path = os.path.join(content_dir, page_path)
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            to_build.append(page_path)
+            continue
+        stats[page_path] = stat
+
+        # build the page unless its source is unchanged and its output is still there
+        unchanged = cache.is_unchanged(page_path, source_path, stat)
+        if not unchanged or not os.path.exists(os.path.join(output_dir, output_path(page_path))):
+            to_build.append(page_path)
+
+    return to_build, stats
+
+# function to build every markdown page under a content directory into html files under an output directory
+# (with more than one worker, chunks of pages are converted in parallel worker processes; with a cache path,
+# pages unchanged since the previous build are skipped unless force is set; with a template path, each page is
+# written into the template; with I/O threads, files are read and written through the asynchronous I/O pipeline;
+# with a manifest path, output files whose bytes are unchanged are not rewritten, and outputs no page produces any more are deleted;
+# with a split size and more than one worker, the chunks of blocks of each page of at least that many bytes are submitted to the
+# worker processes ahead of the other pages and joined in this process, so a single huge page does not leave the other cores idle)
+def build_site(content_dir, output_dir, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, cache_path=None, force=False,
+               template_path=None, io_threads=0, manifest_path=None, split_size=None):
+    start = time.perf_counter()
+    pages = find_pages(content_dir)
+
+    # compile the template up front, so a missing, unreadable or invalid template fails the build once instead of every page
+    template_digest = None
+    if template_path is not None:
+        template = load_template(template_path)
+        unknown = [name for name in template.names if name not in PAGE_SLOTS]
+        if unknown:
+            raise ValueError(f"invalid template: unknown slots {', '.join(unknown)}")
+        template_digest = template.digest
+
+    # load the cache, evict the pages whose sources were deleted, and find the pages that changed
+    cache = None
+    stats = {}
+    to_build = pages
+    if cache_path is not None:
+        cache = BuildCache(cache_path, site_version(template_digest)).load()
+        cache.evict_missing(pages)
+        if force:
+            cache.clear()
+        to_build, stats = pages_to_build(content_dir, output_dir, pages, cache)
+
+    # load the manifest of the previous outputs, and pick the entries of the pages to build
+    manifest = None
+    outputs = {}
+    if manifest_path is not None:
+        manifest = OutputManifest(manifest_path).load()
+        for page_path in to_build:
+            entry = manifest.get(output_path(page_path))
+            if entry is not None:
+                outputs[output_path(page_path)] = entry
+
+    # default to one worker per CPU core
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # set the large pages apart, to be split across the workers
+    large = []
+    small = to_build
+    if split_size is not None and workers > 1:
+        small, large = split_large_pages(content_dir, to_build, split_size)
+    chunks = chunked(small, chunk_size)
+
+    # convert the chunks in this process or in a pool of worker processes
+    if workers <= 1 or (len(chunks) <= 1 and not large):
+        results = [build_chunk(content_dir, output_dir, to_build, template_path, io_threads, outputs)]
+    else:
+        # send each worker only the manifest entries of its own pages
+        chunk_outputs = []
+        for chunk in chunks:
+            paths = [output_path(page_path) for page_path in chunk]
+            chunk_outputs.append({path: outputs[path] for path in paths if path in outputs})
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # submit the chunks of blocks of every large page first, so they do not wait behind the small pages
+            submitted = [submit_large_page(content_dir, page_path, executor) for page_path in large]
+            pending = [
+                executor.submit(build_chunk, content_dir, output_dir, chunk, template_path, io_threads, chunk_outputs[index])
+                for index, chunk in enumerate(chunks)
+            ]
+
+            # while the workers render, join and write each large page here as soon as its fragments are done
+            large_results = [finish_large_page(output_dir, page_path, page_submitted, template_path, outputs)
+                             for page_path, page_submitted in zip(large, submitted)]
+            results = [future.result() for future in pending] + [large_results]
+
+        # keep the results in page order
+        if large:
+            order = {page_path: index for index, page_path in enumerate(to_build)}
+            results = [sorted((result for chunk in results for result in chunk), key=lambda result: order[result[0]])]
+
+    # collect the errors, record the built pages in the cache so the failed ones are retried next time,
+    # and record the outputs in the manifest
+    errors = []
+    written = identical = 0
+    for result in results:
+        for page_path, message, info in result:
+            if message is not None:
+                errors.append((page_path, message))
+                if cache is not None:
+                    cache.forget(page_path)
+                continue
+
+            source_digest, output_digest, size, mtime_ns, was_written = info
+            if was_written:
+                written += 1
+            else:
+                identical += 1
+            if cache is not None and page_path in stats:
+                cache.record(page_path, stats[page_path], source_digest)
+            if manifest is not None:
+                manifest.record(output_path(page_path), output_digest, size, mtime_ns)
+
+    # delete the outputs recorded in the manifest that no page produces any more
+    deleted = 0
+    if manifest is not None:
+        for stale in manifest.stale(output_path(page_path) for page_path in pages):
+            # never delete anything outside the output directory, even if the manifest was edited by hand
+            normalized = os.path.normpath(stale)
+            if os.path.isabs(normalized) or normalized.split(os.sep)[0] == os.pardir:
+                manifest.forget(stale)
+                continue
+            try:
+                os.remove(os.path.join(output_dir, normalized))
+                deleted += 1
+            except FileNotFoundError:
+                pass
+            manifest.forget(stale)
+        manifest.save()
+
+    if cache is not None:
+        cache.save()
+
+    return BuildReport(len(pages), errors, time.perf_counter() - start, len(pages) - len(to_build), written, identical, deleted)
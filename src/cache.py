@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+
+# modules whose source code determines the html produced for a page
+CONVERTER_MODULES = ["textnode.py", "htmlnode.py", "inline.py", "page.py", "template.py", "build.py", "blocks.py"]
+
+# function to hash the source code of the converter modules, so cached pages are rebuilt whenever the converter changes
+def converter_version():
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in CONVERTER_MODULES:
+        with open(os.path.join(directory, name), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+# version of the converter, computed once at import time
+CONVERTER_VERSION = converter_version()
+
+# function to return the version of the pages built by the converter, with the digest of the page template if there is one,
+# so cached pages are also rebuilt whenever the template changes
+def site_version(template_digest=None):
+    if template_digest is None:
+        return CONVERTER_VERSION
+    return hashlib.sha256(f"{CONVERTER_VERSION}:{template_digest}".encode("ascii")).hexdigest()
+
+# function to hash the markdown source of a page
+def hash_source(markdown):
+    return hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+
+# function to read a page's markdown source and return its hash
+def hash_file(path):
+    with open(path, encoding="utf-8") as file:
+        return hash_source(file.read())
+
+# function to hash the bytes of an output file
+def hash_output(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# function to write data to a json file, replacing the previous file atomically
+def save_json(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+    os.replace(temporary, path)
+
+# function to read a json file, returning None if it is missing or unreadable
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+# class representing the on-disk cache of the pages converted by previous builds
+class BuildCache:
+    # constructor to initialize a BuildCache object stored at a path, for a converter version
+    def __init__(self, path, version=CONVERTER_VERSION):
+        self.path = path
+        self.version = version
+        # cached pages, by relative page path: {"mtime_ns": ..., "size": ..., "hash": ...}
+        self.pages = {}
+        self.changed = False
+
+    # method to load the cache from disk, discarding it if it is missing, unreadable or from another converter version
+    def load(self):
+        data = load_json(self.path)
+        if not isinstance(data, dict):
+            return self
+
+        if data.get("version") == self.version:
+            self.pages = data.get("pages", {})
+        else:
+            self.changed = True
+        return self
+
+    # method to save the cache to disk, if anything changed, replacing the previous file atomically
+    def save(self):
+        if not self.changed:
+            return
+
+        save_json(self.path, {"version": self.version, "pages": self.pages})
+        self.changed = False
+
+    # method to return whether a page is unchanged since it was last built, given its source path and the stat of its source
+    # (a source with a new modification time but the same size is hashed, so touched but unchanged pages are still skipped)
+    def is_unchanged(self, page_path, source_path, stat):
+        entry = self.pages.get(page_path)
+        if entry is None or entry["size"] != stat.st_size:
+            return False
+
+        if entry["mtime_ns"] == stat.st_mtime_ns:
+            return True
+
+        # compare the hash of the touched source with the cached hash, remembering the new modification time if it matches
+        try:
+            digest = hash_file(source_path)
+        except (OSError, ValueError):
+            return False
+        if digest != entry["hash"]:
+            return False
+        self.record(page_path, stat, digest)
+        return True
+
+    # method to record that a page was built from a source with the given stat and hash
+    def record(self, page_path, stat, digest):
+        self.pages[page_path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": digest}
+        self.changed = True
+
+    # method to remove a page from the cache, so it is rebuilt next time
+    def forget(self, page_path):
+        if self.pages.pop(page_path, None) is not None:
+            self.changed = True
+
+    # method to remove the pages whose sources no longer exist, returning how many were evicted
+    def evict_missing(self, page_paths):
+        current = set(page_paths)
+        missing = [page_path for page_path in self.pages if page_path not in current]
+        for page_path in missing:
+            self.forget(page_path)
+        return len(missing)
+
+    # method to remove every page from the cache, so the next build converts everything
+    def clear(self):
+        if self.pages:
+            self.pages = {}
+            self.changed = True
+
+# class representing the manifest of the files written to an output directory, so identical outputs are not rewritten
+# and outputs that no page produces any more can be deleted
+class OutputManifest:
+    # constructor to initialize an OutputManifest object stored at a path
+    def __init__(self, path):
+        self.path = path
+        # written files, by path relative to the output directory: {"hash": ..., "size": ..., "mtime_ns": ...}
+        self.outputs = {}
+        self.changed = False
+
+    # method to load the manifest from disk, starting empty if it is missing or unreadable
+    def load(self):
+        data = load_json(self.path)
+        if isinstance(data, dict):
+            self.outputs = data.get("outputs", {})
+        return self
+
+    # method to save the manifest to disk, if anything changed, replacing the previous file atomically
+    def save(self):
+        if not self.changed:
+            return
+
+        save_json(self.path, {"outputs": self.outputs})
+        self.changed = False
+
+    # method to return the entry of an output file, or None if it is not in the manifest
+    def get(self, output_path):
+        return self.outputs.get(output_path)
+
+    # method to record the hash, size and modification time of an output file
+    def record(self, output_path, digest, size, mtime_ns):
+        entry = {"hash": digest, "size": size, "mtime_ns": mtime_ns}
+        if self.outputs.get(output_path) != entry:
+            self.outputs[output_path] = entry
+            self.changed = True
+
+    # method to remove an output file from the manifest
+    def forget(self, output_path):
+        if self.outputs.pop(output_path, None) is not None:
+            self.changed = True
+
+    # method to return the output files in the manifest that are not among the given current outputs, in sorted order
+    def stale(self, output_paths):
+        current = set(output_paths)
+        return sorted(output_path for output_path in self.outputs if output_path not in current)
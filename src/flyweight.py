@@ -0,0 +1,193 @@
+import sys
+from htmlnode import LeafNode, ParentNode, FrozenProps
+from textnode import text_node_to_html_node
+
+# default maximum number of nodes in a ParentNode subtree that is still interned
+MAX_SUBTREE_SIZE = 16
+
+# function to return the properties of an html node as a hashable key
+def props_key(props):
+    if props is None:
+        return None
+    if isinstance(props, FrozenProps):
+        return props.key()
+    return tuple(props.items())
+
+# function to estimate the memory held by a single html node itself: the object, its value, its properties and its children list
+def node_size(node):
+    size = sys.getsizeof(node)
+    if node.value is not None:
+        size += sys.getsizeof(node.value)
+    if node.props is not None:
+        size += sys.getsizeof(node.props) + sys.getsizeof(props_key(node.props))
+    if node.children is not None:
+        size += sys.getsizeof(node.children)
+    return size
+
+# class representing an interning layer that shares one instance of each structurally identical LeafNode and small ParentNode
+# subtree, and caches the rendered html of each shared node
+# (interned nodes are shared between trees, so they must not be modified after interning)
+class NodeInterner:
+    # constructor to initialize an empty NodeInterner object, interning ParentNode subtrees of at most max_subtree_size nodes
+    def __init__(self, max_subtree_size=MAX_SUBTREE_SIZE):
+        self.max_subtree_size = max_subtree_size
+        # shared nodes, by structural key: (tag, value, props key) for leaves, (tag, props key, child ids) for parents
+        self.leaves = {}
+        self.parents = {}
+        # subtree size of each shared node, by id (the shared nodes are kept alive by the tables, so their ids are stable)
+        self.sizes = {}
+        # rendered html of the shared nodes that were rendered, by id
+        self.rendered = {}
+        self.lookups = 0
+        self.duplicates = 0
+        self.bytes_saved = 0
+
+    # method to return the number of shared nodes
+    def __len__(self):
+        return len(self.leaves) + len(self.parents)
+
+    # method to return the shared node for a key, registering the given node under the key if it is new
+    def _share(self, table, key, node, size):
+        self.lookups += 1
+        shared = table.get(key)
+        if shared is None:
+            table[key] = node
+            self.sizes[id(node)] = size
+            return node
+        if shared is not node:
+            self.duplicates += 1
+            self.bytes_saved += node_size(node)
+        return shared
+
+    # method to return the shared LeafNode equal to a LeafNode, or the LeafNode itself if its properties cannot be hashed
+    def leaf_node(self, node):
+        key = (node.tag, node.value, props_key(node.props))
+        try:
+            return self._share(self.leaves, key, node, 1)
+        except TypeError:
+            self.lookups -= 1
+            return node
+
+    # method to return the shared LeafNode for a TextNode, creating it with text_node_to_html_node the first time
+    def text_node(self, text_node):
+        return self.leaf_node(text_node_to_html_node(text_node))
+
+    # method to return a ParentNode with the given (already interned) children, shared if its subtree is small enough
+    def parent_node(self, node, children):
+        # rebuild the node only if interning replaced any of its children
+        if len(children) != len(node.children) or any(new is not old for new, old in zip(children, node.children)):
+            node = ParentNode(node.tag, children, node.props)
+
+        # the subtree is small enough to share only if every child is shared
+        size = 1
+        for child in children:
+            child_size = self.sizes.get(id(child))
+            if child_size is None:
+                return node
+            size += child_size
+        if size > self.max_subtree_size:
+            return node
+
+        # shared children are identical exactly when they are the same objects, so the key can use their ids
+        key = (node.tag, props_key(node.props), tuple(id(child) for child in children))
+        try:
+            return self._share(self.parents, key, node, size)
+        except TypeError:
+            self.lookups -= 1
+            return node
+
+    # method to intern every node of an html node tree bottom-up without recursion, returning the interned tree
+    # (the given tree is left unchanged; parents whose children changed are rebuilt, and other nodes are kept as they are)
+    def intern(self, root):
+        if isinstance(root, LeafNode):
+            return self.leaf_node(root)
+        if not isinstance(root, ParentNode) or root.children is None:
+            return root
+
+        # stack of (parent, iterator over its remaining children, its interned children so far) triples
+        stack = [(root, iter(root.children), [])]
+        while True:
+            node, children, collected = stack[-1]
+
+            # intern the remaining children of the parent on top of the stack until one of them is a parent to descend into
+            for child in children:
+                if isinstance(child, LeafNode):
+                    collected.append(self.leaf_node(child))
+                elif isinstance(child, ParentNode) and child.children is not None:
+                    stack.append((child, iter(child.children), []))
+                    break
+                else:
+                    collected.append(child)
+            # once every child is interned, intern the parent and add it to its own parent's children
+            else:
+                stack.pop()
+                interned = self.parent_node(node, collected)
+                if not stack:
+                    return interned
+                stack[-1][2].append(interned)
+
+    # method to generate the html of a tree as string chunks, rendering each shared node once and reusing its cached html
+    def iter_html(self, root):
+        rendered = self.rendered
+        sizes = self.sizes
+
+        # render the root directly if it is a shared node or a leaf
+        html = self._cached_html(root)
+        if html is not None:
+            yield html
+            return
+        if not isinstance(root, ParentNode):
+            yield from root.iter_html()
+            return
+
+        # walk the unshared parents with an explicit stack, like ParentNode.iter_html, using the cache for the shared nodes
+        yield root.open_tag()
+        stack = [(root, iter(root.children))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                html = rendered.get(id(child))
+                if html is not None:
+                    yield html
+                elif id(child) in sizes:
+                    yield self._cached_html(child)
+                elif isinstance(child, ParentNode):
+                    yield child.open_tag()
+                    stack.append((child, iter(child.children)))
+                    break
+                else:
+                    yield from child.iter_html()
+            else:
+                stack.pop()
+                yield f"</{node.tag}>"
+
+    # method to return the cached html of a shared node, rendering it the first time, or None for an unshared node
+    def _cached_html(self, node):
+        key = id(node)
+        html = self.rendered.get(key)
+        if html is None and key in self.sizes:
+            html = self.rendered[key] = node.to_html()
+        return html
+
+    # method to render a tree into html, reusing the cached html of its shared nodes
+    def to_html(self, root):
+        return "".join(self.iter_html(root))
+
+    # method to return the number of interning lookups per shared node (1.0 means nothing was deduplicated)
+    def dedup_ratio(self):
+        return self.lookups / len(self) if len(self) else 1.0
+
+    # method to forget every shared node and cached html and reset the counters
+    def clear(self):
+        self.leaves.clear()
+        self.parents.clear()
+        self.sizes.clear()
+        self.rendered.clear()
+        self.lookups = 0
+        self.duplicates = 0
+        self.bytes_saved = 0
+
+    # method to return a string representation of the NodeInterner object
+    def __repr__(self):
+        return (f"NodeInterner({len(self)} shared nodes, lookups: {self.lookups}, duplicates: {self.duplicates}, "
+                f"saved: {self.bytes_saved} bytes)")
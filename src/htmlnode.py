@@ -1,31 +1,162 @@
+import sys
+from functools import lru_cache
+
+# maximum number of distinct property sets whose serialized html attributes are cached
+PROPS_CACHE_SIZE = 4096
+
+# tags of the leaf nodes created for inline text, whose opening and closing tags are formatted once at import time
+FIXED_TAGS = ("b", "i", "code", "a", "img")
+
+# (start of the opening tag, opening tag without properties, closing tag) strings of each fixed tag
+TAG_STRINGS = {tag: (sys.intern(f"<{tag}"), sys.intern(f"<{tag}>"), sys.intern(f"</{tag}>")) for tag in FIXED_TAGS}
+
+# function to escape a string for use as html text, replacing the characters that could start markup
+# (most text has none of them, so it is returned as is after a fast check for each, and only the characters found are replaced)
+def escape_text(text):
+    try:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+    except TypeError:
+        # escape values that are not strings by their string form
+        return escape_text(str(text))
+    return text
+
+# function to escape a string for use as a quoted html attribute value, replacing the quotes as well as the markup characters
+def escape_attribute(value):
+    try:
+        if "&" in value:
+            value = value.replace("&", "&amp;")
+        if "<" in value:
+            value = value.replace("<", "&lt;")
+        if ">" in value:
+            value = value.replace(">", "&gt;")
+        if '"' in value:
+            value = value.replace('"', "&quot;")
+        if "'" in value:
+            value = value.replace("'", "&#x27;")
+    except TypeError:
+        return escape_attribute(str(value))
+    return value
+
+# class representing an immutable dictionary of html properties, which can be shared and cached safely
+class FrozenProps(dict):
+    __slots__ = ("_key",)
+
+    # constructor to initialize a FrozenProps object from a dictionary of properties
+    # (the constructor runs only once, so it cannot be called again to change the properties)
+    def __init__(self, props):
+        if hasattr(self, "_key"):
+            raise TypeError("props are immutable")
+        super().__init__(props)
+        # the properties as an ordered tuple of (name, value) pairs, since attribute order matters in the html
+        self._key = tuple(props.items())
+
+    # method to return the properties as an ordered tuple of (name, value) pairs
+    def key(self):
+        return self._key
+
+    # method to hash the FrozenProps object by its ordered properties
+    def __hash__(self):
+        return hash(self._key)
+
+    # method to check equality with another FrozenProps object by its ordered properties, consistent with the hash,
+    # or with a plain dictionary of properties like a dictionary
+    def __eq__(self, other):
+        if isinstance(other, FrozenProps):
+            return self._key == other._key
+        return dict.__eq__(self, other)
+
+    # method to check inequality, the negation of __eq__
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    # method to pickle and copy the FrozenProps object by its plain dictionary of properties
+    def __reduce__(self):
+        return FrozenProps, (dict(self),)
+
+    # method to raise an exception for any attempt to modify the FrozenProps object
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("props are immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+# function to convert a dictionary of properties into a FrozenProps object, leaving None and FrozenProps objects unchanged
+def freeze_props(props):
+    if props is None or isinstance(props, FrozenProps):
+        return props
+    return FrozenProps(props)
+
+# function to convert an ordered tuple of (name, value) property pairs into a string of html attributes with escaped values
+def serialize_props(items):
+    # initialize an empty list to hold the formatted attributes
+    attributes = []
+
+    # for each property, append a formatted attribute string with the escaped value
+    for name, value in items:
+        attributes.append(f' {name}="{escape_attribute(value)}"')
+
+    # return the final string of html attributes
+    return "".join(attributes)
+
+# cached version of serialize_props, keyed by the ordered property pairs, with bounded LRU eviction
+cached_serialize_props = lru_cache(maxsize=PROPS_CACHE_SIZE)(serialize_props)
+
+# function to return the hit and miss counters and the size of the property serialization cache
+def props_cache_info():
+    return cached_serialize_props.cache_info()
+
+# function to empty the property serialization cache and reset its counters
+def clear_props_cache():
+    cached_serialize_props.cache_clear()
+
 # class representing a node in an html document tree
 class HTMLNode:
+    # store attributes in fixed slots instead of a per-instance dictionary to keep large trees compact
+    __slots__ = ("tag", "value", "children", "props")
+
     # constructor to initialize an HTMLNode object with attributes (tag, value, children, and properties)
     def __init__(self, tag=None, value=None, children=None, props=None):
         self.tag = tag
         self.value = value
         self.children = children
-        self.props = props
+        self.props = freeze_props(props)
 
-    # method to convert the HTMLNode object into html (to be implemented by subclass)
+    # method to convert the HTMLNode object into html
     def to_html(self):
-        raise NotImplementedError("to_html method not implemented") 
+        return "".join(self.iter_html())
+
+    # method to generate the html of the HTMLNode object as a sequence of string chunks (to be implemented by subclass)
+    def iter_html(self):
+        raise NotImplementedError("iter_html method not implemented")
+
+    # method to write the html of the HTMLNode object chunk by chunk to a file-like sink with a write method
+    def write_html(self, sink):
+        for chunk in self.iter_html():
+            sink.write(chunk)
     
     # method to convert the properties of the HTMLNode object into a string of html attributes
     def props_to_html(self):
         # if there are no properties, return an empty string
         if self.props is None:
             return ""
-        
-        # initialize an empty string
-        props_html = ""
-
-        # for each property in the props dictionary, append a formatted string to the props_html string
-        for prop in self.props:
-            props_html += f' {prop}="{self.props[prop]}"'
-            
-        # return the final string of html attributes
-        return props_html
+
+        # get the properties as an ordered tuple of (name, value) pairs
+        if isinstance(self.props, FrozenProps):
+            items = self.props.key()
+        else:
+            items = tuple(self.props.items())
+
+        # return the cached string of html attributes, or serialize it directly if a value cannot be hashed
+        try:
+            return cached_serialize_props(items)
+        except TypeError:
+            return serialize_props(items)
         
     # method to return a string representation of the HTMLNode object
     def __repr__(self):
@@ -33,22 +164,38 @@ class HTMLNode:
 
 # subclass of HTMLNode representing a leaf node in an html document tree
 class LeafNode(HTMLNode):
+    __slots__ = ()
+
     # constructor to initialize a LeafNode object with attributes (tag, value, and properties)
     def __init__(self, tag, value, props=None):
         super().__init__(tag, value, None, props)
 
-    # method to convert the LeafNode object into html
+    # method to convert the LeafNode object into html, escaping its value
     def to_html(self):
         # if the LeafNode object has no value, raise an exception with an message
-        if self.value is None:
+        value = self.value
+        if value is None:
             raise ValueError("invalid HTML: no value")
         
-        # if the LeafNode object has no tag, return just the value
-        if self.tag is None:
-            return self.value
-        
-        # return the rendered html string
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+        # if the LeafNode object has no tag, return just the escaped value
+        value = escape_text(value)
+        tag = self.tag
+        if tag is None:
+            return value
+
+        # for tags other than the fixed tags, return the rendered html string
+        strings = TAG_STRINGS.get(tag)
+        if strings is None:
+            return f"<{tag}{self.props_to_html()}>{value}</{tag}>"
+
+        # otherwise, join the value with the precomputed tags
+        if self.props is None:
+            return f"{strings[1]}{value}{strings[2]}"
+        return f"{strings[0]}{self.props_to_html()}>{value}{strings[2]}"
+
+    # method to generate the html of the LeafNode object as a single chunk
+    def iter_html(self):
+        yield self.to_html()
     
     # method to return a string representation of the LeafNode object
     def __repr__(self):
@@ -56,30 +203,96 @@ class LeafNode(HTMLNode):
 
 # subclass of HTMLNode representing a parent node in an html document tree
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     # constructor to initialize a ParentNode object with attributes (tag, children, and properties)
     def __init__(self, tag, children, props=None):
         super().__init__(tag, None, children, props)
 
-    # method to convert the ParentNode object into html
-    def to_html(self):
+    # method to generate the html of the ParentNode object as a sequence of string chunks
+    def iter_html(self):
+        # yield the opening tag of this node
+        yield self.open_tag()
+
+        # initialize a stack of (node, iterator over its remaining children) pairs, so deeply nested trees do not hit the recursion limit
+        stack = [(self, iter(self.children))]
+
+        # while there are nodes on the stack
+        while stack:
+            node, children = stack[-1]
+
+            # render the remaining children of the node on top of the stack until one of them is a parent node
+            for child in children:
+                # for leaf nodes, yield their html as a single chunk
+                if isinstance(child, LeafNode):
+                    yield child.to_html()
+                # for parent nodes, yield the opening tag and continue with their children first
+                elif isinstance(child, ParentNode):
+                    yield child.open_tag()
+                    stack.append((child, iter(child.children)))
+                    break
+                # for any other node, let it generate its own chunks
+                else:
+                    yield from child.iter_html()
+            # if the node has no children left, pop it and yield its closing tag
+            else:
+                stack.pop()
+                yield f"</{node.tag}>"
+
+    # method to validate the ParentNode object and return its opening tag
+    def open_tag(self):
         # if the ParentNode object has no tag, raise an exception with an message
         if self.tag is None:
             raise ValueError("invalid HTML: no tag")
-        
+
         # if the ParentNode object has no children, raise an exception with an message
         if self.children is None:
             raise ValueError("invalid HTML: no children")
-        
-        # initialize an empty string to hold the rendered html of the child nodes
-        child_html = ""
-        
-        # for each child node in the children list, recursively call its to_html method and append the result to the child_html string
-        for child in self.children:
-            child_html += child.to_html()
 
-        # return the rendered html string
-        return f"<{self.tag}{self.props_to_html()}>{child_html}</{self.tag}>"
+        # return the opening tag with its properties
+        return f"<{self.tag}{self.props_to_html()}>"
 
     # method to return a string representation of the ParentNode object
     def __repr__(self):
         return f"ParentNode({self.tag}, children: {self.children}, {self.props})"
+
+# function to walk an html node tree without recursion, yielding (node, entering) pairs in document order:
+# nodes with children are yielded as (node, True) before their children and (node, False) after them,
+# and nodes without children are yielded once as (node, True)
+def walk(root):
+    # yield the root node
+    yield root, True
+
+    # if the root node has no children, there is nothing more to walk
+    if root.children is None:
+        return
+
+    # initialize a stack of (node, iterator over its remaining children) pairs
+    stack = [(root, iter(root.children))]
+
+    # while there are nodes on the stack
+    while stack:
+        node, children = stack[-1]
+
+        # yield the remaining children of the node on top of the stack until one of them has children of its own
+        for child in children:
+            yield child, True
+
+            # push the child onto the stack and continue with its children first
+            if child.children is not None:
+                stack.append((child, iter(child.children)))
+                break
+        # if the node has no children left, pop it and yield it again on the way up
+        else:
+            stack.pop()
+            yield node, False
+
+# function to iterate over every node in an html node tree in document order without recursion
+def iter_nodes(root):
+    for node, entering in walk(root):
+        if entering:
+            yield node
+
+# function to count the nodes in an html node tree without recursion
+def count_nodes(root):
+    return sum(1 for _ in iter_nodes(root))
@@ -0,0 +1,181 @@
+from textnode import TextNode, TextType, text_node_to_html_node
+from htmlnode import escape_text, escape_attribute
+import re
+
+# regex pattern to match markdown image syntax (groups 1 and 2) or link syntax (groups 3 and 4) in a single scan
+IMAGE_OR_LINK_PATTERN = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)|(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+# text types looked up once at import time, since enum attribute access is comparatively slow in the inner loops below
+PLAIN_TEXT = TextType.PLAIN_TEXT
+BOLD_TEXT = TextType.BOLD_TEXT
+ITALIC_TEXT = TextType.ITALIC_TEXT
+CODE_TEXT = TextType.CODE_TEXT
+IMAGE = TextType.IMAGE
+LINK = TextType.LINK
+
+# function to find the inline markdown spans of a string, returning a list of (text type, start, end, url start, url end) tuples
+# (offsets index into the text and are shifted by the given offset, and url offsets are -1 for spans without a url)
+def inline_spans(text, offset=0):
+    # initialize an empty list to hold the spans
+    spans = []
+    append = spans.append
+
+    # split the text into bold sections; odd sections are bold
+    bold_sections = text.split("**")
+    if len(bold_sections) % 2 == 0:
+        raise ValueError("invalid markdown, formatted section not closed")
+
+    # for each bold section, tracking its offset in the text
+    for i, bold_section in enumerate(bold_sections):
+        start = offset
+        offset += len(bold_section) + 2
+
+        # if the section is empty, continue to the next section
+        if bold_section == "":
+            continue
+
+        # if the section is bold, add it as a single span
+        if i % 2 == 1:
+            append((BOLD_TEXT, start, offset - 2, -1, -1))
+            continue
+
+        # split the plain section into italic sections; odd sections are italic
+        italic_sections = bold_section.split("_")
+        if len(italic_sections) % 2 == 0:
+            raise ValueError("invalid markdown, formatted section not closed")
+
+        for j, italic_section in enumerate(italic_sections):
+            italic_start = start
+            start += len(italic_section) + 1
+
+            if italic_section == "":
+                continue
+
+            if j % 2 == 1:
+                append((ITALIC_TEXT, italic_start, start - 1, -1, -1))
+                continue
+
+            # split the plain section into code sections; odd sections are code
+            code_sections = italic_section.split("`")
+            if len(code_sections) % 2 == 0:
+                raise ValueError("invalid markdown, formatted section not closed")
+
+            for k, code_section in enumerate(code_sections):
+                code_start = italic_start
+                italic_start += len(code_section) + 1
+
+                if code_section == "":
+                    continue
+
+                if k % 2 == 1:
+                    append((CODE_TEXT, code_start, italic_start - 1, -1, -1))
+                    continue
+
+                # if the plain section cannot contain an image or a link, add it as a single span
+                if "[" not in code_section:
+                    append((PLAIN_TEXT, code_start, italic_start - 1, -1, -1))
+                    continue
+
+                # otherwise, split it at each image or link
+                plain_start = 0
+                for match in IMAGE_OR_LINK_PATTERN.finditer(code_section):
+                    # if there is text before the image or link, add it as a plain span
+                    if match.start() > plain_start:
+                        append((PLAIN_TEXT, code_start + plain_start, code_start + match.start(), -1, -1))
+
+                    # add the image or link span, with its text and url offsets
+                    if match.lastindex == 2:
+                        append((IMAGE, code_start + match.start(1), code_start + match.end(1), code_start + match.start(2), code_start + match.end(2)))
+                    else:
+                        append((LINK, code_start + match.start(3), code_start + match.end(3), code_start + match.start(4), code_start + match.end(4)))
+
+                    plain_start = match.end()
+
+                # if there is any remaining text after the last image or link, add it as a plain span
+                if plain_start < len(code_section):
+                    append((PLAIN_TEXT, code_start + plain_start, italic_start - 1, -1, -1))
+
+    # return the final list of spans
+    return spans
+
+# function to convert a string of markdown-formatted text into a list of TextNode objects in a single fused pass
+# (produces exactly the same nodes as textnode.text_to_textnodes, which is kept as the reference implementation,
+# but splits each section only once and creates each TextNode only once)
+def parse_inline(text):
+    return [
+        TextNode(text[start:end], text_type, text[url_start:url_end] if url_start >= 0 else None)
+        for text_type, start, end, url_start, url_end in inline_spans(text)
+    ]
+
+# html format of each text type, filled with the node text and url, and the function escaping the text for its context (image
+# text is an attribute value), matching the html of text_node_to_html_node(node).to_html()
+# (looked up once per node through this table, instead of creating a LeafNode and serializing its props for every node)
+INLINE_FORMATS = {
+    PLAIN_TEXT: ("{0}".format, escape_text),
+    BOLD_TEXT: ("<b>{0}</b>".format, escape_text),
+    ITALIC_TEXT: ("<i>{0}</i>".format, escape_text),
+    CODE_TEXT: ("<code>{0}</code>".format, escape_text),
+    LINK: ('<a href="{1}">{0}</a>'.format, escape_text),
+    IMAGE: ('<img src="{1}" alt="{0}"></img>'.format, escape_attribute),
+}
+
+# function to convert many TextNode objects into html, returning a list with the html of each node
+# (the same html as text_node_to_html_node(node).to_html() for each node)
+def render_many(nodes):
+    formats = INLINE_FORMATS
+    html = []
+    append = html.append
+
+    for node in nodes:
+        text = node.text
+        text_type = node.text_type
+        entry = formats.get(text_type) if isinstance(text_type, TextType) else None
+
+        # render text types registered with register_text_type through their factories (raising an exception for invalid ones)
+        if entry is None:
+            append(text_node_to_html_node(node).to_html())
+            continue
+
+        # a node without text cannot be rendered, as with a LeafNode without a value (images have their text as an attribute)
+        if text is None and text_type is not IMAGE:
+            raise ValueError("invalid HTML: no value")
+
+        # plain text only needs escaping, and only links and images have a url
+        format, escape = entry
+        if text_type is PLAIN_TEXT:
+            append(escape_text(text))
+        elif text_type is LINK or text_type is IMAGE:
+            append(format(escape(text), escape_attribute(node.url)))
+        else:
+            append(format(escape(text)))
+
+    # return the final list of html strings
+    return html
+
+# function to convert many strings of markdown-formatted text into html, returning a list with the html of each string
+# (the same html as joining text_node_to_html_node(node).to_html() for the nodes of text_to_textnodes(text), but rendered
+# straight from the spans of each string without creating any TextNode or LeafNode objects)
+def texts_to_html_many(texts):
+    formats = INLINE_FORMATS
+    spans_of = inline_spans
+    html = []
+    append = html.append
+
+    for text in texts:
+        parts = []
+        add = parts.append
+
+        for text_type, start, end, url_start, url_end in spans_of(text):
+            if text_type is PLAIN_TEXT:
+                add(escape_text(text[start:end]))
+                continue
+            format, escape = formats[text_type]
+            if url_start < 0:
+                add(format(escape(text[start:end])))
+            else:
+                add(format(escape(text[start:end]), escape_attribute(text[url_start:url_end])))
+
+        append("".join(parts))
+
+    # return the final list of html strings
+    return html
@@ -0,0 +1,169 @@
+import cProfile
+import functools
+import os
+import sys
+import time
+from contextlib import contextmanager
+import textnode
+import inline
+import page
+import blocks
+from htmlnode import HTMLNode, LeafNode
+
+# directory of the generator's modules, whose imported references to the instrumented functions are also replaced
+SOURCE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# functions instrumented as pipeline stages, by stage name
+FUNCTION_STAGES = {
+    "markdown_to_blocks": textnode.markdown_to_blocks,
+    "parse_blocks": blocks.parse_blocks,
+    "text_to_textnodes": textnode.text_to_textnodes,
+    "split_nodes_delimiter": textnode.split_nodes_delimiter,
+    "split_nodes_image": textnode.split_nodes_image,
+    "split_nodes_link": textnode.split_nodes_link,
+    "parse_inline": inline.parse_inline,
+    "text_node_to_html_node": textnode.text_node_to_html_node,
+    "markdown_to_html_node": page.markdown_to_html_node,
+}
+
+# render methods instrumented as pipeline stages, by stage name
+METHOD_STAGES = {
+    "HTMLNode.to_html": (HTMLNode, "to_html"),
+    "HTMLNode.write_html": (HTMLNode, "write_html"),
+    "LeafNode.to_html": (LeafNode, "to_html"),
+}
+
+# class holding the statistics recorded for one pipeline stage
+class StageStats:
+    __slots__ = ("calls", "seconds", "nodes", "bytes", "depth")
+
+    # constructor to initialize a StageStats object with empty counters
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.nodes = 0
+        self.bytes = 0
+        self.depth = 0
+
+    # method to return a string representation of the StageStats object
+    def __repr__(self):
+        return f"StageStats(calls: {self.calls}, seconds: {self.seconds}, nodes: {self.nodes}, bytes: {self.bytes})"
+
+# statistics of every stage, by stage name
+STAGES = {}
+
+# list of (owner, attribute name, original value) entries replaced while instrumentation is enabled
+_patches = []
+
+# function to count the nodes and bytes produced by a stage from its return value
+def measure_output(result):
+    # strings count as bytes of output
+    if isinstance(result, str):
+        return 0, len(result)
+
+    # lists count as nodes, and lists of strings also as bytes
+    if isinstance(result, list):
+        return len(result), sum(len(item) for item in result if isinstance(item, str))
+
+    # nodes returned on their own count as a single node
+    if result is not None:
+        return 1, 0
+
+    return 0, 0
+
+# function to wrap a function so that each call is recorded in the statistics of a stage
+def instrument(name, function):
+    stats = STAGES.setdefault(name, StageStats())
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        # time the call, counting only the outermost call when a stage calls itself
+        stats.depth += 1
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.depth -= 1
+        if stats.depth == 0:
+            stats.seconds += elapsed
+
+        # count the call and its output
+        stats.calls += 1
+        nodes, size = measure_output(result)
+        stats.nodes += nodes
+        stats.bytes += size
+        return result
+
+    return wrapper
+
+# function to replace an attribute of an object, remembering the original so it can be restored
+def _patch(owner, attribute, value):
+    _patches.append((owner, attribute, getattr(owner, attribute)))
+    setattr(owner, attribute, value)
+
+# function to return whether the instrumentation is enabled
+def is_enabled():
+    return bool(_patches)
+
+# function to enable the instrumentation by wrapping every stage
+# (the functions are left untouched while disabled, so there is no overhead unless it is enabled)
+def enable():
+    if is_enabled():
+        return
+
+    # the generator's modules, which may hold their own references to the instrumented functions
+    modules = [
+        module for module in list(sys.modules.values())
+        if os.path.dirname(os.path.abspath(getattr(module, "__file__", None) or os.devnull)) == SOURCE_DIRECTORY
+    ]
+
+    # replace every reference to each instrumented function with its wrapper
+    for name, function in FUNCTION_STAGES.items():
+        wrapper = instrument(name, function)
+        for module in modules:
+            for attribute, value in list(vars(module).items()):
+                if value is function:
+                    _patch(module, attribute, wrapper)
+
+    # replace each instrumented method on its class
+    for name, (cls, attribute) in METHOD_STAGES.items():
+        _patch(cls, attribute, instrument(name, cls.__dict__[attribute]))
+
+# function to disable the instrumentation, restoring the original functions and methods
+def disable():
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        setattr(owner, attribute, original)
+
+# function to clear the statistics of every stage
+def reset():
+    for stats in STAGES.values():
+        stats.__init__()
+
+# context manager to enable the instrumentation for the duration of a block
+@contextmanager
+def enabled():
+    enable()
+    try:
+        yield STAGES
+    finally:
+        disable()
+
+# function to format the statistics of every stage that was called as a text report
+def format_report():
+    lines = [f"{'stage':<24}{'calls':>10}{'total ms':>12}{'mean us':>12}{'nodes':>12}{'bytes':>14}"]
+    for name, stats in STAGES.items():
+        if stats.calls == 0:
+            continue
+        mean = stats.seconds / stats.calls * 1e6
+        lines.append(f"{name:<24}{stats.calls:>10}{stats.seconds * 1000:>12.2f}{mean:>12.2f}{stats.nodes:>12}{stats.bytes:>14}")
+    return "\n".join(lines)
+
+# function to run a function under cProfile and dump the statistics to a pstats file, returning the function's result
+def run_with_cprofile(function, path, *args, **kwargs):
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(function, *args, **kwargs)
+    finally:
+        profile.dump_stats(path)
@@ -1,8 +1,129 @@
+import argparse
+import os
+import sys
 from textnode import TextNode, TextType
+from page import markdown_to_html
+from build import build_site, DEFAULT_CHUNK_SIZE
+from watch import watch, DEFAULT_INTERVAL, DEFAULT_DEBOUNCE, DEFAULT_SWEEP_INTERVAL
+from aio import DEFAULT_IO_THREADS
+from assets import sync_assets, ASSET_MODES
+import instrumentation
 
-def main():
-    # create an instance of TextNode and print its string representation
+# function to parse the command line arguments
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="static site generator")
+    parser.add_argument("--profile", action="store_true", help="print per-stage timings of the conversion pipeline (in this process only)")
+    parser.add_argument("--profile-output", help="path of a pstats file to write a cProfile of the run to")
+    commands = parser.add_subparsers(dest="command")
+
+    # command to convert a single markdown file
+    convert = commands.add_parser("convert", help="convert a markdown file and print the html")
+    convert.add_argument("markdown", help="path of the markdown file")
+
+    # command to build a whole site
+    build = commands.add_parser("build", help="build every markdown page under a content directory")
+    build.add_argument("content", help="directory containing the markdown pages")
+    build.add_argument("output", help="directory to write the html pages to")
+    build.add_argument("--workers", type=int, help="number of worker processes (default: one per CPU core)")
+    build.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="number of pages sent to a worker at a time")
+    build.add_argument("--cache", help="path of the build cache (default: OUTPUT.cache.json next to the output directory)")
+    build.add_argument("--no-cache", action="store_true", help="convert every page without reading or writing the build cache")
+    build.add_argument("--force", action="store_true", help="convert every page, ignoring the build cache")
+    build.add_argument("--manifest", help="path of the output manifest (default: OUTPUT.manifest.json next to the output directory)")
+    build.add_argument("--no-manifest", action="store_true", help="write every output file and keep stale outputs")
+    build.add_argument("--template", help="path of an html page template with {{ title }}, {{ content }} and {{ nav }} slots")
+    build.add_argument("--static", help="directory of static assets (images, styles, ...) to sync into the output directory")
+    build.add_argument("--asset-mode", choices=ASSET_MODES, default="copy",
+                       help="how changed assets are put into the output directory: copy them, copy them with copy_file_range, or hardlink them")
+    build.add_argument("--io-threads", type=int, default=DEFAULT_IO_THREADS,
+                       help="threads reading and writing files in each worker, overlapping with conversion (0 reads and writes one file at a time)")
+    build.add_argument("--split-size", type=int,
+                       help="convert pages of at least this many bytes with chunks of their blocks spread across the workers")
+
+    # command to build a site, serve it with live reload and rebuild the pages that change
+    watch = commands.add_parser("watch", help="build a site, serve it with live reload and rebuild pages as they change")
+    watch.add_argument("content", help="directory containing the markdown pages")
+    watch.add_argument("output", help="directory to write the html pages to")
+    watch.add_argument("--host", default="127.0.0.1", help="address of the preview server")
+    watch.add_argument("--port", type=int, default=8000, help="port of the preview server (0 picks a free port)")
+    watch.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between polls of the content directory")
+    watch.add_argument("--sweep-interval", type=float, default=DEFAULT_SWEEP_INTERVAL,
+                       help="seconds between full sweeps that stat every page, catching pages edited in place")
+    watch.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="seconds to wait for a burst of changes to end before rebuilding")
+    watch.add_argument("--cache", help="path of the build cache kept up to date by every rebuild (default: OUTPUT.cache.json)")
+    watch.add_argument("--no-cache", action="store_true", help="convert every page in the initial build, without reading or writing the build cache")
+    watch.add_argument("--manifest", help="path of the output manifest kept up to date by every rebuild (default: OUTPUT.manifest.json)")
+    watch.add_argument("--no-manifest", action="store_true", help="write every output file and keep stale outputs")
+    watch.add_argument("--template", help="path of an html page template with {{ title }}, {{ content }} and {{ nav }} slots")
+
+    return parser.parse_args(argv)
+
+# function to return the default build cache path for an output directory: a file next to it, so it is not deployed with the site
+def default_cache_path(output_dir):
+    return os.path.normpath(os.path.abspath(output_dir)) + ".cache.json"
+
+# function to return the default output manifest path for an output directory, next to it like the build cache
+def default_manifest_path(output_dir):
+    return os.path.normpath(os.path.abspath(output_dir)) + ".manifest.json"
+
+# function to run the generator on the parsed arguments, returning the exit status
+def run(args):
+    # convert a markdown file and print the html
+    if args.command == "convert":
+        with open(args.markdown, encoding="utf-8") as file:
+            print(markdown_to_html(file.read()))
+        return 0
+
+    # build a site and print the report
+    if args.command == "build":
+        cache_path = None if args.no_cache else args.cache or default_cache_path(args.output)
+        manifest_path = None if args.no_manifest else args.manifest or default_manifest_path(args.output)
+        report = build_site(args.content, args.output, args.workers, args.chunk_size, cache_path, args.force, args.template,
+                            args.io_threads, manifest_path, args.split_size)
+        print(report.format())
+        ok = report.ok()
+
+        # sync the static assets, copying or linking only the ones that changed
+        if args.static:
+            assets = sync_assets(args.static, args.output, args.asset_mode, max(1, args.io_threads))
+            print(assets.format())
+            ok = ok and assets.ok()
+        return 0 if ok else 1
+
+    # build a site, then serve it and rebuild the changed pages until interrupted
+    if args.command == "watch":
+        cache_path = None if args.no_cache else args.cache or default_cache_path(args.output)
+        manifest_path = None if args.no_manifest else args.manifest or default_manifest_path(args.output)
+        try:
+            watch(args.content, args.output, args.host, args.port, args.interval, args.debounce, cache_path,
+                  template_path=args.template, sweep_interval=args.sweep_interval, manifest_path=manifest_path)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    # if no command is given, create an instance of TextNode and print its string representation
     node = TextNode("This is a text node", TextType.BOLD_TEXT, "https://www.boot.dev")
     print(node)
+    return 0
+
+# function to run the generator from the command line, returning the exit status
+def main(argv=None):
+    args = parse_args(argv)
+
+    # enable the per-stage instrumentation, if requested
+    if args.profile:
+        instrumentation.enable()
+
+    try:
+        # run the generator, under cProfile if requested
+        if args.profile_output:
+            return instrumentation.run_with_cprofile(run, args.profile_output, args)
+        return run(args)
+    finally:
+        # print the per-stage report to stderr, so it does not mix with the html output
+        if args.profile:
+            instrumentation.disable()
+            print(instrumentation.format_report(), file=sys.stderr)
 
-main()
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+from collections import OrderedDict
+import hashlib
+from htmlnode import ParentNode
+from blocks import parse_blocks, block_to_html_node
+
+# default maximum number of rendered blocks kept by a BlockCache
+BLOCK_CACHE_SIZE = 10000
+
+# default number of markdown characters in each chunk of blocks of a document rendered in parallel
+SPLIT_CHUNK_SIZE = 1 << 20
+
+# class representing a bounded LRU cache of rendered html fragments, keyed by a hash of the source text of each markdown block
+# (the type of a block and its content ranges follow from its text alone, so blocks with the same text render the same html)
+class BlockCache:
+    # constructor to initialize an empty BlockCache object holding at most max_size fragments
+    def __init__(self, max_size=BLOCK_CACHE_SIZE):
+        self.max_size = max_size
+        self.fragments = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # method to return the number of fragments in the BlockCache object
+    def __len__(self):
+        return len(self.fragments)
+
+    # method to return the html fragment of a Block object found in a markdown source, rendering and caching it if it is not cached yet
+    def render(self, source, block):
+        # key the block by a short digest of its text, so the cache does not hold a copy of every block's text
+        key = hashlib.blake2b(source[block.start:block.end].encode("utf-8"), digest_size=16).digest()
+
+        # if the block is cached, mark it as most recently used and return its fragment
+        fragment = self.fragments.get(key)
+        if fragment is not None:
+            self.hits += 1
+            self.fragments.move_to_end(key)
+            return fragment
+
+        # otherwise, render the block and cache its fragment, evicting the least recently used one if the cache is full
+        self.misses += 1
+        fragment = block_to_html_node(source, block).to_html()
+        self.fragments[key] = fragment
+        if len(self.fragments) > self.max_size:
+            self.fragments.popitem(last=False)
+            self.evictions += 1
+        return fragment
+
+    # method to return the fraction of lookups that were served from the cache
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    # method to empty the BlockCache object and reset its counters
+    def clear(self):
+        self.fragments.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # method to return a string representation of the BlockCache object
+    def __repr__(self):
+        return f"BlockCache({len(self.fragments)}/{self.max_size}, hits: {self.hits}, misses: {self.misses}, evictions: {self.evictions})"
+
+# function to convert a markdown document into a div ParentNode containing a node for each block
+def markdown_to_html_node(markdown):
+    return ParentNode("div", [block_to_html_node(markdown, block) for block in parse_blocks(markdown)])
+
+# function to convert a markdown document into an html string
+# (with a block cache, only blocks that are not cached yet are converted and rendered)
+def markdown_to_html(markdown, block_cache=None):
+    if block_cache is None:
+        return markdown_to_html_node(markdown).to_html()
+    return "<div>" + "".join([block_cache.render(markdown, block) for block in parse_blocks(markdown)]) + "</div>"
+
+# function to split a markdown document into chunks of whole blocks of about the given number of characters, returning the
+# source text of each chunk in document order
+# (each chunk runs from the start of its first block to the end of its last, and the blocks of a chunk of source text are
+# found again exactly as they were in the whole document, since the type and extent of a block follow from its text alone)
+def split_markdown(markdown, chunk_size=SPLIT_CHUNK_SIZE):
+    chunks = []
+    chunk_start = None
+
+    for block in parse_blocks(markdown):
+        if chunk_start is None:
+            chunk_start = block.start
+        # close the chunk once it reaches the chunk size
+        if block.end - chunk_start >= chunk_size:
+            chunks.append(markdown[chunk_start:block.end])
+            chunk_start = None
+
+    # add the last, partly filled chunk
+    if chunk_start is not None:
+        chunks.append(markdown[chunk_start:block.end])
+    return chunks
+
+# function to convert a chunk of markdown blocks into the html fragment of its blocks, without the div around the document
+def render_fragment(markdown):
+    return "".join([block_to_html_node(markdown, block).to_html() for block in parse_blocks(markdown)])
+
+# function to submit chunks of the blocks of a markdown document to an executor, such as a pool of worker processes, returning
+# the futures of their html fragments in document order
+def submit_markdown(markdown, executor, chunk_size=SPLIT_CHUNK_SIZE):
+    return [executor.submit(render_fragment, chunk) for chunk in split_markdown(markdown, chunk_size)]
+
+# function to wait for the futures of the html fragments of a document's chunks, returning the html of the document
+def join_fragments(futures):
+    return "<div>" + "".join([future.result() for future in futures]) + "</div>"
+
+# function to convert a markdown document into an html string by rendering chunks of its blocks in an executor and joining
+# their fragments in document order
+# (gives the same html as markdown_to_html, while a single large document keeps several cores busy)
+def markdown_to_html_parallel(markdown, executor, chunk_size=SPLIT_CHUNK_SIZE):
+    return join_fragments(submit_markdown(markdown, executor, chunk_size))
@@ -0,0 +1,238 @@
+from array import array
+import struct
+import sys
+from textnode import TextNode, TextType
+from htmlnode import LeafNode, ParentNode, FrozenProps
+
+# magic bytes and format version at the start of every serialized document
+MAGIC = b"SSGN"
+VERSION = 1
+
+# header: magic, version, array typecode of the integers, whether the root is a list, number of root nodes,
+# number of integers, number of text bytes
+# (the integers are stored little-endian)
+HEADER = struct.Struct("<4sBcBIII")
+
+# record codes: a TextNode is coded by the position of its text type in TextType, html nodes follow the text types
+TEXT_TYPES = list(TextType)
+TEXT_TYPE_CODES = {text_type: code for code, text_type in enumerate(TEXT_TYPES)}
+LEAF = len(TEXT_TYPES)
+PARENT = LEAF + 1
+
+# function to return the smallest unsigned array typecode that can hold every integer in a list
+def integer_typecode(integers):
+    largest = max(integers, default=0)
+    if largest < 1 << 8:
+        return "B"
+    if largest < 1 << 16:
+        return "H"
+    return "I"
+
+# function to serialize a TextNode, an html node, or a list of them, into compact bytes
+# layout: a header, then one array of integers and one utf-8 text blob. The integers start with the interned table
+# (the number of tags and property names, then the length of each), followed by a record per root node and its descendants
+# in pre-order:
+#   TextNode:   type code, text length, url length + 1 (0 for no url)
+#   LeafNode:   LEAF, tag index + 1 (0 for no tag), value length + 1, properties
+#   ParentNode: PARENT, tag index + 1, properties, number of children, then the children
+#   properties: number of properties + 1 (0 for no props), then name index and value length + 1 for each property
+# every string length counts characters of the decoded text blob, in the order the strings are stored
+def dumps(root):
+    # interned tags and property names, by name
+    table = {}
+    integers = []
+    texts = []
+    append = integers.append
+    add_text = texts.append
+
+    # function to append an optional string: its length + 1 in the integers and its text in the blob
+    def optional_text(value):
+        if value is None:
+            append(0)
+        elif isinstance(value, str):
+            append(len(value) + 1)
+            add_text(value)
+        else:
+            raise ValueError(f"invalid string: {value!r}")
+
+    # function to append the index + 1 of an optional interned name, adding it to the table if needed
+    def interned(name):
+        if name is None:
+            append(0)
+            return
+        index = table.get(name)
+        if index is None:
+            if not isinstance(name, str):
+                raise ValueError(f"invalid name: {name!r}")
+            index = table[name] = len(table)
+        append(index + 1)
+
+    # function to append the properties of an html node
+    def properties(props):
+        if props is None:
+            append(0)
+            return
+        append(len(props) + 1)
+        for name, value in props.items():
+            interned(name)
+            optional_text(value)
+
+    # walk the nodes in pre-order with an explicit stack, so deep trees do not hit the recursion limit
+    is_list = isinstance(root, list)
+    stack = list(reversed(root)) if is_list else [root]
+    roots = len(stack)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, TextNode):
+            code = TEXT_TYPE_CODES.get(node.text_type)
+            if code is None:
+                raise ValueError(f"invalid text type: {node.text_type}")
+            if not isinstance(node.text, str):
+                raise ValueError(f"invalid string: {node.text!r}")
+            append(code)
+            append(len(node.text))
+            add_text(node.text)
+            optional_text(node.url)
+        elif isinstance(node, LeafNode):
+            append(LEAF)
+            interned(node.tag)
+            optional_text(node.value)
+            properties(node.props)
+        elif isinstance(node, ParentNode) and isinstance(node.children, list):
+            append(PARENT)
+            interned(node.tag)
+            properties(node.props)
+            append(len(node.children))
+            stack.extend(reversed(node.children))
+        else:
+            raise ValueError(f"invalid node: {node!r}")
+
+    # put the interned table in front of the records, and pack everything
+    names = list(table)
+    integers[0:0] = [len(names)] + [len(name) for name in names]
+    blob = ("".join(names) + "".join(texts)).encode("utf-8")
+    typecode = integer_typecode(integers)
+    header = HEADER.pack(MAGIC, VERSION, typecode.encode("ascii"), is_list, roots, len(integers), len(blob))
+    packed = array(typecode, integers)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return header + packed.tobytes() + blob
+
+# function to deserialize the bytes produced by dumps back into the TextNode, html node or list of them
+def loads(data):
+    # read and check the header
+    try:
+        magic, version, typecode, is_list, roots, count, blob_size = HEADER.unpack_from(data)
+        typecode = typecode.decode("ascii")
+        integers = array(typecode)
+        start = HEADER.size
+        end = start + count * integers.itemsize
+        integers.frombytes(data[start:end])
+        if sys.byteorder == "big":
+            integers.byteswap()
+        text = bytes(data[end:end + blob_size]).decode("utf-8")
+    except (struct.error, ValueError) as error:
+        raise ValueError(f"invalid serialized data: {error}")
+    if magic != MAGIC or version != VERSION or len(integers) != count or end + blob_size != len(data):
+        raise ValueError("invalid serialized data")
+
+    try:
+        return _decode(integers, text, is_list, roots)
+    except (IndexError, TypeError, StopIteration) as error:
+        raise ValueError(f"invalid serialized data: {error}")
+
+# function to rebuild the nodes from the integers and the decoded text blob of a serialized document
+# (nodes are created without calling their constructors, which only copy the decoded fields and freeze the already frozen props)
+def _decode(integers, text, is_list, count):
+    offset = 0
+    next_integer = iter(integers).__next__
+    text_types = TEXT_TYPES
+    new = object.__new__
+
+    # read the interned table
+    names = []
+    for _ in range(next_integer()):
+        length = next_integer()
+        names.append(text[offset:offset + length])
+        offset += length
+    tags = [None] + names
+
+    # read the records into the current children list; descending into a parent saves the (children list,
+    # number of children still to read) of the current level on the stack
+    roots = children = []
+    remaining = count
+    stack = []
+    while True:
+        if not remaining:
+            if not stack:
+                break
+            children, remaining = stack.pop()
+            continue
+        remaining -= 1
+
+        code = next_integer()
+        if code < LEAF:
+            # TextNode: text, then the optional url
+            length = next_integer()
+            value = text[offset:offset + length]
+            offset += length
+            length = next_integer()
+            if length:
+                url = text[offset:offset + length - 1]
+                offset += length - 1
+            else:
+                url = None
+            node = new(TextNode)
+            node.text = value
+            node.text_type = text_types[code]
+            node.url = url
+            children.append(node)
+            continue
+        if code > PARENT:
+            raise ValueError(f"invalid record code: {code}")
+
+        tag = tags[next_integer()]
+
+        # leaf value
+        value = None
+        if code == LEAF:
+            length = next_integer()
+            if length:
+                value = text[offset:offset + length - 1]
+                offset += length - 1
+
+        # properties
+        props = None
+        size = next_integer()
+        if size:
+            pairs = {}
+            for _ in range(size - 1):
+                name = tags[next_integer()]
+                length = next_integer()
+                if length:
+                    pairs[name] = text[offset:offset + length - 1]
+                    offset += length - 1
+                else:
+                    pairs[name] = None
+            props = FrozenProps(pairs)
+
+        if code == LEAF:
+            node = new(LeafNode)
+            node.children = None
+        else:
+            node = new(ParentNode)
+            node.children = []
+        node.tag = tag
+        node.value = value
+        node.props = props
+        children.append(node)
+
+        # read the children of a parent before its next sibling
+        if code == PARENT:
+            stack.append((children, remaining))
+            children = node.children
+            remaining = next_integer()
+
+    if offset != len(text) or (len(roots) != 1 and not is_list):
+        raise ValueError("invalid serialized data")
+    return roots if is_list else roots[0]
@@ -0,0 +1,100 @@
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from htmlnode import HTMLNode
+
+# pattern matching a slot placeholder such as {{ content }}, capturing the slot name
+SLOT_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# maximum number of compiled templates kept by load_template
+TEMPLATE_CACHE_SIZE = 64
+
+# class representing a template compiled into static segments and slots: parts holds the static segments with None at each slot,
+# and slots holds the (part index, slot name) of each slot, so rendering only fills in and joins the parts
+class Template:
+    # constructor to compile a Template object from the template source
+    def __init__(self, source):
+        self.digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        self.parts = []
+        self.slots = []
+
+        # split the source on the placeholders once, keeping the static text between them
+        position = 0
+        for match in SLOT_PATTERN.finditer(source):
+            if match.start() > position:
+                self.parts.append(source[position:match.start()])
+            self.slots.append((len(self.parts), match.group(1)))
+            self.parts.append(None)
+            position = match.end()
+        if position < len(source):
+            self.parts.append(source[position:])
+
+        # the distinct slot names, in order of first use
+        self.names = list(dict.fromkeys(name for index, name in self.slots))
+
+    # method to return the value of a slot, raising an exception if it is missing
+    def _value(self, values, name):
+        try:
+            return values[name]
+        except KeyError:
+            raise ValueError(f"invalid template values: missing slot {name}")
+
+    # method to render the Template object with a dictionary of slot values (strings or html nodes) into a string
+    def render(self, values):
+        parts = self.parts.copy()
+        for index, name in self.slots:
+            value = self._value(values, name)
+            parts[index] = value.to_html() if isinstance(value, HTMLNode) else value
+        return "".join(parts)
+
+    # method to write the Template object with a dictionary of slot values to a file-like sink with a write method,
+    # streaming html node values chunk by chunk instead of rendering them into a string first
+    def write(self, sink, values):
+        # check every slot before writing anything, so a missing value does not leave a partial output
+        for name in self.names:
+            self._value(values, name)
+
+        slots = iter(self.slots)
+        for part in self.parts:
+            if part is not None:
+                sink.write(part)
+                continue
+            value = values[next(slots)[1]]
+            if isinstance(value, HTMLNode):
+                value.write_html(sink)
+            else:
+                sink.write(value)
+
+    # method to return a string representation of the Template object
+    def __repr__(self):
+        return f"Template({len(self.parts) - len(self.slots)} segments, slots: {self.names})"
+
+# cache of compiled templates, by absolute path, with the (modification time, size) of the source they were compiled from
+_templates = OrderedDict()
+
+# function to load and compile a template file, reusing the compiled template until the file changes
+# (the cache lives as long as the process, so repeated builds in watch mode and in each worker compile a template once)
+def load_template(path):
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    # reuse the compiled template if the file is unchanged
+    cached = _templates.get(path)
+    if cached is not None and cached[0] == signature:
+        _templates.move_to_end(path)
+        return cached[1]
+
+    # otherwise, compile it and cache it, evicting the least recently used template if the cache is full
+    with open(path, encoding="utf-8") as file:
+        template = Template(file.read())
+    _templates[path] = (signature, template)
+    _templates.move_to_end(path)
+    if len(_templates) > TEMPLATE_CACHE_SIZE:
+        _templates.popitem(last=False)
+    return template
+
+# function to empty the cache of compiled templates
+def clear_template_cache():
+    _templates.clear()
@@ -0,0 +1,56 @@
+import unittest
+import os
+import tempfile
+from aio import convert_files
+from test_build import write_file, read_tree
+
+# helper function to convert a text file by upper-casing it, failing on text containing "bad"
+def upper(key, text):
+    if "bad" in text:
+        raise ValueError("bad text")
+    return text.upper(), len(text)
+
+# unit tests for the asynchronous bulk I/O pipeline
+class TestConvertFiles(unittest.TestCase):
+    # method to create a temporary directory with source files
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.source = os.path.join(self.directory.name, "source")
+        self.output = os.path.join(self.directory.name, "output")
+        for number in range(40):
+            write_file(os.path.join(self.source, f"{number}.txt"), f"file {number}")
+
+    # helper method to return the job of a source file, written to a destination in a nested output directory
+    def job(self, name, directory="nested"):
+        return name, os.path.join(self.source, name), os.path.join(self.output, directory, name)
+
+    # method to test that every file is converted and written, with results in job order across batches
+    def test_convert_files(self):
+        jobs = [self.job(f"{number}.txt", f"d{number % 3}") for number in range(40)]
+        results = convert_files(jobs, upper, batch_size=3, concurrency=2, threads=4)
+        self.assertEqual(results, [(f"{number}.txt", None, len(f"file {number}")) for number in range(40)])
+        tree = read_tree(self.output)
+        self.assertEqual(len(tree), 40)
+        self.assertEqual(tree[os.path.join("d1", "7.txt")], "FILE 7")
+
+    # method to test that read, conversion and write errors are reported per file without stopping the others
+    def test_errors(self):
+        write_file(os.path.join(self.source, "bad.txt"), "bad file")
+        write_file(os.path.join(self.output, "blocked"), "a file where a directory should be")
+        jobs = [self.job("0.txt"), self.job("missing.txt"), self.job("bad.txt"), self.job("1.txt", "blocked"), self.job("2.txt")]
+        results = convert_files(jobs, upper, batch_size=2)
+
+        self.assertEqual([(key, message is None) for key, message, info in results],
+                         [("0.txt", True), ("missing.txt", False), ("bad.txt", False), ("1.txt", False), ("2.txt", True)])
+        self.assertIn("FileNotFoundError", results[1][1])
+        self.assertEqual(results[2][1], "ValueError: bad text")
+        self.assertEqual(sorted(read_tree(os.path.join(self.output, "nested"))), ["0.txt", "2.txt"])
+
+    # method to test that an empty batch of jobs does nothing
+    def test_no_jobs(self):
+        self.assertEqual(convert_files([], upper), [])
+        self.assertFalse(os.path.exists(self.output))
+
+if __name__ == "__main__":
+    unittest.main()
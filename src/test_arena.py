@@ -0,0 +1,104 @@
+import unittest
+import io
+from textnode import TextNode, TextType
+from htmlnode import LeafNode, ParentNode
+from page import markdown_to_html_node
+from arena import DocumentArena, arena_from_markdown, arena_from_text_nodes, arena_from_html_node
+
+MARKDOWN = """This is **bold** and _italic_ text with `code`
+
+  An ![image](https://i.imgur.com/zjjcJKZ.png) and a [link](https://www.boot.dev)  
+
+
+
+Last paragraph
+on two lines
+"""
+
+# unit tests for the DocumentArena class and its converters
+class TestDocumentArena(unittest.TestCase):
+    # method to test that an arena parsed from markdown renders the same html as the node tree
+    def test_markdown_matches_node_tree(self):
+        arena = arena_from_markdown(MARKDOWN)
+        self.assertEqual(arena.to_html(), markdown_to_html_node(MARKDOWN).to_html())
+
+    # method to test that an arena parsed from markdown renders every block type like the node tree
+    def test_block_types_match_node_tree(self):
+        markdown = "# Title\n\n```\ncode <here>\n\nmore\n```\n> quote\n>\n> **lines**\n- a\n- _b_\n1. c\n\nText"
+        self.assertEqual(arena_from_markdown(markdown).to_html(), markdown_to_html_node(markdown).to_html())
+
+    # method to test that an arena escapes its text and urls like the node tree
+    def test_escaping_matches_node_tree(self):
+        markdown = "a < b & **c > d** and [\"x\"](/q?a=1&b='2') ![it's](/i.png)"
+        arena = arena_from_markdown(markdown)
+        self.assertEqual(arena.to_html(), markdown_to_html_node(markdown).to_html())
+        self.assertIn("a &lt; b &amp; <b>c &gt; d</b>", arena.to_html())
+        self.assertEqual(arena.text_html(arena.child_indexes(arena.child_indexes(arena.root)[0])[-1]), '<img src="/i.png" alt="it&#x27;s"></img>')
+
+    # method to test that text in an arena parsed from markdown is stored as offsets into the markdown
+    def test_text_offsets(self):
+        arena = arena_from_markdown(MARKDOWN)
+        self.assertIs(arena.source, MARKDOWN)
+        paragraph = arena.child_indexes(arena.root)[1]
+        image, plain, link = arena.child_indexes(paragraph)[1:4]
+        self.assertEqual(arena.text_type(image), TextType.IMAGE)
+        self.assertEqual(MARKDOWN[arena.starts[image]:arena.ends[image]], "image")
+        self.assertEqual(arena.url(link), "https://www.boot.dev")
+        self.assertEqual(arena.text(plain), " and a ")
+        self.assertIsNone(arena.url(plain))
+
+    # method to test converting an arena back into a node tree
+    def test_to_html_node(self):
+        node = arena_from_markdown(MARKDOWN).to_html_node()
+        self.assertEqual(node.tag, "div")
+        self.assertEqual(len(node.children), 3)
+        self.assertEqual(node.to_html(), markdown_to_html_node(MARKDOWN).to_html())
+
+    # method to test round-tripping a node tree through an arena
+    def test_from_html_node(self):
+        node = markdown_to_html_node(MARKDOWN)
+        arena = arena_from_html_node(node)
+        self.assertEqual(arena.to_html(), node.to_html())
+        self.assertEqual(repr(arena.to_html_node()), repr(node))
+
+    # method to test that nodes the arena cannot represent raise an ValueError
+    def test_from_html_node_unsupported(self):
+        with self.assertRaises(ValueError):
+            arena_from_html_node(ParentNode("div", [LeafNode("span", "text", {"class": "x"})]))
+        with self.assertRaises(ValueError):
+            arena_from_html_node(ParentNode("div", [LeafNode("b", "text")], {"class": "x"}))
+
+    # method to test round-tripping a list of TextNode objects through an arena
+    def test_text_nodes_round_trip(self):
+        text_nodes = [
+            TextNode("plain ", TextType.PLAIN_TEXT),
+            TextNode("bold", TextType.BOLD_TEXT),
+            TextNode("link", TextType.LINK, "https://www.boot.dev"),
+            TextNode("alt", TextType.IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
+        ]
+        arena = arena_from_text_nodes(text_nodes)
+        self.assertEqual(arena.to_text_nodes(), text_nodes)
+        self.assertEqual(arena.tag(arena.root), "p")
+        self.assertEqual(len(arena), 5)
+
+    # method to test writing the html of a single node to a file-like sink
+    def test_write_html(self):
+        arena = DocumentArena("hello")
+        text = arena.add_text(TextType.BOLD_TEXT, 0, 5)
+        arena.root = arena.add_element("p", [text])
+        sink = io.StringIO()
+        arena.write_html(sink)
+        self.assertEqual(sink.getvalue(), "<p><b>hello</b></p>")
+        self.assertEqual(arena.to_html(text), "<b>hello</b>")
+
+    # method to test rendering elements nested far deeper than the recursion limit
+    def test_deeply_nested(self):
+        arena = DocumentArena("x")
+        index = arena.add_text(TextType.PLAIN_TEXT, 0, 1)
+        for _ in range(50000):
+            index = arena.add_element("blockquote", [index])
+        arena.root = index
+        self.assertEqual(arena.to_html(), "<blockquote>" * 50000 + "x" + "</blockquote>" * 50000)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from assets import sync_assets, find_assets, place_asset, ASSET_MODES
+from test_build import write_file, read_tree
+import main
+
+# unit tests for syncing static assets into the output directory
+class TestSyncAssets(unittest.TestCase):
+    # method to create a temporary static directory with a few assets
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.static = os.path.join(self.directory.name, "static")
+        self.output = os.path.join(self.directory.name, "public")
+        write_file(os.path.join(self.static, "style.css"), "p { color: red; }")
+        write_file(os.path.join(self.static, "images", "logo.svg"), "<svg></svg>")
+        write_file(os.path.join(self.static, "images", "icons", "home.svg"), "<svg>home</svg>")
+
+    # helper method to move a file's modification time forward
+    def touch(self, path):
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    # method to test that assets are found recursively, in sorted order
+    def test_find_assets(self):
+        expected = [os.path.join("images", "icons", "home.svg"), os.path.join("images", "logo.svg"), "style.css"]
+        self.assertEqual(find_assets(self.static), expected)
+
+    # method to test that every asset is copied with its modification time, and that a second sync copies nothing
+    def test_copy_then_skip(self):
+        report = sync_assets(self.static, self.output, threads=2)
+        self.assertEqual((report.copied, report.linked, report.unchanged), (3, 0, 0))
+        self.assertEqual(read_tree(self.output), read_tree(self.static))
+        source = os.path.join(self.static, "style.css")
+        self.assertEqual(os.stat(os.path.join(self.output, "style.css")).st_mtime_ns, os.stat(source).st_mtime_ns)
+
+        report = sync_assets(self.static, self.output)
+        self.assertEqual((report.copied, report.unchanged), (0, 3))
+        self.assertIn("synced 3 assets", report.format())
+
+    # method to test that only a changed asset is copied
+    def test_changed_asset(self):
+        sync_assets(self.static, self.output)
+        path = os.path.join(self.static, "style.css")
+        write_file(path, "p { color: blue; }")
+        self.touch(path)
+        report = sync_assets(self.static, self.output)
+        self.assertEqual((report.copied, report.unchanged), (1, 2))
+        self.assertEqual(read_tree(self.output)["style.css"], "p { color: blue; }")
+
+    # method to test that a touched asset with the same contents is not copied, and its copy takes the new modification time
+    def test_touched_asset_hashed(self):
+        sync_assets(self.static, self.output)
+        path = os.path.join(self.static, "style.css")
+        self.touch(path)
+        self.assertEqual(sync_assets(self.static, self.output).copied, 0)
+        self.assertEqual(os.stat(os.path.join(self.output, "style.css")).st_mtime_ns, os.stat(path).st_mtime_ns)
+
+    # method to test that an asset with the same size and a different modification time but different contents is copied
+    def test_same_size_different_contents(self):
+        sync_assets(self.static, self.output)
+        path = os.path.join(self.static, "style.css")
+        write_file(path, "p { color: pink; }"[:len("p { color: red; }")])
+        self.touch(path)
+        self.assertEqual(sync_assets(self.static, self.output).copied, 1)
+        self.assertEqual(read_tree(self.output)["style.css"], read_tree(self.static)["style.css"])
+
+    # method to test that hardlink mode links the assets instead of copying them
+    def test_hardlink(self):
+        report = sync_assets(self.static, self.output, mode="hardlink")
+        self.assertEqual((report.copied, report.linked), (0, 3))
+        self.assertTrue(os.path.samefile(os.path.join(self.static, "style.css"), os.path.join(self.output, "style.css")))
+        self.assertEqual(sync_assets(self.static, self.output, mode="hardlink").unchanged, 3)
+
+    # method to test that copy_file_range mode copies the bytes
+    def test_range(self):
+        report = sync_assets(self.static, self.output, mode="range")
+        self.assertEqual(report.copied, 3)
+        self.assertEqual(read_tree(self.output), read_tree(self.static))
+        self.assertFalse(os.path.samefile(os.path.join(self.static, "style.css"), os.path.join(self.output, "style.css")))
+
+    # method to test that placing an asset leaves an asset named like a temporary file next to it untouched in every mode
+    def test_place_asset_temporary_name(self):
+        source = os.path.join(self.static, "style.css")
+        for mode in ASSET_MODES:
+            output = os.path.join(self.directory.name, mode)
+            write_file(os.path.join(output, "style.css.tmp"), "not a temporary file")
+            place_asset(source, os.path.join(output, "style.css"), mode)
+            self.assertEqual(read_tree(output), {"style.css": "p { color: red; }", "style.css.tmp": "not a temporary file"})
+
+    # method to test that an asset that cannot be written is reported without stopping the others
+    def test_errors(self):
+        write_file(os.path.join(self.output, "images"), "a file where a directory should be")
+        report = sync_assets(self.static, self.output)
+        self.assertFalse(report.ok())
+        self.assertEqual([path for path, message in report.errors], [os.path.join("images", "icons", "home.svg"), os.path.join("images", "logo.svg")])
+        self.assertEqual(report.copied, 1)
+        with self.assertRaises(ValueError):
+            sync_assets(self.static, self.output, mode="move")
+
+    # method to test the static option of the build command
+    def test_build_command(self):
+        content = os.path.join(self.directory.name, "content")
+        write_file(os.path.join(content, "index.md"), "![logo](/images/logo.svg)")
+        with redirect_stdout(io.StringIO()) as stdout:
+            status = main.main(["build", content, self.output, "--workers", "1", "--no-cache", "--no-manifest", "--static", self.static])
+        self.assertEqual(status, 0)
+        self.assertIn("synced 3 assets", stdout.getvalue())
+        self.assertEqual(sorted(read_tree(self.output)), [os.path.join("images", "icons", "home.svg"), os.path.join("images", "logo.svg"),
+                                                          "index.html", "style.css"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from textnode import markdown_to_blocks
+from bench_suite import generate_corpus, compare, run_suite
+
+# unit tests for the benchmark suite helpers
+class TestBenchSuite(unittest.TestCase):
+    # method to test that the corpus has about the requested size, is deterministic and follows the markup density
+    def test_generate_corpus(self):
+        corpus = generate_corpus(10000, 0.5, seed=1)
+        self.assertGreaterEqual(len(corpus), 10000)
+        self.assertEqual(corpus, generate_corpus(10000, 0.5, seed=1))
+        self.assertGreater(len(markdown_to_blocks(corpus)), 1)
+        self.assertNotIn("**", generate_corpus(10000, 0.0))
+
+    # method to test that only throughput drops beyond the threshold count as regressions
+    def test_compare(self):
+        baseline = {"results": {"a": {"mb_per_s": 10.0}, "b": {"mb_per_s": 10.0}, "c": {"mb_per_s": 10.0}}}
+        results = {"results": {"a": {"mb_per_s": 9.5}, "b": {"mb_per_s": 8.0}, "d": {"mb_per_s": 1.0}}}
+        regressions = compare(results, baseline, 0.1)
+        self.assertEqual([name for name, previous, current, change in regressions], ["b"])
+
+    # method to test that a small suite run records throughput for the selected benchmarks
+    def test_run_suite(self):
+        results = run_suite(2000, 0.3, 1, only=["parse_inline", "ParentNode.to_html"])
+        self.assertEqual(sorted(results["results"]), ["ParentNode.to_html", "parse_inline"])
+        for result in results["results"].values():
+            self.assertGreater(result["mb_per_s"], 0)
+            self.assertGreater(result["nodes"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from blocks import Block, BlockType, parse_blocks, block_to_html_node
+from page import markdown_to_html, BlockCache
+
+# document with every block type, including a fenced code block with blank lines and blocks without blank lines between them
+MARKDOWN = """# The **title**
+
+Some text
+on two lines
+## Subtitle
+
+```
+def f():
+
+    return "<b>"
+```
+
+> a quote
+>
+> on _two_ lines
+
+- first
+* second
+1. one
+2. two
+"""
+
+# unit tests for the block line scanner and the block converters
+class TestParseBlocks(unittest.TestCase):
+    # method to test that every block type is found with its source ranges
+    def test_block_types(self):
+        blocks = parse_blocks(MARKDOWN)
+        self.assertEqual([(block.block_type, block.level) for block in blocks], [
+            (BlockType.HEADING, 1),
+            (BlockType.PARAGRAPH, 0),
+            (BlockType.HEADING, 2),
+            (BlockType.CODE, 0),
+            (BlockType.QUOTE, 0),
+            (BlockType.UNORDERED_LIST, 0),
+            (BlockType.ORDERED_LIST, 0),
+        ])
+        self.assertEqual([MARKDOWN[block.start:block.end] for block in blocks[:3]], ["# The **title**", "Some text\non two lines", "## Subtitle"])
+        self.assertEqual([MARKDOWN[start:end] for start, end in blocks[0].parts], ["The **title**"])
+        self.assertEqual([MARKDOWN[start:end] for start, end in blocks[4].parts], ["a quote", "", "on _two_ lines"])
+        self.assertEqual([MARKDOWN[start:end] for start, end in blocks[5].parts], ["first", "second"])
+        self.assertEqual([MARKDOWN[start:end] for start, end in blocks[6].parts], ["one", "two"])
+
+    # method to test that a fenced code block keeps its blank lines and is not parsed as markdown
+    def test_code_block(self):
+        code = parse_blocks(MARKDOWN)[3]
+        start, end = code.parts[0]
+        self.assertEqual(MARKDOWN[start:end], 'def f():\n\n    return "<b>"')
+        self.assertEqual(MARKDOWN[code.start:code.end], '```\ndef f():\n\n    return "<b>"\n```')
+
+    # method to test that an unclosed code block runs to the end of the document, and an empty one has no code
+    def test_unclosed_and_empty_code(self):
+        self.assertEqual(parse_blocks("```\ncode\n\nmore\n"), [Block(BlockType.CODE, 0, 14, [(4, 14)])])
+        self.assertEqual(parse_blocks("```\n```"), [Block(BlockType.CODE, 0, 7, [(4, 4)])])
+        self.assertEqual(parse_blocks("```"), [Block(BlockType.CODE, 0, 3, [(3, 3)])])
+
+    # method to test that a line starting with inline code does not open a code block
+    def test_inline_code_not_fence(self):
+        markdown = "```x``` inline\n\nNext\n\n# H"
+        self.assertEqual([block.block_type for block in parse_blocks(markdown)], [BlockType.PARAGRAPH, BlockType.PARAGRAPH, BlockType.HEADING])
+        self.assertEqual(markdown_to_html(markdown), "<div><p><code>x</code> inline</p><p>Next</p><h1>H</h1></div>")
+
+    # method to test that an info string opens a code block, and only a line holding just the fence closes it
+    def test_fence_lines(self):
+        markdown = "```python\ncode\n``` trailing text\n  ```  \nAfter"
+        blocks = parse_blocks(markdown)
+        self.assertEqual([block.block_type for block in blocks], [BlockType.CODE, BlockType.PARAGRAPH])
+        self.assertEqual(markdown_to_html(markdown), "<div><pre><code>code\n``` trailing text</code></pre><p>After</p></div>")
+
+    # method to test lines that look like other blocks but are paragraphs
+    def test_not_headings_or_lists(self):
+        for text in ["####### seven", "#hashtag", "-dash", "**bold** text", "1.5 million", "---"]:
+            self.assertEqual([block.block_type for block in parse_blocks(text)], [BlockType.PARAGRAPH], text)
+
+    # method to test that surrounding whitespace and blank lines are skipped like markdown_to_blocks
+    def test_whitespace(self):
+        markdown = "\n\n  An indented paragraph  \n\n\n\nLast paragraph\n  on two lines  \n"
+        blocks = parse_blocks(markdown)
+        self.assertEqual([markdown[block.start:block.end] for block in blocks], ["An indented paragraph", "Last paragraph\n  on two lines"])
+        self.assertEqual(parse_blocks(""), [])
+        self.assertEqual(parse_blocks("\n   \n"), [])
+
+    # method to test converting each block type into html
+    def test_block_to_html_node(self):
+        html = [block_to_html_node(MARKDOWN, block).to_html() for block in parse_blocks(MARKDOWN)]
+        self.assertEqual(html, [
+            "<h1>The <b>title</b></h1>",
+            "<p>Some text\non two lines</p>",
+            "<h2>Subtitle</h2>",
+            '<pre><code>def f():\n\n    return "&lt;b&gt;"</code></pre>',
+            "<blockquote>a quote\n\non <i>two</i> lines</blockquote>",
+            "<ul><li>first</li><li>second</li></ul>",
+            "<ol><li>one</li><li>two</li></ol>",
+        ])
+
+    # method to test that the block cache renders the same html as the node tree for every block type
+    def test_block_cache(self):
+        self.assertEqual(markdown_to_html(MARKDOWN, BlockCache()), markdown_to_html(MARKDOWN))
+
+    # method to test the string representation and equality of Block objects
+    def test_block_repr(self):
+        block = Block(BlockType.HEADING, 0, 3, [(2, 3)], 1)
+        self.assertEqual(repr(block), "Block(heading, 0, 3, [(2, 3)], 1)")
+        self.assertEqual(block, Block(BlockType.HEADING, 0, 3, [(2, 3)], 1))
+        self.assertNotEqual(block, Block(BlockType.HEADING, 0, 3, [(2, 3)], 2))
+
+if __name__ == "__main__":
+    unittest.main()
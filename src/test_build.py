@@ -0,0 +1,306 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from unittest import mock
+import build
+from build import find_pages, output_path, build_site, chunked, page_title
+import main
+
+# helper function to write a file, creating its directory
+def write_file(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+
+# helper function to read every file under a directory into a dictionary of relative path -> contents
+def read_tree(directory):
+    tree = {}
+    for parent, subdirectories, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(parent, name)
+            with open(path, encoding="utf-8") as file:
+                tree[os.path.relpath(path, directory)] = file.read()
+    return tree
+
+# unit tests for the site build
+class TestBuildSite(unittest.TestCase):
+    # method to create a temporary content tree with valid pages, an invalid page and a non-markdown file
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.content = os.path.join(self.directory.name, "content")
+        write_file(os.path.join(self.content, "index.md"), "Welcome to **the site**")
+        write_file(os.path.join(self.content, "blog", "b.md"), "Second _post_")
+        write_file(os.path.join(self.content, "blog", "a.md"), "First [post](/blog/a.html)")
+        write_file(os.path.join(self.content, "blog", "broken.md"), "This is **not closed")
+        write_file(os.path.join(self.content, "notes.txt"), "not a page")
+
+    # method to test that pages are found recursively, in sorted order
+    def test_find_pages(self):
+        expected = [os.path.join("blog", "a.md"), os.path.join("blog", "b.md"), os.path.join("blog", "broken.md"), "index.md"]
+        self.assertEqual(find_pages(self.content), expected)
+
+    # method to test the output path of a page
+    def test_output_path(self):
+        self.assertEqual(output_path(os.path.join("blog", "a.md")), os.path.join("blog", "a.html"))
+
+    # method to test splitting pages into chunks
+    def test_chunked(self):
+        self.assertEqual(chunked([1, 2, 3, 4, 5], 2), [[1, 2], [3, 4], [5]])
+
+    # method to test building the site in a single process
+    def test_build_site(self):
+        output = os.path.join(self.directory.name, "public")
+        report = build_site(self.content, output, workers=1)
+
+        self.assertEqual(report.pages, 4)
+        self.assertFalse(report.ok())
+        self.assertEqual([path for path, message in report.errors], [os.path.join("blog", "broken.md")])
+        self.assertIn("ValueError", report.errors[0][1])
+        self.assertEqual(read_tree(output), {
+            "index.html": "<div><p>Welcome to <b>the site</b></p></div>",
+            os.path.join("blog", "a.html"): '<div><p>First <a href="/blog/a.html">post</a></p></div>',
+            os.path.join("blog", "b.html"): "<div><p>Second <i>post</i></p></div>",
+        })
+
+    # method to test that building with a pool of worker processes gives the same output and errors
+    def test_parallel_build_matches_serial(self):
+        serial = build_site(self.content, os.path.join(self.directory.name, "serial"), workers=1)
+        parallel = build_site(self.content, os.path.join(self.directory.name, "parallel"), workers=2, chunk_size=1)
+        self.assertEqual(parallel.errors, serial.errors)
+        self.assertEqual(read_tree(os.path.join(self.directory.name, "parallel")), read_tree(os.path.join(self.directory.name, "serial")))
+
+    # method to test that building through the asynchronous I/O pipeline gives the same output and errors
+    def test_io_threads_build_matches_sequential(self):
+        sequential = build_site(self.content, os.path.join(self.directory.name, "sequential"), workers=1)
+        pipelined = build_site(self.content, os.path.join(self.directory.name, "pipelined"), workers=1, io_threads=4)
+        self.assertEqual(pipelined.errors, sequential.errors)
+        self.assertEqual(read_tree(os.path.join(self.directory.name, "pipelined")), read_tree(os.path.join(self.directory.name, "sequential")))
+
+    # method to test that splitting large pages across the workers builds the same pages, with errors in page order
+    def test_split_large_pages(self):
+        large = "\n\n".join(f"# Section {number}\n\nParagraph **{number}**\n\n- item\n- _item_" for number in range(200))
+        write_file(os.path.join(self.content, "reference.md"), large)
+        write_file(os.path.join(self.content, "large-broken.md"), large + "\n\nThis is **not closed")
+        serial = build_site(self.content, os.path.join(self.directory.name, "serial"), workers=1)
+        split = build_site(self.content, os.path.join(self.directory.name, "split"), workers=2, split_size=1000)
+        self.assertEqual(split.errors, serial.errors)
+        self.assertEqual([path for path, message in split.errors], [os.path.join("blog", "broken.md"), "large-broken.md"])
+        self.assertEqual(read_tree(os.path.join(self.directory.name, "split")), read_tree(os.path.join(self.directory.name, "serial")))
+
+    # method to test that the chunks of a large page are submitted before the chunks of small pages, even when it sorts last
+    def test_split_large_pages_submitted_first(self):
+        write_file(os.path.join(self.content, "z-large.md"), "\n\n".join(f"Paragraph {number}" for number in range(500)))
+        submitted = []
+
+        # thread pool recording the name of every function submitted to it, in place of the worker processes
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, function, *args, **kwargs):
+                submitted.append(function.__name__)
+                return super().submit(function, *args, **kwargs)
+
+        with mock.patch.object(build, "ProcessPoolExecutor", RecordingExecutor):
+            summary = build_site(self.content, os.path.join(self.directory.name, "public"), workers=2, chunk_size=1, split_size=1000)
+        self.assertEqual([path for path, message in summary.errors], [os.path.join("blog", "broken.md")])
+        self.assertEqual(submitted.count("build_chunk"), 4)
+        self.assertEqual(submitted, ["render_fragment"] + ["build_chunk"] * 4)
+
+    # method to test that the title of a page is the plain text of its first heading, or its file name without one
+    def test_page_title(self):
+        self.assertEqual(page_title("index.md", "**Intro**\n\n## The **new** `site` [home](/)\n\n# Later"), "The new site home")
+        self.assertEqual(page_title(os.path.join("blog", "post.md"), "```\n# not a heading\n```\n\nText"), "post")
+        self.assertEqual(page_title("draft.md", "#\n\n# **not closed"), "**not closed")
+        self.assertEqual(page_title("empty.md", ""), "empty")
+
+    # method to test building every page into a template with its title, navigation and content
+    def test_build_with_template(self):
+        template = os.path.join(self.directory.name, "layout.html")
+        write_file(template, "<title>{{ title }}</title>{{ nav }}{{ content }}")
+        output = os.path.join(self.directory.name, "public")
+        build_site(self.content, output, workers=1, template_path=template)
+
+        tree = read_tree(output)
+        self.assertEqual(tree["index.html"], '<title>index</title><nav><a href="/">Home</a></nav>'
+                                             "<div><p>Welcome to <b>the site</b></p></div>")
+        self.assertEqual(tree[os.path.join("blog", "b.html")], '<title>b</title><nav><a href="/">Home</a> / '
+                                                               '<a href="/blog/">blog</a></nav><div><p>Second <i>post</i></p></div>')
+
+        # the asynchronous I/O pipeline renders the template into the same pages
+        pipelined = os.path.join(self.directory.name, "pipelined")
+        build_site(self.content, pipelined, workers=1, template_path=template, io_threads=4)
+        self.assertEqual(read_tree(pipelined), tree)
+
+    # method to test that the title and content of a page are escaped, while the template around them is not
+    def test_build_with_template_escaped(self):
+        template = os.path.join(self.directory.name, "layout.html")
+        write_file(template, "<title>{{ title }}</title>{{ content }}")
+        write_file(os.path.join(self.content, "index.md"), "# Fish & <Chips>")
+        output = os.path.join(self.directory.name, "public")
+        build_site(self.content, output, workers=1, template_path=template)
+        self.assertEqual(read_tree(output)["index.html"], "<title>Fish &amp; &lt;Chips&gt;</title><div><h1>Fish &amp; &lt;Chips&gt;</h1></div>")
+
+    # method to test that a template with a slot that pages do not fill in fails the build
+    def test_build_with_invalid_template(self):
+        template = os.path.join(self.directory.name, "layout.html")
+        write_file(template, "{{ content }}{{ sidebar }}")
+        with self.assertRaises(ValueError):
+            build_site(self.content, os.path.join(self.directory.name, "public"), workers=1, template_path=template)
+
+    # method to test the build command of the command line entry point
+    def test_build_command(self):
+        output = os.path.join(self.directory.name, "public")
+        with redirect_stdout(io.StringIO()) as stdout:
+            status = main.main(["build", self.content, output, "--workers", "1"])
+        self.assertEqual(status, 1)
+        self.assertIn("built 3 of 4 pages", stdout.getvalue())
+        self.assertIn("broken.md", stdout.getvalue())
+
+# unit tests for incremental builds with the build cache
+class TestIncrementalBuild(unittest.TestCase):
+    # method to create a temporary content tree and build it once with a cache
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.content = os.path.join(self.directory.name, "content")
+        self.output = os.path.join(self.directory.name, "public")
+        self.cache = os.path.join(self.directory.name, "public.cache.json")
+        write_file(os.path.join(self.content, "a.md"), "Page **a**")
+        write_file(os.path.join(self.content, "b.md"), "Page _b_")
+        self.report = build_site(self.content, self.output, workers=1, cache_path=self.cache)
+
+    # helper method to build again with the cache
+    def rebuild(self, force=False):
+        return build_site(self.content, self.output, workers=1, cache_path=self.cache, force=force)
+
+    # method to test that a rebuild without changes skips every page
+    def test_noop_rebuild(self):
+        self.assertEqual(self.report.skipped, 0)
+        report = self.rebuild()
+        self.assertEqual(report.skipped, 2)
+        self.assertIn("built 0 of 2 pages (2 unchanged)", report.format())
+
+    # method to test that only the edited page is rebuilt
+    def test_edited_page(self):
+        path = os.path.join(self.content, "b.md")
+        write_file(path, "Page _b_ edited")
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1000000000))
+        report = self.rebuild()
+        self.assertEqual(report.skipped, 1)
+        self.assertEqual(read_tree(self.output)["b.html"], "<div><p>Page <i>b</i> edited</p></div>")
+
+    # method to test that a touched page with the same contents is not rebuilt
+    def test_touched_page(self):
+        path = os.path.join(self.content, "a.md")
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1000000000))
+        self.assertEqual(self.rebuild().skipped, 2)
+
+    # method to test that a page whose output was deleted is rebuilt
+    def test_missing_output(self):
+        os.remove(os.path.join(self.output, "a.html"))
+        self.assertEqual(self.rebuild().skipped, 1)
+        self.assertIn("a.html", read_tree(self.output))
+
+    # method to test that forcing a build converts every page
+    def test_force(self):
+        self.assertEqual(self.rebuild(force=True).skipped, 0)
+
+    # method to test that pages with deleted sources are evicted from the cache
+    def test_evicts_deleted_sources(self):
+        os.remove(os.path.join(self.content, "b.md"))
+        self.rebuild()
+        with open(self.cache, encoding="utf-8") as file:
+            self.assertEqual(list(json.load(file)["pages"]), ["a.md"])
+
+    # method to test that every page is rebuilt when the template changes
+    def test_template_change(self):
+        template = os.path.join(self.directory.name, "layout.html")
+        write_file(template, "<main>{{ content }}</main>")
+        self.assertEqual(build_site(self.content, self.output, workers=1, cache_path=self.cache, template_path=template).skipped, 0)
+        self.assertEqual(build_site(self.content, self.output, workers=1, cache_path=self.cache, template_path=template).skipped, 2)
+
+        write_file(template, "<article>{{ content }}</article>")
+        os.utime(template, ns=(os.stat(template).st_atime_ns, os.stat(template).st_mtime_ns + 1000000000))
+        self.assertEqual(build_site(self.content, self.output, workers=1, cache_path=self.cache, template_path=template).skipped, 0)
+        self.assertEqual(read_tree(self.output)["a.html"], "<article><div><p>Page <b>a</b></p></div></article>")
+
+    # method to test that a failed page is not cached, so it is retried
+    def test_failed_page_retried(self):
+        write_file(os.path.join(self.content, "c.md"), "**broken")
+        self.assertEqual(len(self.rebuild().errors), 1)
+        self.assertEqual(len(self.rebuild().errors), 1)
+
+# unit tests for skipping identical outputs and deleting stale outputs with the output manifest
+class TestOutputManifest(unittest.TestCase):
+    # method to create a temporary content tree and build it once with a manifest
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.content = os.path.join(self.directory.name, "content")
+        self.output = os.path.join(self.directory.name, "public")
+        self.manifest = os.path.join(self.directory.name, "public.manifest.json")
+        write_file(os.path.join(self.content, "a.md"), "Page **a**")
+        write_file(os.path.join(self.content, "blog", "b.md"), "Page _b_")
+        self.report = self.rebuild()
+
+    # helper method to build every page again with the manifest
+    def rebuild(self, **options):
+        return build_site(self.content, self.output, workers=1, manifest_path=self.manifest, **options)
+
+    # helper method to return the modification times of the output files
+    def output_mtimes(self):
+        return {path: os.stat(os.path.join(self.output, path)).st_mtime_ns for path in read_tree(self.output)}
+
+    # method to test that identical outputs are not rewritten, with and without the I/O pipeline
+    def test_identical_outputs_skipped(self):
+        self.assertEqual((self.report.written, self.report.identical), (2, 0))
+        mtimes = self.output_mtimes()
+        for io_threads in (0, 4):
+            report = self.rebuild(io_threads=io_threads)
+            self.assertEqual((report.written, report.identical, report.deleted), (0, 2, 0))
+            self.assertIn("wrote 0 files (2 identical, 0 stale deleted)", report.format())
+        self.assertEqual(self.output_mtimes(), mtimes)
+
+    # method to test that only the outputs whose bytes changed are written
+    def test_changed_output_written(self):
+        write_file(os.path.join(self.content, "a.md"), "Page **a** edited")
+        report = self.rebuild()
+        self.assertEqual((report.written, report.identical), (1, 1))
+        self.assertEqual(read_tree(self.output)["a.html"], "<div><p>Page <b>a</b> edited</p></div>")
+
+    # method to test that an output changed since it was recorded is rewritten, even if the new bytes match the manifest
+    def test_modified_output_rewritten(self):
+        path = os.path.join(self.output, "a.html")
+        write_file(path, "x" * os.path.getsize(path))
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1000000000))
+        self.assertEqual(self.rebuild().written, 1)
+        self.assertEqual(read_tree(self.output)["a.html"], "<div><p>Page <b>a</b></p></div>")
+
+    # method to test that the outputs of deleted pages are deleted, while files the build never wrote are kept
+    def test_stale_outputs_deleted(self):
+        write_file(os.path.join(self.output, "style.css"), "p {}")
+        os.remove(os.path.join(self.content, "blog", "b.md"))
+        report = self.rebuild()
+        self.assertEqual(report.deleted, 1)
+        self.assertEqual(sorted(read_tree(self.output)), ["a.html", "style.css"])
+        with open(self.manifest, encoding="utf-8") as file:
+            self.assertEqual(list(json.load(file)["outputs"]), ["a.html"])
+
+    # method to test that stale entries pointing outside the output directory are dropped without deleting anything
+    def test_stale_outside_output_ignored(self):
+        outside = os.path.join(self.directory.name, "outside.html")
+        write_file(outside, "keep me")
+        with open(self.manifest, encoding="utf-8") as file:
+            data = json.load(file)
+        data["outputs"][os.path.join(os.pardir, "outside.html")] = {"hash": "x", "size": 7, "mtime_ns": 0}
+        with open(self.manifest, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+        self.assertEqual(self.rebuild().deleted, 0)
+        self.assertTrue(os.path.exists(outside))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import os
+import tempfile
+from cache import BuildCache, OutputManifest, CONVERTER_VERSION, hash_source
+
+# unit tests for the BuildCache class
+class TestBuildCache(unittest.TestCase):
+    # method to create a temporary directory with a source file
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "cache.json")
+        self.source = os.path.join(self.directory.name, "page.md")
+        with open(self.source, "w", encoding="utf-8") as file:
+            file.write("Some **markdown**")
+
+    # method to test that recorded pages survive a save and load
+    def test_save_and_load(self):
+        cache = BuildCache(self.path)
+        cache.record("page.md", os.stat(self.source), hash_source("Some **markdown**"))
+        cache.save()
+
+        loaded = BuildCache(self.path).load()
+        self.assertTrue(loaded.is_unchanged("page.md", self.source, os.stat(self.source)))
+        self.assertFalse(loaded.is_unchanged("other.md", self.source, os.stat(self.source)))
+
+    # method to test that a cache from another converter version is discarded
+    def test_version_mismatch(self):
+        cache = BuildCache(self.path, "old version")
+        cache.record("page.md", os.stat(self.source), "hash")
+        cache.save()
+        self.assertEqual(BuildCache(self.path).load().pages, {})
+        self.assertEqual(BuildCache(self.path).version, CONVERTER_VERSION)
+
+    # method to test that a missing or corrupt cache file loads as empty
+    def test_missing_and_corrupt(self):
+        self.assertEqual(BuildCache(self.path).load().pages, {})
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("{not json")
+        self.assertEqual(BuildCache(self.path).load().pages, {})
+
+    # method to test that a source with a new size or new contents counts as changed
+    def test_changed_source(self):
+        cache = BuildCache(self.path)
+        cache.record("page.md", os.stat(self.source), hash_source("Some **markdown**"))
+        with open(self.source, "w", encoding="utf-8") as file:
+            file.write("Some **markdowN**")
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        self.assertFalse(cache.is_unchanged("page.md", self.source, os.stat(self.source)))
+
+    # method to test evicting the pages whose sources no longer exist
+    def test_evict_missing(self):
+        cache = BuildCache(self.path)
+        cache.record("page.md", os.stat(self.source), "a")
+        cache.record("gone.md", os.stat(self.source), "b")
+        self.assertEqual(cache.evict_missing(["page.md"]), 1)
+        self.assertEqual(list(cache.pages), ["page.md"])
+
+# unit tests for the OutputManifest class
+class TestOutputManifest(unittest.TestCase):
+    # method to create a temporary directory for the manifest
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "manifest.json")
+
+    # method to test that recorded outputs survive a save and load, and that unchanged entries do not trigger a save
+    def test_save_and_load(self):
+        manifest = OutputManifest(self.path)
+        manifest.record("a.html", "hash", 10, 123)
+        manifest.save()
+        self.assertFalse(manifest.changed)
+
+        loaded = OutputManifest(self.path).load()
+        self.assertEqual(loaded.get("a.html"), {"hash": "hash", "size": 10, "mtime_ns": 123})
+        self.assertIsNone(loaded.get("b.html"))
+        loaded.record("a.html", "hash", 10, 123)
+        self.assertFalse(loaded.changed)
+
+    # method to test that a missing or corrupt manifest loads empty
+    def test_missing_and_corrupt(self):
+        self.assertEqual(OutputManifest(self.path).load().outputs, {})
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("[not a manifest")
+        self.assertEqual(OutputManifest(self.path).load().outputs, {})
+
+    # method to test finding and forgetting the outputs that are no longer produced
+    def test_stale(self):
+        manifest = OutputManifest(self.path)
+        for name in ("c.html", "a.html", "b.html"):
+            manifest.record(name, "hash", 1, 1)
+        self.assertEqual(manifest.stale(["b.html"]), ["a.html", "c.html"])
+        manifest.forget("a.html")
+        self.assertEqual(sorted(manifest.outputs), ["b.html", "c.html"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from textnode import TextNode, TextType
+from htmlnode import HTMLNode, LeafNode, ParentNode
+from page import markdown_to_html_node
+from flyweight import NodeInterner
+
+MARKDOWN = """Read the [docs](/docs) and return `None`
+
+Read the [docs](/docs) and return `None`
+
+Something **else** with `None`"""
+
+# unit tests for the NodeInterner class
+class TestNodeInterner(unittest.TestCase):
+    # method to test that structurally identical leaves are shared and different ones are not
+    def test_leaf_nodes(self):
+        interner = NodeInterner()
+        first = interner.leaf_node(LeafNode("a", "docs", {"href": "/docs"}))
+        self.assertIs(interner.leaf_node(LeafNode("a", "docs", {"href": "/docs"})), first)
+        self.assertIsNot(interner.leaf_node(LeafNode("a", "docs", {"href": "/api"})), first)
+        self.assertIsNot(interner.leaf_node(LeafNode("b", "docs")), interner.leaf_node(LeafNode("i", "docs")))
+        self.assertEqual((interner.lookups, interner.duplicates, len(interner)), (5, 1, 4))
+        self.assertGreater(interner.bytes_saved, 0)
+
+    # method to test that text nodes are converted into shared leaves
+    def test_text_nodes(self):
+        interner = NodeInterner()
+        leaf = interner.text_node(TextNode("None", TextType.CODE_TEXT))
+        self.assertIs(interner.text_node(TextNode("None", TextType.CODE_TEXT)), leaf)
+        self.assertEqual(leaf.to_html(), "<code>None</code>")
+
+    # method to test that leaves whose properties cannot be hashed are kept as they are
+    def test_unhashable_props(self):
+        interner = NodeInterner()
+        node = LeafNode("a", "x", {"href": ["/"]})
+        self.assertIs(interner.leaf_node(node), node)
+        self.assertEqual((interner.lookups, len(interner)), (0, 0))
+
+    # method to test that identical small subtrees are shared, while the original tree is left unchanged
+    def test_intern_tree(self):
+        tree = markdown_to_html_node(MARKDOWN)
+        html = tree.to_html()
+        interner = NodeInterner()
+        interned = interner.intern(tree)
+
+        first, second, third = interned.children
+        self.assertIs(first, second)
+        self.assertIs(first.children[3], third.children[3])
+        self.assertIsNot(tree.children[0], tree.children[1])
+        self.assertEqual(tree.to_html(), html)
+        self.assertEqual(interned.to_html(), html)
+        self.assertEqual(interner.to_html(interned), html)
+
+    # method to test that subtrees larger than the maximum size are rebuilt with shared children but not shared themselves
+    def test_max_subtree_size(self):
+        interner = NodeInterner(max_subtree_size=3)
+        tree = ParentNode("div", [ParentNode("p", [LeafNode(None, "a"), LeafNode(None, "b"), LeafNode(None, "c")]) for _ in range(2)])
+        interned = interner.intern(tree)
+        first, second = interned.children
+        self.assertIsNot(first, second)
+        self.assertIs(first.children[0], second.children[0])
+
+    # method to test that nodes other than leaf and parent nodes are kept as they are, and their parents are not shared
+    def test_other_nodes(self):
+        interner = NodeInterner()
+        other = HTMLNode("span", "x")
+        tree = ParentNode("div", [ParentNode("p", [other]), ParentNode("p", [other])])
+        interned = interner.intern(tree)
+        self.assertIs(interned.children[0].children[0], other)
+        self.assertIsNot(interned.children[0], interned.children[1])
+        self.assertIs(interner.intern(other), other)
+
+    # method to test that deeply nested trees are interned and rendered without hitting the recursion limit
+    def test_deep_tree(self):
+        tree = LeafNode("b", "deep")
+        for _ in range(5000):
+            tree = ParentNode("span", [tree])
+        interner = NodeInterner()
+        self.assertEqual(interner.to_html(interner.intern(tree)), tree.to_html())
+
+    # method to test that the html of a shared node is rendered once and then served from the cache
+    def test_render_cache(self):
+        # keep the whole document from being shared, so its paragraphs are rendered one by one
+        interner = NodeInterner(max_subtree_size=5)
+        interned = interner.intern(markdown_to_html_node(MARKDOWN))
+        interner.to_html(interned)
+        shared = interned.children[0]
+        self.assertEqual(interner.rendered[id(shared)], shared.to_html())
+
+        # a cached fragment is reused as it is
+        interner.rendered[id(shared)] = "<p>cached</p>"
+        self.assertTrue(interner.to_html(interned).startswith("<div><p>cached</p><p>cached</p>"))
+
+    # method to test that clearing forgets the shared nodes and resets the counters
+    def test_clear(self):
+        interner = NodeInterner()
+        interner.intern(markdown_to_html_node(MARKDOWN))
+        self.assertGreater(interner.dedup_ratio(), 1)
+        interner.clear()
+        self.assertEqual((len(interner), interner.lookups, interner.bytes_saved, interner.dedup_ratio()), (0, 0, 0, 1.0))
+
+if __name__ == "__main__":
+    unittest.main()
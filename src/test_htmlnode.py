@@ -1,5 +1,20 @@
 import unittest
-from htmlnode import HTMLNode, LeafNode, ParentNode
+import html
+import io
+import pickle
+from htmlnode import (
+    HTMLNode,
+    LeafNode,
+    ParentNode,
+    FrozenProps,
+    walk,
+    iter_nodes,
+    count_nodes,
+    props_cache_info,
+    clear_props_cache,
+    escape_text,
+    escape_attribute
+)
 
 # unit tests for the HTMLNode class
 class TestHTMLNode(unittest.TestCase):
@@ -26,6 +41,19 @@ class TestHTMLNode(unittest.TestCase):
         expected = "HTMLNode(p, Hello, world!, children: None, {'class': 'primary'})"
         self.assertEqual(repr(node), expected)
 
+    # method to test that every node class stores its attributes in slots rather than a per-instance dictionary
+    def test_slots(self):
+        for node in [HTMLNode("p", "text"), LeafNode("b", "text"), ParentNode("div", [])]:
+            self.assertFalse(hasattr(node, "__dict__"))
+
+    # method to test that rendering a base HTMLNode object is not implemented
+    def test_to_html_not_implemented(self):
+        node = HTMLNode("p", "Hello, world!")
+        with self.assertRaises(NotImplementedError):
+            node.to_html()
+        with self.assertRaises(NotImplementedError):
+            node.write_html(io.StringIO())
+
 # unit tests for the LeafNode subclass
 class TestLeafNode(unittest.TestCase):
     # method to test the rendering of a LeafNode object with a paragraph tag
@@ -40,6 +68,19 @@ class TestLeafNode(unittest.TestCase):
         expected = '<a href="https://www.boot.dev">Boot.dev</a>'
         self.assertEqual(node.to_html(), expected)
 
+    # method to test that the value of a LeafNode object is escaped as text and its properties as attribute values
+    def test_leaf_to_html_escaped(self):
+        node = LeafNode("a", "<b> & \"quotes\" 'here'", {"href": "/search?q=a&b=\"c\"", "title": "it's"})
+        expected = '<a href="/search?q=a&amp;b=&quot;c&quot;" title="it&#x27;s">&lt;b&gt; &amp; "quotes" \'here\'</a>'
+        self.assertEqual(node.to_html(), expected)
+        self.assertEqual(LeafNode(None, "1 < 2").to_html(), "1 &lt; 2")
+
+    # method to test the rendering of LeafNode objects with the precomputed tags of the fixed inline tags
+    def test_leaf_to_html_fixed_tags(self):
+        self.assertEqual(LeafNode("b", "bold").to_html(), "<b>bold</b>")
+        self.assertEqual(LeafNode("code", 42).to_html(), "<code>42</code>")
+        self.assertEqual(LeafNode("img", "", {"src": "/a.png", "alt": "a"}).to_html(), '<img src="/a.png" alt="a"></img>')
+
     # method to test the rendering of a LeafNode object with no tag
     def test_leaf_to_html_no_tag(self):
         node = LeafNode(None, "Hello, world!")
@@ -67,6 +108,25 @@ class TestLeafNode(unittest.TestCase):
         expected = "LeafNode(p, Hello, world!, {'class': 'primary'})"
         self.assertEqual(repr(node), expected)
 
+# unit tests for the html escaping functions
+class TestEscaping(unittest.TestCase):
+    # method to test that text without markup characters is returned as the same object
+    def test_no_escaping_needed(self):
+        text = "plain text with \"quotes\""
+        self.assertIs(escape_text(text), text)
+        self.assertIs(escape_attribute("plain value"), "plain value")
+
+    # method to test that escaping matches html.escape, with quotes escaped only in attribute values
+    def test_matches_html_escape(self):
+        for text in ["a & b", "<script>", "&amp;", "\"'<>&", "&&<<>>", ""]:
+            self.assertEqual(escape_attribute(text), html.escape(text))
+            self.assertEqual(escape_text(text), html.escape(text, quote=False))
+
+    # method to test that values that are not strings are escaped by their string form
+    def test_not_strings(self):
+        self.assertEqual(escape_text(42), "42")
+        self.assertEqual(escape_attribute(None), "None")
+
 # unit tests for the ParentNode subclass
 class TestParentNode(unittest.TestCase):
     # method to test a parent node with a single child
@@ -142,5 +202,142 @@ class TestParentNode(unittest.TestCase):
         expected = "ParentNode(p, children: [LeafNode(b, italic, {'class': 'text'})], {'class': 'text'})"
         self.assertEqual(repr(parent_node), expected)
 
+# unit tests for the streaming iter_html and write_html methods
+class TestStreamingHTML(unittest.TestCase):
+    # method to test that iter_html yields the opening tag, each child and the closing tag as separate chunks
+    def test_iter_html_chunks(self):
+        node = ParentNode("p", [LeafNode("b", "Bold text"), LeafNode(None, "Normal text")], {"class": "text"})
+        expected = ['<p class="text">', "<b>Bold text</b>", "Normal text", "</p>"]
+        self.assertEqual(list(node.iter_html()), expected)
+
+    # method to test that write_html writes the same html as to_html into a file-like sink
+    def test_write_html_matches_to_html(self):
+        node = ParentNode("div", [
+            ParentNode("span", [LeafNode("b", "grandchild")]),
+            LeafNode("a", "Boot.dev", {"href": "https://www.boot.dev"})
+        ])
+        sink = io.StringIO()
+        node.write_html(sink)
+        self.assertEqual(sink.getvalue(), node.to_html())
+
+    # method to test that write_html on a LeafNode object writes its html
+    def test_leaf_write_html(self):
+        sink = io.StringIO()
+        LeafNode("i", "Italic text").write_html(sink)
+        self.assertEqual(sink.getvalue(), "<i>Italic text</i>")
+
+    # method to test that write_html on an invalid tree raises an ValueError
+    def test_write_html_invalid(self):
+        node = ParentNode("div", [LeafNode("p", None)])
+        with self.assertRaises(ValueError):
+            node.write_html(io.StringIO())
+
+# unit tests for the stack-based tree traversal functions
+class TestTreeTraversal(unittest.TestCase):
+    # method to test the enter and exit events produced by walk
+    def test_walk_events(self):
+        leaf_b = LeafNode("b", "grandchild")
+        child = ParentNode("span", [leaf_b])
+        leaf_i = LeafNode("i", "child")
+        parent = ParentNode("div", [child, leaf_i])
+        expected = [
+            (parent, True),
+            (child, True),
+            (leaf_b, True),
+            (child, False),
+            (leaf_i, True),
+            (parent, False)
+        ]
+        self.assertEqual(list(walk(parent)), expected)
+
+    # method to test that iter_nodes yields nodes in document order
+    def test_iter_nodes(self):
+        leaf_b = LeafNode("b", "grandchild")
+        child = ParentNode("span", [leaf_b])
+        parent = ParentNode("div", [child])
+        self.assertEqual(list(iter_nodes(parent)), [parent, child, leaf_b])
+
+    # method to test counting the nodes of a tree
+    def test_count_nodes(self):
+        node = ParentNode("p", [LeafNode("b", "Bold text"), ParentNode("span", [LeafNode(None, "Normal text")])])
+        self.assertEqual(count_nodes(node), 4)
+        self.assertEqual(count_nodes(LeafNode(None, "text")), 1)
+
+    # method to test rendering and counting a tree nested far deeper than the recursion limit
+    def test_deeply_nested_tree(self):
+        depth = 100000
+        node = LeafNode(None, "deep")
+        for _ in range(depth):
+            node = ParentNode("blockquote", [node])
+        self.assertEqual(node.to_html(), "<blockquote>" * depth + "deep" + "</blockquote>" * depth)
+        self.assertEqual(count_nodes(node), depth + 1)
+
+    # method to test that an invalid node deep in the tree raises an ValueError
+    def test_nested_invalid_node(self):
+        node = ParentNode("div", [ParentNode("span", [ParentNode(None, [LeafNode(None, "text")])])])
+        with self.assertRaises(ValueError):
+            node.to_html()
+
+# unit tests for the immutable properties and the property serialization cache
+class TestPropsCache(unittest.TestCase):
+    # method to reset the cache before each test
+    def setUp(self):
+        clear_props_cache()
+
+    # method to test that node properties are frozen and still compare and print like a dictionary
+    def test_props_are_frozen(self):
+        node = LeafNode("a", "Boot.dev", {"href": "https://www.boot.dev"})
+        self.assertIsInstance(node.props, FrozenProps)
+        self.assertEqual(node.props, {"href": "https://www.boot.dev"})
+        self.assertEqual(repr(node.props), "{'href': 'https://www.boot.dev'}")
+        with self.assertRaises(TypeError):
+            node.props["href"] = "https://example.com"
+        with self.assertRaises(TypeError):
+            node.props.update({"class": "x"})
+
+    # method to test that frozen properties compare by their ordered properties, consistent with their hash
+    def test_props_equality_follows_order(self):
+        props = FrozenProps({"src": "a.png", "alt": "a"})
+        self.assertEqual(props, FrozenProps({"src": "a.png", "alt": "a"}))
+        self.assertEqual(hash(props), hash(FrozenProps({"src": "a.png", "alt": "a"})))
+        self.assertNotEqual(props, FrozenProps({"alt": "a", "src": "a.png"}))
+        self.assertFalse(props == FrozenProps({"alt": "a", "src": "a.png"}))
+        self.assertEqual(len({props, FrozenProps({"alt": "a", "src": "a.png"})}), 2)
+
+    # method to test that the constructor cannot be called again to change frozen properties
+    def test_props_init_once(self):
+        props = FrozenProps({"href": "/"})
+        with self.assertRaises(TypeError):
+            props.__init__({"href": "/other"})
+        self.assertEqual(props.key(), (("href", "/"),))
+        self.assertEqual(props, {"href": "/"})
+
+    # method to test that frozen properties survive pickling
+    def test_props_pickle(self):
+        props = FrozenProps({"src": "a.png", "alt": "a"})
+        copy = pickle.loads(pickle.dumps(props))
+        self.assertIsInstance(copy, FrozenProps)
+        self.assertEqual(copy.key(), props.key())
+
+    # method to test that repeated property sets are served from the cache
+    def test_cache_hits_and_misses(self):
+        for _ in range(3):
+            LeafNode("a", "Boot.dev", {"href": "https://www.boot.dev"}).to_html()
+        info = props_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
+    # method to test that the cache keeps attribute order, so equal dictionaries in a different order render differently
+    def test_cache_keeps_order(self):
+        first = HTMLNode("img", None, None, {"src": "a.png", "alt": "a"})
+        second = HTMLNode("img", None, None, {"alt": "a", "src": "a.png"})
+        self.assertEqual(first.props_to_html(), ' src="a.png" alt="a"')
+        self.assertEqual(second.props_to_html(), ' alt="a" src="a.png"')
+
+    # method to test that properties with unhashable values are still serialized
+    def test_unhashable_values(self):
+        node = HTMLNode("div", None, None, {"data": ["a", "b"]})
+        self.assertEqual(node.props_to_html(), " data=\"['a', 'b']\"")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import random
+from enum import Enum
+from htmlnode import LeafNode
+from textnode import TextNode, TextType, text_to_textnodes, text_node_to_html_node, register_text_type, TEXT_NODE_FACTORIES
+from inline import parse_inline, inline_spans, render_many, texts_to_html_many
+
+# helper function to run a parser and return its nodes, or "error" if the markdown is invalid
+def parse_or_error(parser, text):
+    try:
+        return parser(text)
+    except ValueError:
+        return "error"
+
+# unit tests for the parse_inline function
+class TestParseInline(unittest.TestCase):
+    # method to test plain text with no markdown
+    def test_plain_text_only(self):
+        self.assertEqual(parse_inline("just text"), [TextNode("just text", TextType.PLAIN_TEXT)])
+
+    # method to test an empty string
+    def test_empty_text(self):
+        self.assertEqual(parse_inline(""), [])
+
+    # method to test text containing every kind of inline markdown
+    def test_mixed_markdown(self):
+        text = "This is **text** with an _italic_ word and a `code block` and an ![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a [link](https://boot.dev)"
+        expected = [
+            TextNode("This is ", TextType.PLAIN_TEXT),
+            TextNode("text", TextType.BOLD_TEXT),
+            TextNode(" with an ", TextType.PLAIN_TEXT),
+            TextNode("italic", TextType.ITALIC_TEXT),
+            TextNode(" word and a ", TextType.PLAIN_TEXT),
+            TextNode("code block", TextType.CODE_TEXT),
+            TextNode(" and an ", TextType.PLAIN_TEXT),
+            TextNode("obi wan image", TextType.IMAGE, "https://i.imgur.com/fJRm4Vk.jpeg"),
+            TextNode(" and a ", TextType.PLAIN_TEXT),
+            TextNode("link", TextType.LINK, "https://boot.dev"),
+        ]
+        self.assertEqual(parse_inline(text), expected)
+
+    # method to test that markdown inside bold text is left as text
+    def test_markdown_inside_bold(self):
+        expected = [TextNode("a _b_ `c` [d](e)", TextType.BOLD_TEXT)]
+        self.assertEqual(parse_inline("**a _b_ `c` [d](e)**"), expected)
+
+    # method to test that a delimiter inside a link breaks the link, like the reference pipeline
+    def test_delimiter_inside_link(self):
+        text = "[a_b_c](url)"
+        self.assertEqual(parse_inline(text), text_to_textnodes(text))
+
+    # method to test that inline_spans returns the offsets of each span and url, shifted by the given offset
+    def test_inline_spans_offsets(self):
+        text = "a **b** [c](d)"
+        expected = [
+            (TextType.PLAIN_TEXT, 10, 12, -1, -1),
+            (TextType.BOLD_TEXT, 14, 15, -1, -1),
+            (TextType.PLAIN_TEXT, 17, 18, -1, -1),
+            (TextType.LINK, 19, 20, 22, 23),
+        ]
+        self.assertEqual(inline_spans(text, 10), expected)
+
+    # method to test unclosed formatted sections (should raise an ValueError)
+    def test_unclosed_sections(self):
+        for text in ["**bold", "_italic", "`code", "_a **b** c_", "`a_b_c`"]:
+            with self.assertRaises(ValueError):
+                parse_inline(text)
+
+    # method to test that parse_inline matches text_to_textnodes on hand-picked inputs
+    def test_matches_reference(self):
+        texts = [
+            "***",
+            "****",
+            "a***b**",
+            "![x](y)[a](b)",
+            "!![a](b)",
+            "![x[a](b)",
+            "**b**[l](u) and ![i](u*)",
+            "_i_ `c` **b** _j_",
+        ]
+        for text in texts:
+            self.assertEqual(parse_or_error(parse_inline, text), parse_or_error(text_to_textnodes, text), text)
+
+    # method to test that parse_inline matches text_to_textnodes on random markdown-like inputs
+    def test_matches_reference_random(self):
+        pieces = ["a", " ", "*", "**", "_", "`", "!", "[", "]", "(", ")", "![x](y)", "[l](u)", "[a](b_c)", "![i](u*)"]
+        rng = random.Random(0)
+        for _ in range(5000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(parse_or_error(parse_inline, text), parse_or_error(text_to_textnodes, text), text)
+
+# helper function to convert a string of markdown-formatted text into html one node at a time
+def text_to_html(text):
+    return "".join(text_node_to_html_node(node).to_html() for node in text_to_textnodes(text))
+
+# unit tests for the batch conversion functions
+class TestBatchConversion(unittest.TestCase):
+    # method to test that render_many renders every text type like text_node_to_html_node
+    def test_render_many(self):
+        nodes = [
+            TextNode("plain", TextType.PLAIN_TEXT),
+            TextNode("bold", TextType.BOLD_TEXT),
+            TextNode("italic", TextType.ITALIC_TEXT),
+            TextNode("code", TextType.CODE_TEXT),
+            TextNode("link", TextType.LINK, "https://boot.dev"),
+            TextNode("alt", TextType.IMAGE, "/logo.png"),
+            TextNode("{0} {1}", TextType.BOLD_TEXT),
+            TextNode("<a & 'b'>", TextType.PLAIN_TEXT),
+            TextNode("\"alt\" & <more>", TextType.IMAGE, "/i.png?a=1&b=2"),
+            TextNode("<link>", TextType.LINK, "/q?x=\"y\""),
+        ]
+        self.assertEqual(render_many(nodes), [text_node_to_html_node(node).to_html() for node in nodes])
+        self.assertEqual(render_many(iter([])), [])
+
+    # method to test that render_many renders text types registered with register_text_type through their factories
+    def test_render_many_registered_type(self):
+        ExtraTextType = Enum("ExtraTextType", {"STRIKETHROUGH": "strikethrough"})
+        register_text_type(ExtraTextType.STRIKETHROUGH, lambda text_node: LeafNode("s", text_node.text))
+        self.addCleanup(TEXT_NODE_FACTORIES.pop, ExtraTextType.STRIKETHROUGH)
+        nodes = [TextNode("a", TextType.PLAIN_TEXT), TextNode("b", ExtraTextType.STRIKETHROUGH)]
+        self.assertEqual(render_many(nodes), ["a", "<s>b</s>"])
+
+    # method to test that render_many raises the same errors as text_node_to_html_node
+    def test_render_many_errors(self):
+        for node in [TextNode("text", "bold"), TextNode(None, TextType.PLAIN_TEXT), TextNode(None, TextType.LINK, "/")]:
+            with self.assertRaises(ValueError):
+                text_node_to_html_node(node).to_html()
+            with self.assertRaises(ValueError):
+                render_many([node])
+
+    # method to test that texts_to_html_many matches converting each string one node at a time
+    def test_texts_to_html_many(self):
+        texts = ["", "just text", "**b** and _i_ and `c`", "![x](y)[a](b)", "a [link](/x) and ![img](/y.png) end"]
+        self.assertEqual(texts_to_html_many(texts), [text_to_html(text) for text in texts])
+        self.assertEqual(texts_to_html_many(text for text in texts), [text_to_html(text) for text in texts])
+
+    # method to test that texts_to_html_many matches converting each string one node at a time on random markdown-like inputs
+    def test_texts_to_html_many_random(self):
+        pieces = ["a", " ", "*", "**", "_", "`", "!", "[", "]", "(", ")", "![x](y)", "[l](u)", "{", "}", "<", ">", "&", "\"", "'"]
+        rng = random.Random(1)
+        for _ in range(2000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(parse_or_error(texts_to_html_many, [text]), parse_or_error(lambda text: [text_to_html(text)], text), text)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import os
+import tempfile
+import pstats
+import blocks
+import page
+import instrumentation
+from htmlnode import HTMLNode, LeafNode
+
+# unit tests for the per-stage instrumentation
+class TestInstrumentation(unittest.TestCase):
+    # method to reset the statistics before each test and make sure the instrumentation is disabled after it
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.disable)
+
+    # method to test that enabling replaces the stages everywhere they are referenced and disabling restores them
+    def test_enable_and_disable(self):
+        original_blocks = blocks.parse_blocks
+        original_to_html = HTMLNode.to_html
+
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(blocks.parse_blocks, original_blocks)
+        self.assertIs(page.parse_blocks, blocks.parse_blocks)
+        self.assertIsNot(HTMLNode.to_html, original_to_html)
+
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(blocks.parse_blocks, original_blocks)
+        self.assertIs(page.parse_blocks, original_blocks)
+        self.assertIs(HTMLNode.to_html, original_to_html)
+
+    # method to test that a conversion records calls, nodes and bytes for each stage
+    def test_records_stages(self):
+        markdown = "This is **bold** text\n\nA [link](https://www.boot.dev)"
+        with instrumentation.enabled() as stages:
+            html = page.markdown_to_html(markdown)
+
+        self.assertEqual(stages["parse_blocks"].calls, 1)
+        self.assertEqual(stages["parse_blocks"].nodes, 2)
+        self.assertEqual(stages["parse_inline"].calls, 2)
+        self.assertEqual(stages["parse_inline"].nodes, 5)
+        self.assertEqual(stages["text_node_to_html_node"].calls, 5)
+        self.assertEqual(stages["HTMLNode.to_html"].calls, 1)
+        self.assertEqual(stages["HTMLNode.to_html"].bytes, len(html))
+        self.assertGreater(stages["markdown_to_html_node"].seconds, 0)
+        self.assertIn("parse_inline", instrumentation.format_report())
+
+    # method to test that nothing is recorded while the instrumentation is disabled
+    def test_disabled_records_nothing(self):
+        LeafNode("b", "text").to_html()
+        self.assertEqual(instrumentation.format_report().count("\n"), 0)
+
+    # method to test that a stage calling itself is only timed once
+    def test_nested_calls_timed_once(self):
+        stats = instrumentation.StageStats()
+        instrumentation.STAGES["nested"] = stats
+
+        def countdown(n):
+            return [] if n == 0 else wrapped(n - 1)
+
+        wrapped = instrumentation.instrument("nested", countdown)
+        wrapped(3)
+        self.assertEqual(stats.calls, 4)
+        self.assertEqual(stats.depth, 0)
+        del instrumentation.STAGES["nested"]
+
+    # method to test writing a cProfile statistics file
+    def test_run_with_cprofile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.pstats")
+            html = instrumentation.run_with_cprofile(page.markdown_to_html, path, "**bold**")
+            self.assertEqual(html, "<div><p><b>bold</b></p></div>")
+            self.assertGreater(pstats.Stats(path).total_calls, 0)
+
+if __name__ == "__main__":
+    unittest.main()
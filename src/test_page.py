@@ -0,0 +1,102 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from page import markdown_to_html_node, markdown_to_html, markdown_to_html_parallel, split_markdown, BlockCache
+from blocks import parse_blocks
+
+# unit tests for the markdown page conversion functions
+class TestMarkdownToHTML(unittest.TestCase):
+    # method to test converting a document with several blocks into a div of paragraphs
+    def test_paragraphs(self):
+        markdown = "This is **bolded** paragraph\n\nThis is another paragraph with _italic_ text and `code` here\n\n"
+        expected = "<div><p>This is <b>bolded</b> paragraph</p><p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>"
+        self.assertEqual(markdown_to_html(markdown), expected)
+
+    # method to test that images and links are converted inside paragraphs
+    def test_images_and_links(self):
+        markdown = "An ![image](https://i.imgur.com/zjjcJKZ.png) and a [link](https://www.boot.dev)"
+        expected = '<div><p>An <img src="https://i.imgur.com/zjjcJKZ.png" alt="image"></img> and a <a href="https://www.boot.dev">link</a></p></div>'
+        self.assertEqual(markdown_to_html_node(markdown).to_html(), expected)
+
+    # method to test converting an empty document
+    def test_empty_document(self):
+        self.assertEqual(markdown_to_html(""), "<div></div>")
+
+# unit tests for rendering chunks of a document's blocks in parallel
+class TestParallelDocument(unittest.TestCase):
+    MARKDOWN = "# Title\n\nFirst **block**\n```\ncode\n\nwith blank lines\n```\n> quote\n- a\n- b\n\nLast _block_\n"
+
+    # method to test that a document is split into chunks of whole blocks
+    def test_split_markdown(self):
+        self.assertEqual(split_markdown(self.MARKDOWN, 1), ["# Title", "First **block**", "```\ncode\n\nwith blank lines\n```",
+                                                             "> quote", "- a\n- b", "Last _block_"])
+        self.assertEqual(split_markdown(self.MARKDOWN, 20), ["# Title\n\nFirst **block**", "```\ncode\n\nwith blank lines\n```",
+                                                              "> quote\n- a\n- b\n\nLast _block_"])
+        self.assertEqual(split_markdown(self.MARKDOWN, 1000), [self.MARKDOWN.strip()])
+        self.assertEqual(split_markdown(""), [])
+
+    # method to test that rendering the chunks in an executor gives the same html as rendering the whole document
+    def test_same_html(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for chunk_size in [1, 20, 1000]:
+                self.assertEqual(markdown_to_html_parallel(self.MARKDOWN, executor, chunk_size), markdown_to_html(self.MARKDOWN))
+            self.assertEqual(markdown_to_html_parallel("", executor), "<div></div>")
+            with self.assertRaises(ValueError):
+                markdown_to_html_parallel(self.MARKDOWN + "\n\n**not closed", executor, 1)
+
+# unit tests for the BlockCache class
+class TestBlockCache(unittest.TestCase):
+    MARKDOWN = "First **block**\n\nSecond _block_\n\nFirst **block**"
+
+    # method to test that rendering through the cache gives the same html as rendering the node tree
+    def test_same_html(self):
+        cache = BlockCache()
+        self.assertEqual(markdown_to_html(self.MARKDOWN, cache), markdown_to_html(self.MARKDOWN))
+        self.assertEqual(markdown_to_html("", cache), "<div></div>")
+
+    # method to test that repeated and unchanged blocks are served from the cache
+    def test_hits_and_misses(self):
+        cache = BlockCache()
+        markdown_to_html(self.MARKDOWN, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # editing one block only renders that block again
+        markdown_to_html(self.MARKDOWN.replace("Second", "Edited"), cache)
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+        self.assertEqual(cache.hit_rate(), 0.5)
+
+    # helper method to render a single-block document through a cache
+    def render(self, cache, text):
+        return cache.render(text, parse_blocks(text)[0])
+
+    # method to test that the least recently used fragments are evicted when the cache is full
+    def test_lru_eviction(self):
+        cache = BlockCache(max_size=2)
+        self.render(cache, "a")
+        self.render(cache, "b")
+        self.render(cache, "a")
+        self.render(cache, "c")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+
+        # "b" was least recently used, so it was evicted and renders again, while "a" is still cached
+        self.render(cache, "a")
+        self.assertEqual(cache.hits, 2)
+        self.render(cache, "b")
+        self.assertEqual(cache.misses, 4)
+
+    # method to test that invalid blocks raise an ValueError and are not cached
+    def test_invalid_block(self):
+        cache = BlockCache()
+        with self.assertRaises(ValueError):
+            markdown_to_html("**not closed", cache)
+        self.assertEqual(len(cache), 0)
+
+    # method to test clearing the cache
+    def test_clear(self):
+        cache = BlockCache()
+        markdown_to_html(self.MARKDOWN, cache)
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+if __name__ == "__main__":
+    unittest.main()
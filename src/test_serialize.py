@@ -0,0 +1,90 @@
+import unittest
+import pickle
+from textnode import TextNode, TextType
+from htmlnode import LeafNode, ParentNode, FrozenProps
+from page import markdown_to_html_node
+from serialize import dumps, loads, HEADER
+
+MARKDOWN = """This is **bold** and _italic_ text with `code`
+
+An ![image](https://i.imgur.com/zjjcJKZ.png) and a [link](https://www.boot.dev) with ünïcödé ✓ text"""
+
+# helper function to convert an html node tree into nested tuples, so trees can be compared
+def node_tuple(node):
+    children = None if node.children is None else [node_tuple(child) for child in node.children]
+    return (type(node), node.tag, node.value, node.props, children)
+
+# unit tests for the compact serialization of TextNode and html node trees
+class TestSerialize(unittest.TestCase):
+    # method to test that a list of TextNodes of every text type round-trips
+    def test_text_nodes(self):
+        nodes = [
+            TextNode("plain ✓", TextType.PLAIN_TEXT),
+            TextNode("bold", TextType.BOLD_TEXT),
+            TextNode("", TextType.ITALIC_TEXT),
+            TextNode("code", TextType.CODE_TEXT),
+            TextNode("link", TextType.LINK, "https://www.boot.dev"),
+            TextNode("image", TextType.IMAGE, ""),
+        ]
+        self.assertEqual(loads(dumps(nodes)), nodes)
+        self.assertEqual(loads(dumps([])), [])
+
+    # method to test that a single TextNode round-trips as a node, not a list
+    def test_single_text_node(self):
+        node = TextNode("bold", TextType.BOLD_TEXT)
+        self.assertEqual(loads(dumps(node)), node)
+
+    # method to test that an html tree round-trips with its tags, values, properties and nesting
+    def test_html_tree(self):
+        tree = ParentNode("div", [
+            ParentNode("p", [LeafNode(None, "text"), LeafNode("a", "link", {"href": "/", "title": None})], {"class": "intro"}),
+            ParentNode("ul", [ParentNode("li", [LeafNode("b", "")])]),
+            LeafNode("img", "", {"src": "/logo.png", "alt": "logo"}),
+        ])
+        decoded = loads(dumps(tree))
+        self.assertEqual(node_tuple(decoded), node_tuple(tree))
+        self.assertIsInstance(decoded.children[0].props, FrozenProps)
+        self.assertEqual(decoded.to_html(), tree.to_html())
+
+    # method to test that a tree converted from markdown renders the same html after a round-trip
+    def test_markdown_tree(self):
+        tree = markdown_to_html_node(MARKDOWN)
+        self.assertEqual(loads(dumps(tree)).to_html(), tree.to_html())
+
+    # method to test that deeply nested trees round-trip without hitting the recursion limit
+    def test_deep_tree(self):
+        tree = LeafNode("b", "deep")
+        for _ in range(5000):
+            tree = ParentNode("span", [tree])
+        decoded = loads(dumps(tree))
+        for _ in range(5000):
+            decoded = decoded.children[0]
+        self.assertEqual(decoded.to_html(), "<b>deep</b>")
+
+    # method to test that tags and property names are stored once, and the output is smaller than a pickle
+    def test_compact(self):
+        tree = ParentNode("div", [ParentNode("p", [LeafNode("a", "x", {"href": "/"})]) for _ in range(100)])
+        data = dumps(tree)
+        self.assertEqual(data.count(b"href"), 1)
+        self.assertLess(len(data), len(pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)) / 2)
+
+    # method to test that unsupported nodes and values are rejected
+    def test_invalid_nodes(self):
+        with self.assertRaises(ValueError):
+            dumps("not a node")
+        with self.assertRaises(ValueError):
+            dumps(TextNode("text", "bold"))
+        with self.assertRaises(ValueError):
+            dumps(LeafNode("p", 42))
+        with self.assertRaises(ValueError):
+            dumps(ParentNode("p", None))
+
+    # method to test that corrupt or truncated data is rejected
+    def test_invalid_data(self):
+        data = dumps(markdown_to_html_node(MARKDOWN))
+        for corrupt in (b"", b"nonsense", data[:-1], data + b"x", b"XXXX" + data[4:], data[:HEADER.size + 3]):
+            with self.assertRaises(ValueError):
+                loads(corrupt)
+
+if __name__ == "__main__":
+    unittest.main()
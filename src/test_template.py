@@ -0,0 +1,74 @@
+import unittest
+import io
+import os
+import tempfile
+from htmlnode import LeafNode, ParentNode
+from template import Template, load_template, clear_template_cache
+
+LAYOUT = "<html><head><title>{{ title }}</title></head><body>{{nav}}<main>{{ content }}</main><footer>{{ title }}</footer></body></html>"
+
+# unit tests for the Template class and the compiled template cache
+class TestTemplate(unittest.TestCase):
+    # method to test that a template is compiled into static segments and slots
+    def test_compile(self):
+        template = Template(LAYOUT)
+        self.assertEqual(template.parts, [
+            "<html><head><title>", None, "</title></head><body>", None, "<main>", None, "</main><footer>", None, "</footer></body></html>",
+        ])
+        self.assertEqual(template.slots, [(1, "title"), (3, "nav"), (5, "content"), (7, "title")])
+        self.assertEqual(template.names, ["title", "nav", "content"])
+
+    # method to test templates that start or end with a slot, have adjacent slots or have no slots
+    def test_compile_edges(self):
+        self.assertEqual(Template("{{ a }}{{ b }}").parts, [None, None])
+        self.assertEqual(Template("static only").parts, ["static only"])
+        self.assertEqual(Template("{ {not a slot}} {{ 1x }}").slots, [])
+
+    # method to test rendering with string and html node values, where values are not scanned for placeholders
+    def test_render(self):
+        template = Template(LAYOUT)
+        nav = ParentNode("nav", [LeafNode("a", "Home", {"href": "/"})])
+        html = template.render({"title": "{{ content }}", "nav": nav, "content": "<p>text</p>"})
+        self.assertEqual(html, (
+            '<html><head><title>{{ content }}</title></head><body><nav><a href="/">Home</a></nav>'
+            "<main><p>text</p></main><footer>{{ content }}</footer></body></html>"
+        ))
+
+    # method to test that writing to a sink produces the same html as rendering
+    def test_write(self):
+        template = Template(LAYOUT)
+        values = {"title": "Title", "nav": ParentNode("nav", [LeafNode("b", "x")]), "content": "<p>text</p>"}
+        sink = io.StringIO()
+        template.write(sink, values)
+        self.assertEqual(sink.getvalue(), template.render(values))
+
+    # method to test that a missing slot value raises an exception before anything is written
+    def test_missing_slot(self):
+        template = Template(LAYOUT)
+        with self.assertRaises(ValueError):
+            template.render({"title": "Title"})
+        sink = io.StringIO()
+        with self.assertRaises(ValueError):
+            template.write(sink, {"title": "Title", "nav": ""})
+        self.assertEqual(sink.getvalue(), "")
+
+    # method to test that a template file is compiled once and recompiled after it changes
+    def test_load_template(self):
+        clear_template_cache()
+        self.addCleanup(clear_template_cache)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "layout.html")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("<p>{{ content }}</p>")
+            template = load_template(path)
+            self.assertIs(load_template(path), template)
+
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("<div>{{ content }}</div>")
+            changed = load_template(path)
+            self.assertIsNot(changed, template)
+            self.assertNotEqual(changed.digest, template.digest)
+            self.assertEqual(changed.render({"content": "x"}), "<div>x</div>")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,25 @@
 import unittest
 import textwrap
+import io
+import os
+import mmap
+import tempfile
+from enum import Enum
+from htmlnode import LeafNode
 from textnode import (
     TextNode,
     TextType,
     text_node_to_html_node,
+    register_text_type,
+    TEXT_NODE_FACTORIES,
     split_nodes_delimiter,
     extract_markdown_images,
     extract_markdown_links,
     split_nodes_image,
     split_nodes_link,
     text_to_textnodes,
-    markdown_to_blocks
+    markdown_to_blocks,
+    iter_markdown_blocks
 )
 
 # unit tests for the TextNode class
@@ -44,6 +53,13 @@ class TestTextNode(unittest.TestCase):
         node = TextNode("This is a text node", TextType.PLAIN_TEXT, "https://www.boot.dev")
         self.assertEqual("TextNode(This is a text node, plain_text, https://www.boot.dev)", repr(node))
 
+    # method to test that TextNode objects store their attributes in slots rather than a per-instance dictionary
+    def test_slots(self):
+        node = TextNode("This is a text node", TextType.PLAIN_TEXT)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = "value"
+
     def test_text(self):
         node = TextNode("This is a text node", TextType.PLAIN_TEXT)
         html_node = text_node_to_html_node(node)
@@ -104,6 +120,30 @@ class TestTextNodeToHTMLNode(unittest.TestCase):
         node = TextNode("This is an invalid text type", "invalid_type")
         with self.assertRaises(ValueError):
             text_node_to_html_node(node)
+        with self.assertRaises(ValueError):
+            text_node_to_html_node(TextNode("unhashable", []))
+
+    # method to test that link and image nodes with the same url share their properties
+    def test_shared_props(self):
+        first = text_node_to_html_node(TextNode("one", TextType.LINK, "/shared"))
+        second = text_node_to_html_node(TextNode("two", TextType.LINK, "/shared"))
+        self.assertIs(first.props, second.props)
+        self.assertEqual(second.to_html(), '<a href="/shared">two</a>')
+        with self.assertRaises(TypeError):
+            first.props["href"] = "/changed"
+
+    # method to test that a new text type can be registered, but built-in text types cannot be replaced
+    def test_register_text_type(self):
+        ExtraTextType = Enum("ExtraTextType", {"STRIKETHROUGH": "strikethrough"})
+        register_text_type(ExtraTextType.STRIKETHROUGH, lambda text_node: LeafNode("s", text_node.text))
+        self.addCleanup(TEXT_NODE_FACTORIES.pop, ExtraTextType.STRIKETHROUGH)
+
+        node = TextNode("gone", ExtraTextType.STRIKETHROUGH)
+        self.assertEqual(text_node_to_html_node(node).to_html(), "<s>gone</s>")
+        with self.assertRaises(ValueError):
+            register_text_type(TextType.BOLD_TEXT, lambda text_node: LeafNode("strong", text_node.text))
+        with self.assertRaises(ValueError):
+            register_text_type("other", None)
 
 # unit tests for the split_nodes_delimiter function
 class TestSplitNodesDelimiter(unittest.TestCase):
@@ -325,6 +365,24 @@ class TestSplitNodesLink(unittest.TestCase):
         new_nodes = split_nodes_link([node])
         self.assertListEqual([node], new_nodes)
 
+    # method to test that a link is split at its own position, not at an identical image earlier in the text
+    def test_link_after_identical_image(self):
+        node = TextNode("![link](https://boot.dev) and [link](https://boot.dev)", TextType.PLAIN_TEXT)
+        new_nodes = split_nodes_link([node])
+        self.assertListEqual(
+            [
+                TextNode("![link](https://boot.dev) and ", TextType.PLAIN_TEXT),
+                TextNode("link", TextType.LINK, "https://boot.dev")
+            ],
+            new_nodes
+        )
+
+    # method to test splitting a TextNode with many repeated identical links
+    def test_repeated_links(self):
+        node = TextNode("[a](b) x " * 3, TextType.PLAIN_TEXT)
+        new_nodes = split_nodes_link([node])
+        self.assertListEqual([TextNode("a", TextType.LINK, "b"), TextNode(" x ", TextType.PLAIN_TEXT)] * 3, new_nodes)
+
 # unit tests for the text_to_textnodes function
 class TestTextToTextNodes(unittest.TestCase):
     # method to test conversion of plain text into a list of TextNode objects
@@ -512,5 +570,47 @@ class TestMarkdownToBlocks(unittest.TestCase):
                 ]
             )
 
+# unit tests for the iter_markdown_blocks function
+class TestIterMarkdownBlocks(unittest.TestCase):
+    MARKDOWN = "  This is **bolded** paragraph\n\n\n\nThis is another paragraph with caf\u00e9\nand a second line\n\n\n- a list\n- with items  \n\n   \n\n"
+
+    # method to test that streaming from a text file object yields the same blocks as markdown_to_blocks, for any chunk size
+    def test_text_file(self):
+        expected = markdown_to_blocks(self.MARKDOWN)
+        for chunk_size in [1, 2, 3, 7, 64]:
+            blocks = list(iter_markdown_blocks(io.StringIO(self.MARKDOWN), chunk_size))
+            self.assertEqual(blocks, expected)
+
+    # method to test that streaming from a binary file object decodes characters split across chunks
+    def test_binary_file(self):
+        expected = markdown_to_blocks(self.MARKDOWN)
+        for chunk_size in [1, 2, 3, 7, 64]:
+            blocks = list(iter_markdown_blocks(io.BytesIO(self.MARKDOWN.encode("utf-8")), chunk_size))
+            self.assertEqual(blocks, expected)
+
+    # method to test streaming from a path and from a memory-mapped file
+    def test_path_and_mmap(self):
+        expected = markdown_to_blocks(self.MARKDOWN)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "page.md")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(self.MARKDOWN)
+
+            self.assertEqual(list(iter_markdown_blocks(path, 5)), expected)
+
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(list(iter_markdown_blocks(mapped, 5)), expected)
+
+    # method to test that blocks are yielded before the whole source has been read
+    def test_lazy(self):
+        source = io.StringIO("first block\n\nsecond block")
+        blocks = iter_markdown_blocks(source, 16)
+        self.assertEqual(next(blocks), "first block")
+        self.assertLess(source.tell(), len("first block\n\nsecond block"))
+
+    # method to test an empty source
+    def test_empty(self):
+        self.assertEqual(list(iter_markdown_blocks(io.StringIO(""))), [])
+
 if __name__ == "__main__":
     unittest.main()
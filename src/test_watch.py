@@ -0,0 +1,239 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+from build import build_site
+from watch import ContentIndex, LiveReload, make_server, rebuild_pages, collect_changes, watch, LIVE_RELOAD_SCRIPT
+from test_build import write_file
+
+# helper function to move a path's modification time forward, so changes are seen even on file systems with coarse timestamps
+def touch_forward(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+# unit tests for the content index, the incremental rebuild and the preview server
+class TestWatch(unittest.TestCase):
+    # method to create a temporary content tree and build it
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.content = os.path.join(self.directory.name, "content")
+        self.output = os.path.join(self.directory.name, "public")
+        write_file(os.path.join(self.content, "index.md"), "Welcome to **the site**")
+        write_file(os.path.join(self.content, "blog", "a.md"), "First _post_")
+        write_file(os.path.join(self.content, "notes.txt"), "not a page")
+        build_site(self.content, self.output, workers=1)
+
+    # helper method to read a built page
+    def read_output(self, path):
+        with open(os.path.join(self.output, path), encoding="utf-8") as file:
+            return file.read()
+
+    # method to test that the index holds every page and reports nothing when nothing changed
+    def test_index_initial_scan(self):
+        index = ContentIndex(self.content)
+        self.assertEqual(sorted(index.pages), [os.path.join("blog", "a.md"), "index.md"])
+        self.assertEqual(index.poll(), ([], []))
+
+    # method to test that modified, added and removed pages are reported, including pages in new directories
+    def test_index_poll_changes(self):
+        index = ContentIndex(self.content)
+        write_file(os.path.join(self.content, "index.md"), "Welcome back")
+        touch_forward(os.path.join(self.content, "index.md"))
+        write_file(os.path.join(self.content, "blog", "b.md"), "Second post")
+        touch_forward(os.path.join(self.content, "blog"))
+        write_file(os.path.join(self.content, "docs", "guide.md"), "A guide")
+        touch_forward(self.content)
+        os.remove(os.path.join(self.content, "blog", "a.md"))
+
+        changed, removed = index.poll()
+        self.assertEqual(changed, [os.path.join("blog", "b.md"), os.path.join("docs", "guide.md"), "index.md"])
+        self.assertEqual(removed, [os.path.join("blog", "a.md")])
+        self.assertEqual(index.poll(), ([], []))
+
+    # method to test that only unchanged directories are not listed again
+    def test_index_skips_unchanged_directories(self):
+        index = ContentIndex(self.content)
+        listed = []
+        refresh = index._refresh_directory
+        index._refresh_directory = lambda directory, *args: listed.append(directory) or refresh(directory, *args)
+
+        write_file(os.path.join(self.content, "blog", "b.md"), "Second post")
+        touch_forward(os.path.join(self.content, "blog"))
+        index.poll()
+        self.assertEqual(listed, ["blog"])
+
+    # method to test that a page edited in place, which leaves its directory unchanged, is only found by a full sweep
+    def test_index_sweep(self):
+        index = ContentIndex(self.content)
+        write_file(os.path.join(self.content, "index.md"), "Welcome back")
+        touch_forward(os.path.join(self.content, "index.md"))
+        self.assertEqual(index.poll(), ([], []))
+
+        index.sweep_interval = 0
+        self.assertEqual(index.poll(), (["index.md"], []))
+        self.assertEqual(index.poll(), ([], []))
+
+    # method to test that the pages of a removed directory are reported without a full sweep
+    def test_index_removed_directory(self):
+        index = ContentIndex(self.content)
+        os.remove(os.path.join(self.content, "blog", "a.md"))
+        os.rmdir(os.path.join(self.content, "blog"))
+        self.assertEqual(index.poll(), ([], [os.path.join("blog", "a.md")]))
+        self.assertNotIn("blog", index.directories)
+
+    # method to test that a burst of changes is collected into a single set of changes
+    def test_collect_changes(self):
+        index = ContentIndex(self.content, 0)
+        write_file(os.path.join(self.content, "index.md"), "Welcome back")
+        touch_forward(os.path.join(self.content, "index.md"))
+        changed, removed = index.poll()
+        os.remove(os.path.join(self.content, "blog", "a.md"))
+
+        self.assertEqual(collect_changes(index, changed, removed, 0), (["index.md"], [os.path.join("blog", "a.md")]))
+
+    # method to test that only the changed pages are rebuilt and the outputs of removed pages are deleted
+    def test_rebuild_pages(self):
+        write_file(os.path.join(self.output, "blog", "a.html"), "stale")
+        write_file(os.path.join(self.content, "index.md"), "Welcome back")
+        os.remove(os.path.join(self.content, "blog", "a.md"))
+
+        report = rebuild_pages(self.content, self.output, ["index.md"], [os.path.join("blog", "a.md")])
+        self.assertTrue(report.ok())
+        self.assertEqual(report.pages, 1)
+        self.assertEqual(self.read_output("index.html"), "<div><p>Welcome back</p></div>")
+        self.assertFalse(os.path.exists(os.path.join(self.output, "blog", "a.html")))
+
+    # method to test that rebuilt and removed pages are recorded in the build cache and the output manifest
+    def test_rebuild_pages_records_cache_and_manifest(self):
+        cache_path = os.path.join(self.directory.name, "cache.json")
+        manifest_path = os.path.join(self.directory.name, "manifest.json")
+        build_site(self.content, self.output, workers=1, cache_path=cache_path, manifest_path=manifest_path)
+        write_file(os.path.join(self.content, "index.md"), "Welcome back")
+        touch_forward(os.path.join(self.content, "index.md"))
+        os.remove(os.path.join(self.content, "blog", "a.md"))
+
+        rebuild_pages(self.content, self.output, ["index.md"], [os.path.join("blog", "a.md")],
+                      cache_path=cache_path, manifest_path=manifest_path)
+        with open(manifest_path, encoding="utf-8") as file:
+            self.assertEqual(sorted(json.load(file)["outputs"]), ["index.html"])
+
+        # the next build finds every page unchanged
+        report = build_site(self.content, self.output, workers=1, cache_path=cache_path, manifest_path=manifest_path)
+        self.assertEqual((report.pages, report.skipped), (1, 1))
+
+    # method to test that a rebuild of an invalid page is reported as an error
+    def test_rebuild_pages_error(self):
+        write_file(os.path.join(self.content, "index.md"), "This is **not closed")
+        report = rebuild_pages(self.content, self.output, ["index.md"], [])
+        self.assertFalse(report.ok())
+        self.assertEqual(report.errors[0][0], "index.md")
+
+    # method to test that a rebuild with a template that cannot be loaded leaves the build cache on disk as it is
+    def test_rebuild_pages_broken_template_keeps_cache(self):
+        cache_path = os.path.join(self.directory.name, "cache.json")
+        template = os.path.join(self.directory.name, "layout.html")
+        write_file(template, "{{ content }}")
+        build_site(self.content, self.output, workers=1, cache_path=cache_path, template_path=template)
+        with open(cache_path, encoding="utf-8") as file:
+            saved = file.read()
+
+        os.remove(template)
+        report = rebuild_pages(self.content, self.output, ["index.md"], [], template, cache_path)
+        self.assertFalse(report.ok())
+        with open(cache_path, encoding="utf-8") as file:
+            self.assertEqual(file.read(), saved)
+
+    # method to test that waiting on the live reload version returns once it changes, or after the timeout
+    def test_live_reload(self):
+        live_reload = LiveReload()
+        self.assertEqual(live_reload.wait(None, 0), 0)
+        self.assertEqual(live_reload.wait(0, 0.01), 0)
+        threading.Timer(0.01, live_reload.bump).start()
+        self.assertEqual(live_reload.wait(0, 5), 1)
+
+    # method to test that the preview server injects the live reload script into pages and serves other files as they are
+    def test_server(self):
+        write_file(os.path.join(self.output, "style.css"), "p {}")
+        write_file(os.path.join(self.output, "layout.html"), "<html><body><p>page</p></body></html>")
+        live_reload = LiveReload()
+        server = make_server(self.output, live_reload, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        with urllib.request.urlopen(url + "/index.html") as response:
+            self.assertEqual(response.read().decode("utf-8"), self.read_output("index.html") + LIVE_RELOAD_SCRIPT)
+        with urllib.request.urlopen(url + "/layout.html") as response:
+            self.assertEqual(response.read().decode("utf-8"), "<html><body><p>page</p>" + LIVE_RELOAD_SCRIPT + "</body></html>")
+        with urllib.request.urlopen(url + "/style.css") as response:
+            self.assertEqual(response.read(), b"p {}")
+
+        live_reload.bump()
+        with urllib.request.urlopen(url + "/__livereload?version=0") as response:
+            self.assertEqual(response.read(), b"1")
+
+    # helper method to watch the content in a background thread until the test ends, returning the list of logged messages
+    # once the initial build is logged
+    def start_watch(self, **kwargs):
+        stop = threading.Event()
+        messages = []
+        thread = threading.Thread(target=watch, args=(self.content, self.output),
+                                  kwargs={"port": 0, "stop": stop, "log": messages.append, **kwargs})
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(stop.set)
+        self.wait_for_messages(messages, 2)
+        return messages
+
+    # helper method to wait until a number of messages are logged, failing after a timeout
+    def wait_for_messages(self, messages, count, timeout=5):
+        deadline = time.monotonic() + timeout
+        while len(messages) < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertGreaterEqual(len(messages), count, "no rebuild within the timeout")
+
+    # method to test that watching rebuilds a page after it is saved and bumps the live reload version
+    def test_watch(self):
+        messages = self.start_watch(interval=0.01, debounce=0.01)
+        write_file(os.path.join(self.content, "index.md"), "Edited _page_")
+        touch_forward(os.path.join(self.content, "index.md"))
+
+        self.wait_for_messages(messages, 3)
+        self.assertTrue(messages[2].startswith("built 1 of 1 pages"))
+        self.assertEqual(self.read_output("index.html"), "<div><p>Edited <i>page</i></p></div>")
+
+    # method to test that with the default settings, a page edited in place (leaving its directory unchanged) is rebuilt
+    # in about 100 ms
+    def test_watch_in_place_edit_latency(self):
+        messages = self.start_watch()
+        # let the first sweep after the initial build pass, so the edit is not found by it by chance
+        time.sleep(0.1)
+        with open(os.path.join(self.content, "index.md"), "r+", encoding="utf-8") as file:
+            file.write("Edited!")
+        touch_forward(os.path.join(self.content, "index.md"))
+        start = time.monotonic()
+
+        self.wait_for_messages(messages, 3)
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertEqual(self.read_output("index.html"), "<div><p>Edited! to <b>the site</b></p></div>")
+
+    # method to test that a page removed together with a template change has its output deleted by the full rebuild
+    def test_watch_template_change_with_removal(self):
+        template = os.path.join(self.directory.name, "layout.html")
+        write_file(template, "<main>{{ content }}</main>")
+        messages = self.start_watch(interval=0.01, debounce=0.01, template_path=template)
+        os.remove(os.path.join(self.content, "blog", "a.md"))
+        write_file(template, "<article>{{ content }}</article>")
+        touch_forward(template)
+
+        self.wait_for_messages(messages, 3)
+        self.assertFalse(os.path.exists(os.path.join(self.output, "blog", "a.html")))
+        self.assertEqual(self.read_output("index.html"), "<article><div><p>Welcome to <b>the site</b></p></div></article>")
+
+if __name__ == "__main__":
+    unittest.main()
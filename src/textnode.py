@@ -1,7 +1,13 @@
 from enum import Enum
-from htmlnode import LeafNode
+from functools import lru_cache
+from htmlnode import LeafNode, FrozenProps, PROPS_CACHE_SIZE
+import codecs
+import os
 import re
 
+# number of characters or bytes read at a time when streaming markdown blocks
+BLOCK_CHUNK_SIZE = 65536
+
 # enum representing different types of text formatting
 class TextType(Enum):
     PLAIN_TEXT = "plain_text"
@@ -13,6 +19,9 @@ class TextType(Enum):
 
 # class representing a node of text
 class TextNode:
+    # fixed attribute slots, so each TextNode object carries no per-instance __dict__
+    __slots__ = ("text", "text_type", "url")
+
     # constructor to initialize a TextNode object with text, a text type, and an optional url
     def __init__(self, text, text_type, url=None):
         self.text = text
@@ -30,24 +39,49 @@ class TextNode:
     def __repr__(self):
         return f"TextNode({self.text}, {self.text_type.value}, {self.url})"
     
+# function to create a LeafNode object with the given tag, value and FrozenProps object (or None), skipping its constructors
+def new_leaf_node(tag, value, props):
+    node = object.__new__(LeafNode)
+    node.tag = tag
+    node.value = value
+    node.children = None
+    node.props = props
+    return node
+
+# cached functions returning the properties of link and image nodes, so nodes with the same url (and alt text) share one
+# immutable FrozenProps object instead of each creating their own
+link_props = lru_cache(maxsize=PROPS_CACHE_SIZE)(lambda url: FrozenProps({"href": url}))
+image_props = lru_cache(maxsize=PROPS_CACHE_SIZE)(lambda url, alt: FrozenProps({"src": url, "alt": alt}))
+
+# factories creating the LeafNode object of each text type, looked up by text type instead of comparing it against each type in turn
+TEXT_NODE_FACTORIES = {
+    TextType.PLAIN_TEXT: lambda text_node: new_leaf_node(None, text_node.text, None),
+    TextType.BOLD_TEXT: lambda text_node: new_leaf_node("b", text_node.text, None),
+    TextType.ITALIC_TEXT: lambda text_node: new_leaf_node("i", text_node.text, None),
+    TextType.CODE_TEXT: lambda text_node: new_leaf_node("code", text_node.text, None),
+    TextType.LINK: lambda text_node: new_leaf_node("a", text_node.text, link_props(text_node.url)),
+    TextType.IMAGE: lambda text_node: new_leaf_node("img", "", image_props(text_node.url, text_node.text)),
+}
+
+# function to register a text type with a factory that converts a TextNode object of that type into an html node
+# (the text type can be any hashable value, such as a member of another Enum, other than the built-in TextType members)
+def register_text_type(text_type, factory):
+    if isinstance(text_type, TextType):
+        raise ValueError(f"invalid text type, built-in types cannot be replaced: {text_type}")
+    if not callable(factory):
+        raise ValueError(f"invalid text node factory: {factory!r}")
+    TEXT_NODE_FACTORIES[text_type] = factory
+
 # function to convert a TextNode object into a corresponding LeafNode object
 def text_node_to_html_node(text_node):
-    # check the text type and create the appropriate LeafNode
-    if text_node.text_type == TextType.PLAIN_TEXT:
-        return LeafNode(None, text_node.text)
-    elif text_node.text_type == TextType.BOLD_TEXT:
-        return LeafNode("b", text_node.text)
-    elif text_node.text_type == TextType.ITALIC_TEXT:
-        return LeafNode("i", text_node.text)
-    elif text_node.text_type == TextType.CODE_TEXT:
-        return LeafNode("code", text_node.text)
-    elif text_node.text_type == TextType.LINK:
-        return LeafNode("a", text_node.text, {"href": text_node.url})
-    elif text_node.text_type == TextType.IMAGE:
-        return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-    # otherwise, raise an exception for invalid text types
-    else:
-        raise ValueError(f"invalid text type: {text_node.text_type}")
+    # look up the factory of the text type, raising an exception for invalid text types
+    try:
+        factory = TEXT_NODE_FACTORIES[text_node.text_type]
+    except (KeyError, TypeError):
+        raise ValueError(f"invalid text type: {text_node.text_type}") from None
+
+    # create the node with the factory
+    return factory(text_node)
 
 # function to split a TextNode object by a delimiter and wrap its parts in the specified text type
 def split_nodes_delimiter(old_nodes, delimiter, text_type):
@@ -90,30 +124,24 @@ def split_nodes_delimiter(old_nodes, delimiter, text_type):
     # return the final list of new nodes
     return new_nodes
 
-# function to extract markdown image syntax from a string
-def extract_markdown_images(text):
-    # regex pattern to match markdown image syntax: ![alt text](url)
-    pattern = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
+# regex pattern to match markdown image syntax: ![alt text](url)
+IMAGE_PATTERN = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
 
-    # find all matches of the pattern in the text
-    matches = re.findall(pattern, text)
+# regex pattern to match markdown link syntax: [link text](url)
+LINK_PATTERN = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
 
+# function to extract markdown image syntax from a string
+def extract_markdown_images(text):
     # return a list of (alt_text, url) tuples for each match
-    return matches
+    return IMAGE_PATTERN.findall(text)
 
 # function to extract markdown link syntax from a string
 def extract_markdown_links(text):
-    # regex pattern to match markdown link syntax: [link text](url)
-    pattern = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
-
-    # find all matches of the pattern in the text
-    matches = re.findall(pattern, text)
-
     # return a list of (link_text, url) tuples for each match
-    return matches
+    return LINK_PATTERN.findall(text)
 
-# function to split TextNode objects containing markdown images into separate TextNode objects
-def split_nodes_image(old_nodes):
+# function to split plain text TextNode objects at each match of a pattern, creating a node of the given text type for each match
+def split_nodes_pattern(old_nodes, pattern, text_type):
     # initialize an empty list to hold the new nodes
     new_nodes = []
 
@@ -124,88 +152,42 @@ def split_nodes_image(old_nodes):
             new_nodes.append(node)
             continue
 
-        # get the original text and extract markdown images
+        # get the original text and the offset where the unprocessed text starts
         original_text = node.text
-        images = extract_markdown_images(original_text)
+        start = 0
 
-        # if no images were found, add the original node to the new nodes list and continue
-        if len(images) == 0:
-            new_nodes.append(node)
-            continue
-        
-        # for each image in the images list
-        for image in images:
-            # split the original text at the first occurrence of the current image markdown syntax
-            sections = original_text.split(f"![{image[0]}]({image[1]})", 1)
-
-            # if the number of sections is not 2, raise an exception with a message
-            if len(sections) != 2:
-                raise ValueError("invalid markdown, image section not closed")
-            
-            # if the first section is not empty, create a plain text TextNode and add it to the new nodes list
-            if sections[0] != "":
-                new_nodes.append(TextNode(sections[0], TextType.PLAIN_TEXT))
-            
-            # create an image TextNode and add it to the new nodes list
-            new_nodes.append(TextNode(image[0], TextType.IMAGE, image[1]))
-
-            # update the original text to the second section for further processing
-            original_text = sections[1]
-
-        # if there is any remaining text after processing all images, create a plain text TextNode and add it to the new nodes list
-        if original_text != "":
-            new_nodes.append(TextNode(original_text, TextType.PLAIN_TEXT))
+        # for each match of the pattern in the original text
+        for match in pattern.finditer(original_text):
+            # if there is text between the previous match and this one, create a plain text TextNode
+            if match.start() > start:
+                new_nodes.append(TextNode(original_text[start:match.start()], TextType.PLAIN_TEXT))
 
-    # return the final list of new nodes
-    return new_nodes
+            # create a TextNode from the matched text and url
+            new_nodes.append(TextNode(match.group(1), text_type, match.group(2)))
 
-# function to split TextNode objects containing markdown links into separate TextNode objects
-def split_nodes_link(old_nodes):
-    # initialize an empty list to hold the new nodes
-    new_nodes = []
+            # continue after the end of the match
+            start = match.end()
 
-    # for each node in the old nodes list
-    for node in old_nodes:
-        # if the node is not plain text, add it to the new nodes list and continue
-        if node.text_type != TextType.PLAIN_TEXT:
-            new_nodes.append(node)
-            continue
-
-        # get the original text and extract markdown links
-        original_text = node.text
-        links = extract_markdown_links(original_text)
-
-        # if no links were found, add the original node to the new nodes list and continue
-        if len(links) == 0:
+        # if no matches were found, add the original node to the new nodes list and continue
+        if start == 0:
             new_nodes.append(node)
             continue
 
-        # for each link in the links list
-        for link in links:
-            # split the original text at the first occurrence of the current link markdown syntax
-            sections = original_text.split(f"[{link[0]}]({link[1]})", 1)
-            
-            # if the number of sections is not 2, raise an exception with a message
-            if len(sections) != 2:
-                raise ValueError("invalid markdown, link section not closed")
-            
-            # if the first section is not empty, create a plain text TextNode and add it to the new nodes list
-            if sections[0] != "":
-                new_nodes.append(TextNode(sections[0], TextType.PLAIN_TEXT))
-            
-            # create a link TextNode and add it to the new nodes list
-            new_nodes.append(TextNode(link[0], TextType.LINK, link[1]))
-
-            # update the original text to the second section for further processing
-            original_text = sections[1]
-
-        # if there is any remaining text after processing all links, create a plain text TextNode and add it to the new nodes list
-        if original_text != "":
-            new_nodes.append(TextNode(original_text, TextType.PLAIN_TEXT))
+        # if there is any remaining text after the last match, create a plain text TextNode
+        if start < len(original_text):
+            new_nodes.append(TextNode(original_text[start:], TextType.PLAIN_TEXT))
 
     # return the final list of new nodes
     return new_nodes
 
+# function to split TextNode objects containing markdown images into separate TextNode objects
+def split_nodes_image(old_nodes):
+    return split_nodes_pattern(old_nodes, IMAGE_PATTERN, TextType.IMAGE)
+
+# function to split TextNode objects containing markdown links into separate TextNode objects
+def split_nodes_link(old_nodes):
+    return split_nodes_pattern(old_nodes, LINK_PATTERN, TextType.LINK)
+
 # function to convert a string of markdown-formatted text into a list of TextNode objects with appropriate formatting
 def text_to_textnodes(text):
     # start with a single plain text TextNode
@@ -245,3 +227,62 @@ def markdown_to_blocks(markdown):
 
     # return the final list of block strings
     return blocks
+
+# function to strip a block string and yield it if it is not empty
+def _strip_block(block):
+    block = block.strip()
+    if block != "":
+        yield block
+
+# function to lazily yield the block strings of a markdown document read from a path, a file object or an mmap
+# (yields the same blocks as markdown_to_blocks on the whole document, while holding only the current block in memory)
+def iter_markdown_blocks(source, chunk_size=BLOCK_CHUNK_SIZE):
+    # if the source is a path, open it and stream its contents
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as file:
+            yield from iter_markdown_blocks(file, chunk_size)
+        return
+
+    # decode binary sources such as files opened in binary mode and mmap objects incrementally as utf-8
+    decoder = None
+
+    # initialize a list holding the parts of the current unfinished block
+    parts = []
+
+    while True:
+        # read the next chunk, decoding it if the source is binary
+        data = source.read(chunk_size)
+        chunk = data
+        if not isinstance(data, str):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = decoder.decode(data, final=not data)
+
+        # if the source is exhausted, yield the last block and stop
+        if not data:
+            if parts:
+                yield from _strip_block("".join(parts))
+            return
+
+        # if the chunk ended inside a multi-byte character, nothing was decoded yet
+        if not chunk:
+            continue
+
+        # a blank line can straddle two chunks: the unfinished block ends with a single newline and the chunk starts with one
+        # (the unfinished block never ends with two newlines, since those would already have been split)
+        if parts and parts[-1].endswith("\n") and chunk.startswith("\n"):
+            yield from _strip_block("".join(parts)[:-1])
+            parts = []
+            chunk = chunk[1:]
+
+        # split the chunk into sections; the first continues the unfinished block and the last starts a new one
+        sections = chunk.split("\n\n")
+        if len(sections) == 1:
+            parts.append(chunk)
+            continue
+
+        parts.append(sections[0])
+        yield from _strip_block("".join(parts))
+        for section in sections[1:-1]:
+            yield from _strip_block(section)
+        parts = [sections[-1]]
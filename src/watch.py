@@ -0,0 +1,349 @@
+import os
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from build import build_site, build_page, output_path, BuildReport
+from cache import BuildCache, OutputManifest, site_version
+from template import load_template
+
+# seconds between polls of the content directory
+DEFAULT_INTERVAL = 0.025
+
+# seconds between full sweeps of the content directory, which stat every page to catch pages edited in place
+# (short enough that an in-place save is still rebuilt within about 100 ms; a sweep of 2000 pages takes about 10 ms)
+DEFAULT_SWEEP_INTERVAL = 0.05
+
+# seconds without further changes to wait for before rebuilding, so a burst of saves triggers a single rebuild
+DEFAULT_DEBOUNCE = 0.02
+
+# seconds a live reload request waits for a rebuild before answering with the current version
+LIVE_RELOAD_TIMEOUT = 25
+
+# path of the live reload endpoint, and the script injected into served html pages that reloads them after a rebuild
+LIVE_RELOAD_PATH = "/__livereload"
+LIVE_RELOAD_SCRIPT = """<script>
+(function poll(version) {
+  fetch("/__livereload?version=" + version).then(function (response) { return response.text(); }).then(function (latest) {
+    if (version !== "" && latest !== version) { location.reload(); } else { poll(latest); }
+  }).catch(function () { setTimeout(function () { poll(version); }, 1000); });
+})("");
+</script>"""
+
+# class representing an in-memory index of the markdown pages under a content directory, with their modification times and sizes
+# (each poll stats only the directories, and lists the ones whose own modification time changed, which catches pages that are
+# added, removed or saved by renaming a new file over them; pages edited in place leave their directory unchanged, so every
+# page is also stat-ed in a full sweep at most once per sweep interval)
+class ContentIndex:
+    # constructor to initialize a ContentIndex object by scanning the whole content directory once
+    def __init__(self, content_dir, sweep_interval=DEFAULT_SWEEP_INTERVAL):
+        self.content_dir = content_dir
+        self.sweep_interval = sweep_interval
+        # (modification time, size) of each page, by relative page path
+        self.pages = {}
+        # modification time of each directory, by relative directory path
+        self.directories = {}
+        self._scan_directory(".", self.pages, self.directories)
+        # monotonic time of the last full sweep
+        self.swept = time.monotonic()
+
+    # method to list a directory, recording its pages and recursively scanning its new subdirectories
+    def _scan_directory(self, directory, pages, directories):
+        path = os.path.normpath(os.path.join(self.content_dir, directory))
+        try:
+            directories[directory] = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError:
+            directories.pop(directory, None)
+            return
+
+        for entry in entries:
+            relative = os.path.normpath(os.path.join(directory, entry.name))
+            if entry.is_dir():
+                if relative not in directories:
+                    self._scan_directory(relative, pages, directories)
+            elif entry.name.endswith(".md") and relative not in pages:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                pages[relative] = (stat.st_mtime_ns, stat.st_size)
+
+    # method to list a directory whose modification time changed, comparing its pages with the index and scanning its new
+    # subdirectories, and appending the changed or added pages and the removed pages to the given lists
+    # (a directory that no longer exists has all of its indexed pages removed)
+    def _refresh_directory(self, directory, changed, removed):
+        path = os.path.normpath(os.path.join(self.content_dir, directory))
+        seen = set()
+        try:
+            self.directories[directory] = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError:
+            self.directories.pop(directory, None)
+            entries = []
+
+        for entry in entries:
+            relative = os.path.normpath(os.path.join(directory, entry.name))
+            if entry.is_dir():
+                if relative not in self.directories:
+                    added = {}
+                    self._scan_directory(relative, added, self.directories)
+                    for page_path, stat in added.items():
+                        if self.pages.get(page_path) != stat:
+                            self.pages[page_path] = stat
+                            changed.append(page_path)
+            elif entry.name.endswith(".md"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                seen.add(relative)
+                current = (stat.st_mtime_ns, stat.st_size)
+                if self.pages.get(relative) != current:
+                    self.pages[relative] = current
+                    changed.append(relative)
+
+        # remove the indexed pages of this directory that are gone
+        for page_path in [page_path for page_path in self.pages if (os.path.dirname(page_path) or ".") == directory]:
+            if page_path not in seen:
+                del self.pages[page_path]
+                removed.append(page_path)
+
+    # method to check for changes since the last poll, returning (changed or added pages, removed pages) in sorted order
+    def poll(self):
+        changed = []
+        removed = []
+
+        # once per sweep interval, stat every indexed page, comparing it with the index
+        now = time.monotonic()
+        if now - self.swept >= self.sweep_interval:
+            self.swept = now
+            for page_path, previous in list(self.pages.items()):
+                try:
+                    stat = os.stat(os.path.join(self.content_dir, page_path))
+                except OSError:
+                    del self.pages[page_path]
+                    removed.append(page_path)
+                    continue
+                current = (stat.st_mtime_ns, stat.st_size)
+                if current != previous:
+                    self.pages[page_path] = current
+                    changed.append(page_path)
+
+        # list the directories whose modification time changed, since only they can have new, removed or replaced entries
+        for directory, previous in list(self.directories.items()):
+            try:
+                current = os.stat(os.path.join(self.content_dir, directory)).st_mtime_ns
+            except OSError:
+                current = None
+            if current != previous:
+                self._refresh_directory(directory, changed, removed)
+
+        return sorted(changed), sorted(removed)
+
+# class representing the version of the built site, which live reload clients wait on
+class LiveReload:
+    # constructor to initialize a LiveReload object at version 0
+    def __init__(self):
+        self.version = 0
+        self.condition = threading.Condition()
+
+    # method to announce a rebuild, waking every waiting client
+    def bump(self):
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    # method to wait until the version differs from the given one or the timeout expires, returning the current version
+    def wait(self, version, timeout=LIVE_RELOAD_TIMEOUT):
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+# class handling preview requests: static files from the output directory, html pages with the live reload script, and the live reload endpoint
+class PreviewHandler(SimpleHTTPRequestHandler):
+    # constructor to initialize a PreviewHandler object serving a directory, with the site's LiveReload object
+    def __init__(self, *args, live_reload, directory, **kwargs):
+        self.live_reload = live_reload
+        super().__init__(*args, directory=directory, **kwargs)
+
+    # method to handle a GET request
+    def do_GET(self):
+        url = urlsplit(self.path)
+
+        # answer live reload requests once the site version differs from the client's
+        if url.path == LIVE_RELOAD_PATH:
+            version = parse_qs(url.query).get("version", [""])[0]
+            current = self.live_reload.wait(int(version) if version.isdigit() else None, LIVE_RELOAD_TIMEOUT)
+            self.send_bytes(str(current).encode("utf-8"), "text/plain")
+            return
+
+        # serve html pages with the live reload script inserted before the end of the body, or appended if there is none
+        path = self.translate_path(url.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        if path.endswith(".html") and os.path.isfile(path):
+            with open(path, "rb") as file:
+                page = file.read()
+            end = page.rfind(b"</body>")
+            if end == -1:
+                end = len(page)
+            self.send_bytes(page[:end] + LIVE_RELOAD_SCRIPT.encode("utf-8") + page[end:], "text/html; charset=utf-8")
+            return
+
+        # serve any other file as usual
+        super().do_GET()
+
+    # method to send a complete response with a body
+    def send_bytes(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    # method to silence the per-request log lines
+    def log_message(self, format, *args):
+        pass
+
+# function to create a preview server for an output directory, listening on a host and port (port 0 picks a free port)
+def make_server(output_dir, live_reload, host="127.0.0.1", port=8000):
+    handler = partial(PreviewHandler, live_reload=live_reload, directory=os.path.abspath(output_dir))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+# function to rebuild the changed pages and delete the outputs of the removed pages, returning a BuildReport
+# (with a cache path and a manifest path, the rebuilt and removed pages are recorded in the build cache and the output manifest
+# like build_site does, so the next build skips the pages rebuilt here)
+def rebuild_pages(content_dir, output_dir, changed, removed, template_path=None, cache_path=None, manifest_path=None):
+    start = time.perf_counter()
+    errors = []
+
+    # load the cache for the current template, which starts empty if the template changed since it was saved
+    cache = None
+    if cache_path is not None:
+        # (a template that cannot be loaded leaves the cache as it is, since its version is unknown and every page fails anyway)
+        try:
+            template_digest = None if template_path is None else load_template(template_path).digest
+            cache = BuildCache(cache_path, site_version(template_digest)).load()
+        except (OSError, ValueError):
+            cache = None
+
+    # load the manifest, and pick the entries of the changed pages
+    manifest = None
+    outputs = {}
+    if manifest_path is not None:
+        manifest = OutputManifest(manifest_path).load()
+        for page_path in changed:
+            entry = manifest.get(output_path(page_path))
+            if entry is not None:
+                outputs[output_path(page_path)] = entry
+
+    # rebuild each changed page in this process, reusing its cached blocks, and record it in the cache and the manifest
+    written = identical = 0
+    for page_path in changed:
+        # stat the source before it is read, so a save during the rebuild is seen as a change next time
+        try:
+            stat = os.stat(os.path.join(content_dir, page_path))
+        except OSError:
+            stat = None
+        message, info = build_page(content_dir, output_dir, page_path, template_path, outputs)
+        if message is not None:
+            errors.append((page_path, message))
+            if cache is not None:
+                cache.forget(page_path)
+            continue
+
+        source_digest, output_digest, size, mtime_ns, was_written = info
+        if was_written:
+            written += 1
+        else:
+            identical += 1
+        if cache is not None and stat is not None:
+            cache.record(page_path, stat, source_digest)
+        if manifest is not None:
+            manifest.record(output_path(page_path), output_digest, size, mtime_ns)
+
+    # delete the output of each removed page, and forget it
+    for page_path in removed:
+        try:
+            os.remove(os.path.join(output_dir, output_path(page_path)))
+        except FileNotFoundError:
+            pass
+        if cache is not None:
+            cache.forget(page_path)
+        if manifest is not None:
+            manifest.forget(output_path(page_path))
+
+    if manifest is not None:
+        manifest.save()
+    if cache is not None:
+        cache.save()
+
+    return BuildReport(len(changed), errors, time.perf_counter() - start, written=written, identical=identical)
+
+# function to wait until a burst of changes is over, polling the index until a poll finds nothing new,
+# returning all (changed pages, removed pages) seen during the burst
+def collect_changes(index, changed, removed, debounce):
+    changed = set(changed)
+    removed = set(removed)
+    while True:
+        time.sleep(debounce)
+        more_changed, more_removed = index.poll()
+        if not more_changed and not more_removed:
+            return sorted(changed - removed), sorted(removed)
+        changed.update(more_changed)
+        removed.difference_update(more_changed)
+        removed.update(more_removed)
+
+# function to return the (modification time, size) of a template file, or None if there is no template or it is missing
+def template_signature(template_path):
+    if template_path is None:
+        return None
+    try:
+        stat = os.stat(template_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+# function to build a site, serve it with live reload and rebuild the affected pages whenever the content changes
+# (or every page when the template changes), until the stop event is set (or forever)
+def watch(content_dir, output_dir, host="127.0.0.1", port=8000, interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE,
+          cache_path=None, stop=None, log=print, template_path=None, sweep_interval=DEFAULT_SWEEP_INTERVAL, manifest_path=None):
+    stop = stop or threading.Event()
+
+    # build the whole site once, and index the content directory
+    report = build_site(content_dir, output_dir, cache_path=cache_path, template_path=template_path, manifest_path=manifest_path)
+    log(report.format())
+    index = ContentIndex(content_dir, sweep_interval)
+    template = template_signature(template_path)
+
+    # serve the output directory in a background thread
+    live_reload = LiveReload()
+    server = make_server(output_dir, live_reload, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    log(f"serving {output_dir} at http://{server.server_address[0]}:{server.server_address[1]}/")
+
+    try:
+        # poll for changes, rebuild the affected pages once each burst is over, and tell the browsers to reload
+        while not stop.wait(interval):
+            changed, removed = index.poll()
+            signature = template_signature(template_path)
+            if signature != template:
+                # rebuild every page once the template is saved, still deleting the outputs of the pages just removed
+                template = signature
+                time.sleep(debounce)
+                changed = sorted(index.pages)
+            elif not changed and not removed:
+                continue
+            else:
+                changed, removed = collect_changes(index, changed, removed, debounce)
+            report = rebuild_pages(content_dir, output_dir, changed, removed, template_path, cache_path, manifest_path)
+            log(report.format() + (f", removed {len(removed)}" if removed else ""))
+            live_reload.bump()
+    finally:
+        server.shutdown()
+        server.server_close()